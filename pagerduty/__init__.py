@@ -1,62 +1,199 @@
+# Core
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Local
 from .version import __version__
 
-from .common import (
-    TEXT_LEN_LIMIT,
-    TIMEOUT,
-    deprecated_kwarg,
-    http_error_message,
-    last_4,
-    normalize_url,
-    plural_name,
-    requires_success,
-    singular_name,
-    successful_response,
-    truncate_text,
-    try_decoding,
-)
-
-from .api_client import ApiClient
-
-from .auth_method import PassThruHeaderAuthMethod
-
-from .errors import Error, HttpError, ServerHttpError, UrlError
-
-from .events_api_v2_client import EventsApiV2Client, RoutingKeyAuthMethod
-
-from .jira_cloud_integration_api_client import JiraCloudIntegrationApiClient
-from .jira_server_integration_api_client import JiraServerIntegrationApiClient
-from .mcp_api_client import McpApiClient
-from .ms_teams_integration_api_client import MsTeamsIntegrationApiClient
-from .oauth_token_client import OAuthTokenClient
-
-from .rest_api_v2_base_client import (
-    ITERATION_LIMIT,
-    OAuthTokenAuthMethod,
-    RestApiV2BaseClient,
-    TokenAuthMethod,
-    auto_json,
-    endpoint_matches,
-    infer_entity_wrapper,
-    is_path_param,
-    resource_url,
-    unwrap,
-    wrapped_entities,
-)
-
-from .rest_api_v2_client import (
-    CANONICAL_PATHS,
-    CURSOR_BASED_PAGINATION_PATHS,
-    ENTITY_WRAPPER_CONFIG,
-    RestApiV2Client,
-    canonical_path,
-    entity_wrappers,
-)
-
-from .scim_api_client import ScimApiClient
-from .slack_integration_api_client import SlackIntegrationApiClient
-from .slack_integration_connections_api_client import (
-    SlackIntegrationConnectionsApiClient,
-)
+# The names exported by this package are imported from their submodules upon
+# first access (see PEP 562) rather than all at once, so that importing the
+# package is fast, i.e. in short-lived processes that use only one client.
+_LAZY_IMPORTS = {
+    "common": (
+        "TEXT_LEN_LIMIT",
+        "TIMEOUT",
+        "deprecated_kwarg",
+        "http_error_message",
+        "last_4",
+        "normalize_url",
+        "plural_name",
+        "requires_success",
+        "singular_name",
+        "successful_response",
+        "truncate_text",
+        "try_decoding",
+    ),
+    "api_client": (
+        "ApiClient",
+        "AsyncApiClient",
+    ),
+    "auth_method": ("PassThruHeaderAuthMethod",),
+    "connection_pool": ("ConnectionPool",),
+    "errors": (
+        "DeadlineExceededError",
+        "Error",
+        "HttpError",
+        "ServerHttpError",
+        "UrlError",
+    ),
+    "event_spool": ("EventSpool",),
+    "hooks": (
+        "OpenTelemetryHooks",
+        "RequestHooks",
+    ),
+    "events_api_v2_client": (
+        "AsyncEventsApiV2Client",
+        "EventsApiV2Client",
+        "RoutingKeyAuthMethod",
+    ),
+    "jira_cloud_integration_api_client": ("JiraCloudIntegrationApiClient",),
+    "jira_server_integration_api_client": ("JiraServerIntegrationApiClient",),
+    "mcp_api_client": ("McpApiClient",),
+    "metrics": (
+        "ApiMetrics",
+        "LatencyHistogram",
+    ),
+    "ms_teams_integration_api_client": ("MsTeamsIntegrationApiClient",),
+    "oauth_token_client": ("OAuthTokenClient",),
+    "rate_limiter": ("RateLimiter",),
+    "rest_api_v2_base_client": (
+        "ITERATION_LIMIT",
+        "AsyncRestApiV2BaseClient",
+        "OAuthTokenAuthMethod",
+        "RestApiV2BaseClient",
+        "TokenAuthMethod",
+        "auto_json",
+        "endpoint_matches",
+        "infer_entity_wrapper",
+        "is_path_param",
+        "resource_url",
+        "unwrap",
+        "wrapped_entities",
+    ),
+    "rest_api_v2_client": (
+        "CANONICAL_PATHS",
+        "CURSOR_BASED_PAGINATION_PATHS",
+        "ENTITY_WRAPPER_CONFIG",
+        "AsyncRestApiV2Client",
+        "RestApiV2Client",
+        "canonical_path",
+        "entity_wrappers",
+    ),
+    "scim_api_client": ("ScimApiClient",),
+    "slack_integration_api_client": ("SlackIntegrationApiClient",),
+    "slack_integration_connections_api_client": (
+        "SlackIntegrationConnectionsApiClient",
+    ),
+}
+
+_LAZY_ATTRIBUTES = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
+
+if TYPE_CHECKING:
+    from .common import (
+        TEXT_LEN_LIMIT,
+        TIMEOUT,
+        deprecated_kwarg,
+        http_error_message,
+        last_4,
+        normalize_url,
+        plural_name,
+        requires_success,
+        singular_name,
+        successful_response,
+        truncate_text,
+        try_decoding,
+    )
+
+    from .api_client import ApiClient, AsyncApiClient
+
+    from .auth_method import PassThruHeaderAuthMethod
+
+    from .connection_pool import ConnectionPool
+
+    from .errors import (
+        DeadlineExceededError,
+        Error,
+        HttpError,
+        ServerHttpError,
+        UrlError,
+    )
+    from .event_spool import EventSpool
+
+    from .hooks import OpenTelemetryHooks, RequestHooks
+
+    from .events_api_v2_client import (
+        AsyncEventsApiV2Client,
+        EventsApiV2Client,
+        RoutingKeyAuthMethod,
+    )
+
+    from .jira_cloud_integration_api_client import (
+        JiraCloudIntegrationApiClient,
+    )
+    from .jira_server_integration_api_client import (
+        JiraServerIntegrationApiClient,
+    )
+    from .mcp_api_client import McpApiClient
+    from .metrics import ApiMetrics, LatencyHistogram
+    from .ms_teams_integration_api_client import MsTeamsIntegrationApiClient
+    from .oauth_token_client import OAuthTokenClient
+    from .rate_limiter import RateLimiter
+
+    from .rest_api_v2_base_client import (
+        ITERATION_LIMIT,
+        AsyncRestApiV2BaseClient,
+        OAuthTokenAuthMethod,
+        RestApiV2BaseClient,
+        TokenAuthMethod,
+        auto_json,
+        endpoint_matches,
+        infer_entity_wrapper,
+        is_path_param,
+        resource_url,
+        unwrap,
+        wrapped_entities,
+    )
+
+    from .rest_api_v2_client import (
+        CANONICAL_PATHS,
+        CURSOR_BASED_PAGINATION_PATHS,
+        ENTITY_WRAPPER_CONFIG,
+        AsyncRestApiV2Client,
+        RestApiV2Client,
+        canonical_path,
+        entity_wrappers,
+    )
+
+    from .scim_api_client import ScimApiClient
+    from .slack_integration_api_client import SlackIntegrationApiClient
+    from .slack_integration_connections_api_client import (
+        SlackIntegrationConnectionsApiClient,
+    )
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is not None:
+        value = getattr(import_module(f".{module}", __name__), name)
+        # Cache the value so that this function isn't called again for it:
+        globals()[name] = value
+        return value
+    if not name.startswith("__"):
+        # Submodules, i.e. pagerduty.common, were previously always available
+        # as attributes because they were all imported by the package:
+        try:
+            return import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 # For backwards compatibility, __all__ currently includes all of the above.
 # This should eventually be cleaned up so that it includes only the most-used
@@ -68,20 +205,32 @@ from .slack_integration_connections_api_client import (
 __all__ = [
     "__version__",
     "ApiClient",
+    "ApiMetrics",
+    "AsyncApiClient",
+    "AsyncEventsApiV2Client",
+    "AsyncRestApiV2BaseClient",
+    "AsyncRestApiV2Client",
     "CANONICAL_PATHS",
     "CURSOR_BASED_PAGINATION_PATHS",
+    "ConnectionPool",
+    "DeadlineExceededError",
     "ENTITY_WRAPPER_CONFIG",
     "Error",
+    "EventSpool",
     "EventsApiV2Client",
     "HttpError",
     "ITERATION_LIMIT",
     "JiraCloudIntegrationApiClient",
     "JiraServerIntegrationApiClient",
+    "LatencyHistogram",
     "McpApiClient",
     "MsTeamsIntegrationApiClient",
     "OAuthTokenAuthMethod",
     "OAuthTokenClient",
+    "OpenTelemetryHooks",
     "PassThruHeaderAuthMethod",
+    "RateLimiter",
+    "RequestHooks",
     "RestApiV2BaseClient",
     "RestApiV2Client",
     "RoutingKeyAuthMethod",
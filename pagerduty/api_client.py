@@ -1,52 +1,73 @@
 # Core
+import asyncio
 import logging
+import math
 import sys
 import time
 
-from copy import deepcopy
+from contextlib import contextmanager
+from contextvars import ContextVar
 from random import random
-from typing import Optional, Union
+from typing import Iterator, Optional, Tuple, Union
 
 # PyPI
 from httpx2 import __version__ as HTTPX_VERSION
-from httpx2 import Client, Headers, TransportError, Response
+from httpx2 import (
+    AsyncClient,
+    Client,
+    Headers,
+    Response,
+    Timeout,
+    TransportError,
+)
 
 # Local
 from .auth_method import AuthMethod
 from .version import __version__
-from .errors import Error, HttpError, ServerHttpError, UrlError
-from .common import TIMEOUT, normalize_url
+from .errors import (
+    DeadlineExceededError,
+    Error,
+    HttpError,
+    ServerHttpError,
+    UrlError,
+)
+from .common import TIMEOUT, normalize_url, retry_after
+from .connection_pool import ConnectionPool
+from .hooks import RequestHooks
+from .rate_limiter import RateLimiter
 
+# The total timeout given to a verb method, i.e. get, for request to apply:
+_total_timeout = ContextVar("total_timeout", default=None)
 
-class ApiClient(Client):
+
+class ApiClientMixin:
     """
-    Base class for making HTTP requests to PagerDuty APIs
+    Features common to all PagerDuty API clients, independent of I/O model
 
-    This is an opinionated wrapper of `httpx2.Client`_, with a few additional
-    features:
+    This class holds the configuration, header/URL handling and retry logic
+    shared between :class:`ApiClient` (synchronous) and
+    :class:`AsyncApiClient` (asynchronous). It is not meant to be used on its
+    own, but rather combined with an HTTPX client class, i.e.
+    `httpx2.Client`_ or `httpx2.AsyncClient`_.
+    """
 
-    - The client will reattempt the request with auto-increasing cooldown/retry
-      intervals, with attempt limits configurable through the :attr:`retry`
-      attribute.
-    - When making requests, headers specified ad-hoc in calls to HTTP verb
-      functions will not replace, but will be merged into, default headers.
-    - The request URL, if it doesn't already start with the REST API base URL,
-      will be prepended with the default REST API base URL.
-    - It will only perform requests with methods as given in the
-      :attr:`permitted_methods` list, and will raise :class:`Error` for
-      any other HTTP methods.
+    _default_headers = None
 
-    :param auth_method:
-        The authentication method to use for API requests, should be an
-        instance of the AuthMethod class.
-    :param debug:
-        Sets :attr:`print_debug`. Set to ``True`` to enable verbose command
-        line output.
-    :param base_url:
-        Sets the base API URL to be used by the client for all API calls.
+    _url = None
+
+    connection_pool = None
+    """
+    The :class:`pagerduty.ConnectionPool` shared with other clients through
+    which the client makes requests, if it was constructed with one.
     """
 
-    _url = None
+    hooks = None
+    """
+    An optional :class:`pagerduty.RequestHooks` object for observing requests.
+
+    If set, its methods are called at each step of each request made by the
+    client, i.e. for logging, tracing or collecting metrics.
+    """
 
     log = None
     """
@@ -69,8 +90,30 @@ class ApiClient(Client):
     will be raised if this happens.
     """
 
+    max_retry_after = 300
+    """
+    The longest time in seconds that the client will wait before retrying as
+    directed by the API (see :attr:`pagerduty.common.retry_after`).
+
+    Longer times indicated by a response are reduced to this. Conversely, if a
+    response indicates that a request can be retried immediately (i.e. a
+    ``Retry-After`` header of zero, or a date in the past due to clock skew),
+    the exponential cooldown is used instead, so that a misbehaving proxy
+    cannot cause the client to retry without any backoff.
+    """
+
     parent = None
-    """The ``super`` object (`httpx2.Client`_)"""
+    """The ``super`` object (`httpx2.Client`_ or `httpx2.AsyncClient`_)"""
+
+    rate_limiter = None
+    """
+    An optional :class:`pagerduty.RateLimiter` for pacing requests.
+
+    If set, each request (including retries) will first wait as long as the
+    rate limiter dictates for the client's credential, and the budget for the
+    credential will be adjusted according to the headers of each response.
+    The same object can be shared between multiple clients.
+    """
 
     retry = {}
     """
@@ -112,11 +155,45 @@ class ApiClient(Client):
     determines the TCP read timeout.
     """
 
-    def __init__(
-        self, auth_method: AuthMethod, debug=False, base_url=None, **kw
+    total_timeout = None
+    """
+    The maximum time in seconds that each request may take, including all
+    retries and the cooldowns between them, or ``None`` for no limit.
+
+    Unlike :attr:`timeout`, which applies to each attempt separately, this
+    bounds the time taken by :attr:`request` as a whole. The timeout of each
+    attempt is reduced to the time remaining, and if a cooldown before
+    retrying would leave no time for another attempt, it is shortened to half
+    of the time remaining so that a final attempt can be made. If the request
+    still doesn't complete before the time runs out, a
+    :class:`pagerduty.DeadlineExceededError` is raised.
+
+    It can be overridden for individual requests via the ``total_timeout``
+    keyword argument of :attr:`request` and of the methods that call it with
+    their keyword arguments: ``get``, ``post``, ``put``, ``patch`` and
+    ``delete``, and in REST API clients, wrappers of these such as ``rget``
+    and ``rput``. Pagination methods such as ``iter_all``, which make many
+    requests, apply the client's limit to each of them.
+    """
+
+    def _init_client(
+        self,
+        auth_method: AuthMethod,
+        debug=False,
+        base_url=None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Optional[RequestHooks] = None,
+        connection_pool: Optional[ConnectionPool] = None,
     ):
-        self.parent = super(ApiClient, self)
-        self.parent.__init__(**kw)
+        """
+        Set up the client's PagerDuty-specific attributes.
+
+        Called from the constructor of each concrete client class after the
+        underlying HTTPX client has been initialized.
+        """
+        self.connection_pool = connection_pool
+        self.rate_limiter = rate_limiter
+        self.hooks = hooks
         self.auth_method = auth_method
         self.log = logging.getLogger(__name__)
         self.print_debug = debug
@@ -148,6 +225,7 @@ class ApiClient(Client):
             )
 
         self._auth_method = auth_method
+        self._default_headers = None
         self.after_set_auth_method()
 
     def cooldown_factor(self) -> float:
@@ -173,6 +251,411 @@ class ApiClient(Client):
         """Compose the URL whether it is a path or an already-complete URL"""
         return normalize_url(self.url, url)
 
+    def _attempt_timeout(
+        self,
+        endpoint: str,
+        deadline: float,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Union[float, Timeout]:
+        """
+        Get the timeout of the next attempt at a request with a deadline.
+
+        :param endpoint:
+            The request method and URL, for logging purposes
+        :param deadline:
+            The value of ``time.monotonic()`` by which the request must end
+        :param response:
+            The last response received, if any
+        :param error:
+            The last network error encountered, if any
+        :returns:
+            The lesser of :attr:`timeout` and the time remaining. If
+            :attr:`timeout` is a ``httpx2.Timeout`` object, each of its
+            components is reduced to the time remaining.
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise self._deadline_error(endpoint, response) from error
+        if isinstance(self.timeout, (int, float)):
+            return min(self.timeout, remaining)
+        elif self.timeout is None:
+            return remaining
+        timeout = Timeout(self.timeout)
+        return Timeout(
+            **{
+                component: remaining if t is None else min(t, remaining)
+                for component, t in (
+                    ("connect", timeout.connect),
+                    ("read", timeout.read),
+                    ("write", timeout.write),
+                    ("pool", timeout.pool),
+                )
+            }
+        )
+
+    def _deadline(self, total_timeout: Optional[float]) -> Optional[float]:
+        """
+        Compute the deadline of a request.
+
+        :param total_timeout:
+            The total timeout given for the request, or ``None`` to use
+            :attr:`total_timeout`
+        :returns:
+            The value of ``time.monotonic()`` by which the request must end, or
+            ``None`` if there is no limit.
+        """
+        if total_timeout is None:
+            total_timeout = self.total_timeout
+        if total_timeout is None or math.isinf(total_timeout):
+            return None
+        if total_timeout <= 0:
+            raise ValueError("total_timeout must be a positive number")
+        return time.monotonic() + total_timeout
+
+    def _deadline_cooldown(
+        self,
+        endpoint: str,
+        deadline: float,
+        wait: float,
+        final: bool,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Tuple[float, bool]:
+        """
+        Fit a cooldown before retrying a request within its deadline.
+
+        :param endpoint:
+            The request method and URL, for logging purposes
+        :param deadline:
+            The value of ``time.monotonic()`` by which the request must end
+        :param wait:
+            The intended cooldown time in seconds
+        :param final:
+            Whether the previous attempt was to be the final attempt
+        :param response:
+            The response prompting the retry, if any
+        :param error:
+            The network error prompting the retry, if any
+        :returns:
+            A tuple containing the time in seconds to wait and whether the
+            next attempt is to be the final attempt
+        """
+        remaining = deadline - time.monotonic()
+        if final or remaining <= 0:
+            raise self._deadline_error(endpoint, response) from error
+        if wait < remaining:
+            return wait, False
+        wait = remaining / 2
+        self.log.warning(
+            "%s: Shortening cooldown to %g seconds to make a final attempt "
+            "before the total timeout.",
+            endpoint,
+            wait,
+        )
+        return wait, True
+
+    def _deadline_error(
+        self, endpoint: str, response: Optional[Response] = None
+    ) -> DeadlineExceededError:
+        """
+        Compose the exception to raise when a request's deadline has passed.
+        """
+        if response is None:
+            outcome = "no response was received"
+        else:
+            outcome = f"the last response had status {response.status_code}"
+        return DeadlineExceededError(
+            f"{endpoint}: Could not complete the request within its total "
+            f"timeout; {outcome}.",
+            response=response,
+        )
+
+    def _network_error_cooldown(
+        self,
+        endpoint: str,
+        error: TransportError,
+        network_attempts: int,
+        sleep_timer: float,
+    ) -> float:
+        """
+        Determine how long to wait before retrying after a network error.
+
+        :param endpoint:
+            The request method and URL, for logging purposes
+        :param error:
+            The exception that was raised by the underlying HTTP client
+        :param network_attempts:
+            The number of network errors encountered so far in the request
+        :param sleep_timer:
+            The most recent cooldown time
+        :returns:
+            The new cooldown time in seconds
+        """
+        if network_attempts > self.max_network_attempts:
+            error_msg = (
+                f"{endpoint}: Non-transient network "
+                "error; exceeded maximum number of attempts "
+                f"({self.max_network_attempts}) to connect to the API."
+            )
+            raise Error(error_msg) from error
+        sleep_timer *= self.cooldown_factor()
+        self.log.warning(
+            "%s: HTTP or network error: %s. retrying in %g seconds.",
+            endpoint,
+            error.__class__.__name__,
+            sleep_timer,
+        )
+        return sleep_timer
+
+    def _prepare_request(
+        self, method: str, url: str, **kwargs
+    ) -> Tuple[str, str, dict]:
+        """
+        Validate and compose the arguments to send to the HTTPX client.
+
+        :param method:
+            The request method to use. Case-insensitive.
+        :param url:
+            The path/URL to request.
+        :param **kwargs:
+            Keyword arguments passed to :attr:`request`
+        :returns:
+            A tuple containing the upper-case method, full URL and keyword
+            arguments for the underlying HTTPX client's ``request`` method.
+        """
+        method = method.strip().upper()
+        if method not in self.permitted_methods:
+            m_str = ", ".join(self.permitted_methods)
+            raise Error(
+                f"Method {method} not supported by this API. Permitted "
+                f"methods: {m_str}"
+            )
+        # A shallow copy suffices: the containers that are modified below are
+        # replaced with new objects rather than updated in place, so the
+        # caller's arguments (i.e. large JSON bodies) are never copied.
+        req_kw = dict(kwargs)
+        full_url = self.normalize_url(url)
+
+        # Add in any headers specified in keyword arguments:
+        headers = kwargs.get("headers", {})
+        # Add some defaults:
+        req_kw.update(
+            {
+                "headers": self.prepare_headers(method, user_headers=headers),
+                "timeout": self.timeout,
+                "auth": None,
+                "follow_redirects": False,
+                "cookies": None,
+            }
+        )
+
+        # Add authentication parameter, if the API requires it and it is a
+        # request type that includes a body:
+        if method in ("POST", "PUT", "PATCH"):
+            auth_param = self.auth_method.auth_param
+            for body_key in ("json", "data"):
+                if (
+                    auth_param
+                    and body_key in req_kw
+                    and type(req_kw[body_key]) is dict
+                ):
+                    req_kw[body_key] = {**req_kw[body_key], **auth_param}
+
+        # Special changes to user-supplied query parameters, for convenience:
+        if "params" in kwargs and kwargs["params"]:
+            req_kw["params"] = self.normalize_params(kwargs["params"])
+
+        return method, full_url, req_kw
+
+    def _rate_limit_delay(self, endpoint: str, final: bool = False) -> float:
+        """
+        Reserve a request in the rate limiter's budget, if there is one.
+
+        :param endpoint:
+            The request method and URL, for logging purposes
+        :param final:
+            Whether the request is about to make its final attempt before its
+            deadline. The cooldown before that attempt was already shortened to
+            fit the deadline, so the attempt is made without further pacing.
+        :returns:
+            The time in seconds to wait before sending the request
+        """
+        if self.rate_limiter is None:
+            return 0
+        delay = self.rate_limiter.reserve(self.rate_limit_key)
+        if delay > 0 and final:
+            self.log.debug(
+                "%s: Not pacing the final attempt before the total timeout.",
+                endpoint,
+            )
+            return 0
+        if delay > 0:
+            self.log.debug(
+                "%s: Pacing request; waiting %g seconds.", endpoint, delay
+            )
+        return delay
+
+    def _response_cooldown(
+        self,
+        endpoint: str,
+        response: Response,
+        http_attempts: dict,
+        sleep_timer: float,
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Determine whether and how long to wait before retrying a request.
+
+        If the response includes a ``Retry-After`` header, or rate limit
+        headers indicating when the limit will reset (see
+        :attr:`pagerduty.common.retry_after`), the time it specifies is used
+        as the cooldown. Otherwise, the cooldown time increases exponentially
+        with each attempt.
+
+        :param endpoint:
+            The request method and URL, for logging purposes
+        :param response:
+            The response received from the API
+        :param http_attempts:
+            A dictionary counting the number of retries per status; it will be
+            updated in place.
+        :param sleep_timer:
+            The most recent exponential cooldown time
+        :returns:
+            ``None`` if the response should be returned, or otherwise a tuple
+            containing the time in seconds to wait before retrying, and the new
+            exponential cooldown time.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(
+                self.rate_limit_key, response, max_hold=self.max_retry_after
+            )
+        status = response.status_code
+        retry_logic = self.retry.get(status, 0)
+        if status // 100 == 3:
+            # Redirects are not expected but if they happen, fail noisily:
+            raise ServerHttpError(
+                f"Received status {status} in response to {endpoint}, but "
+                "PagerDuty APIs are not expected to issue redirects.",
+                response,
+            )
+        elif not response.is_success and retry_logic != 0:
+            # Take special action as defined by the retry logic
+            if retry_logic != -1:
+                # Retry a specific number of times (-1 implies infinite)
+                if (
+                    http_attempts.get(status, 0) >= retry_logic
+                    or sum(http_attempts.values()) > self.max_http_attempts
+                ):
+                    lower_limit = retry_logic
+                    if lower_limit > self.max_http_attempts:
+                        lower_limit = self.max_http_attempts
+                    self.log.error(
+                        "%s: Non-transient HTTP error: exceeded "
+                        "maximum number of attempts (%d) to make a "
+                        "successful request. Currently encountering "
+                        "status %d.",
+                        endpoint,
+                        lower_limit,
+                        status,
+                    )
+                    return None
+                http_attempts[status] = 1 + http_attempts.get(status, 0)
+            wait, sleep_timer, source = self._retry_wait(response, sleep_timer)
+            self.log.warning(
+                "%s: HTTP error (%d); retrying in %g seconds (%s).",
+                endpoint,
+                status,
+                wait,
+                source,
+            )
+            return wait, sleep_timer
+        elif status == 429:
+            wait, sleep_timer, source = self._retry_wait(response, sleep_timer)
+            self.log.debug(
+                "%s: Hit API rate limit (status 429); retrying in %g seconds "
+                "(%s)",
+                endpoint,
+                wait,
+                source,
+            )
+            return wait, sleep_timer
+        elif status == 401:
+            # Stop. Authentication failed. We shouldn't try doing any more,
+            # because we'll run into the same problem later anyway.
+            raise HttpError(
+                "Received 401 Unauthorized response from the API. The API "
+                f"credential ({self.trunc_key}) may be invalid or "
+                "deactivated, or the client is configured for the wrong "
+                "service region (in which case updating the url property "
+                "accordingly may resolve the issue).",
+                response,
+            )
+        else:
+            # All went according to plan.
+            return None
+
+    def _retry_hooks(self, context, wait: float, response: Response):
+        """
+        Call the hooks for a retry after receiving an error response.
+
+        :param context:
+            The value returned by the ``request_start`` hook
+        :param wait:
+            The time in seconds to wait before retrying
+        :param response:
+            The response received from the API
+        """
+        if response.status_code == 429:
+            self.hooks.rate_limited(self, context, wait)
+        self.hooks.retry(self, context, wait, response=response)
+
+    def _retry_wait(
+        self, response: Response, sleep_timer: float
+    ) -> Tuple[float, float, str]:
+        """
+        Choose the cooldown time before retrying after an error response.
+
+        :param response:
+            The error response
+        :param sleep_timer:
+            The most recent exponential cooldown time
+        :returns:
+            A tuple containing the time to wait in seconds, the new exponential
+            cooldown time, and a description of how the wait was chosen.
+        """
+        server_wait = retry_after(response, maximum=self.max_retry_after)
+        if server_wait is not None and server_wait > 0:
+            # The API says exactly how long to wait; don't escalate the
+            # exponential cooldown, which is only a guess:
+            if server_wait >= self.max_retry_after:
+                return (
+                    server_wait,
+                    sleep_timer,
+                    "as indicated by the API, capped at max_retry_after",
+                )
+            return server_wait, sleep_timer, "as indicated by the API"
+        sleep_timer *= self.cooldown_factor()
+        return sleep_timer, sleep_timer, "exponential cooldown"
+
+    @contextmanager
+    def _total_timeout_scope(self, total_timeout: Optional[float]) -> Iterator:
+        """
+        Apply a total timeout to the request made within a ``with`` block.
+
+        The verb methods, i.e. ``get``, hand their other arguments to the
+        ``httpx2`` client's own methods, which call ``request`` without the
+        total timeout; it reads the value set here instead.
+
+        :param total_timeout:
+            The total timeout given to the verb method
+        """
+        token = _total_timeout.set(total_timeout)
+        try:
+            yield
+        finally:
+            _total_timeout.reset(token)
+
     @property
     def permitted_methods(self) -> tuple:
         """
@@ -211,6 +694,11 @@ class ApiClient(Client):
         the correct headers on each request, especially where they might differ
         per-API / per request.
 
+        The default headers for each method are computed once and cached until
+        :attr:`auth_method` or :attr:`url` is set again. If the authentication
+        method object is modified in place, it must be assigned to
+        :attr:`auth_method` again for the change to take effect.
+
         :param method:
             The HTTP method, in upper case.
         :param user_headers:
@@ -218,19 +706,32 @@ class ApiClient(Client):
         :returns:
             The final list of headers to use in the request
         """
-        headers = Headers({})
-        # Override the default user-agent with the per-class user_agent attr:
-        headers["User-Agent"] = self.user_agent
-        # A nearly universal convention: whenever sending a POST, PUT or PATCH,
-        # the Content-Type header must be "application/json":
-        if method in ("POST", "PUT", "PATCH"):
-            headers["Content-Type"] = "application/json"
+        if self._default_headers is None:
+            self._default_headers = {}
+        defaults = self._default_headers.get(method)
+        if defaults is None:
+            base_headers = Headers({})
+            # Override the default user-agent with the per-class user_agent
+            # attr:
+            base_headers["User-Agent"] = self.user_agent
+            # A nearly universal convention: whenever sending a POST, PUT or
+            # PATCH, the Content-Type header must be "application/json":
+            if method in ("POST", "PUT", "PATCH"):
+                base_headers["Content-Type"] = "application/json"
+            auth_header = self.auth_method.auth_header
+            all_headers = base_headers.copy()
+            all_headers.update(auth_header)
+            defaults = (base_headers, auth_header, all_headers)
+            self._default_headers[method] = defaults
+        base_headers, auth_header, all_headers = defaults
+        if not (type(user_headers) is dict and user_headers):
+            return all_headers.copy()
+        headers = base_headers.copy()
         # Add headers passed in per-request as an additional argument, letting
         # them take precedence over the defaults:
-        if type(user_headers) is dict:
-            headers.update(user_headers)
+        headers.update(user_headers)
         # Add authentication header:
-        headers.update(self.auth_method.auth_header)
+        headers.update(auth_header)
         return headers
 
     @property
@@ -263,150 +764,15 @@ class ApiClient(Client):
             delattr(self, "_debugHandler")
         # else: no-op; only happens if debug is set to the same value twice
 
-    def request(self, method: str, url: str, **kwargs) -> Response:
+    @property
+    def rate_limit_key(self) -> str:
         """
-        Make a generic PagerDuty API request.
+        Identifies the budget to use in :attr:`rate_limiter` for this client.
 
-        :param method:
-            The request method to use. Case-insensitive. May be one of get, put,
-            post or delete.
-        :param url:
-            The path/URL to request. If it does not start with the base URL,
-            the base URL will be prepended.
-        :param **kwargs:
-            Custom keyword arguments to pass to ``httpx2.Client.request``.
-        :type method: str
-        :type url: str
-        :returns:
-            The `httpx2.Response`_ object corresponding to the HTTP response
+        By default, this is the API credential, so that clients using the same
+        credential share a budget.
         """
-        sleep_timer = self.sleep_timer
-        network_attempts = 0
-        http_attempts = {}
-        method = method.strip().upper()
-        if method not in self.permitted_methods:
-            m_str = ", ".join(self.permitted_methods)
-            raise Error(
-                f"Method {method} not supported by this API. Permitted "
-                f"methods: {m_str}"
-            )
-        req_kw = deepcopy(kwargs)
-        full_url = self.normalize_url(url)
-        endpoint = "%s %s" % (method.upper(), full_url)
-
-        # Add in any headers specified in keyword arguments:
-        headers = kwargs.get("headers", {})
-        # Add some defaults:
-        req_kw.update(
-            {
-                "headers": self.prepare_headers(method, user_headers=headers),
-                "timeout": self.timeout,
-                "auth": None,
-                "follow_redirects": False,
-                "cookies": None,
-            }
-        )
-
-        # Add authentication parameter, if the API requires it and it is a
-        # request type that includes a body:
-        if method in ("POST", "PUT", "PATCH"):
-            for body_key in ("json", "data"):
-                if body_key in req_kw and type(req_kw[body_key]) is dict:
-                    req_kw[body_key].update(self.auth_method.auth_param)
-
-        # Special changes to user-supplied query parameters, for convenience:
-        if "params" in kwargs and kwargs["params"]:
-            req_kw["params"] = self.normalize_params(kwargs["params"])
-
-        # Make the request (and repeat w/cooldown if the rate limit is reached):
-        while True:
-            try:
-                response = self.parent.request(method, full_url, **req_kw)
-                self.postprocess(response)
-            except TransportError as e:
-                network_attempts += 1
-                if network_attempts > self.max_network_attempts:
-                    error_msg = (
-                        f"{endpoint}: Non-transient network "
-                        "error; exceeded maximum number of attempts "
-                        f"({self.max_network_attempts}) to connect to the API."
-                    )
-                    raise Error(error_msg) from e
-                sleep_timer *= self.cooldown_factor()
-                self.log.warning(
-                    "%s: HTTP or network error: %s. retrying in %g seconds.",
-                    endpoint,
-                    e.__class__.__name__,
-                    sleep_timer,
-                )
-                time.sleep(sleep_timer)
-                continue
-
-            status = response.status_code
-            retry_logic = self.retry.get(status, 0)
-            if status // 100 == 3:
-                # Redirects are not expected but if they happen, fail noisily:
-                raise ServerHttpError(
-                    f"Received status {status} in response to {method} "
-                    f"{full_url}, but PagerDuty APIs are not expected to "
-                    "issue redirects.",
-                    response,
-                )
-            elif not response.is_success and retry_logic != 0:
-                # Take special action as defined by the retry logic
-                if retry_logic != -1:
-                    # Retry a specific number of times (-1 implies infinite)
-                    if (
-                        http_attempts.get(status, 0) >= retry_logic
-                        or sum(http_attempts.values()) > self.max_http_attempts
-                    ):
-                        lower_limit = retry_logic
-                        if lower_limit > self.max_http_attempts:
-                            lower_limit = self.max_http_attempts
-                        self.log.error(
-                            "%s: Non-transient HTTP error: exceeded "
-                            "maximum number of attempts (%d) to make a "
-                            "successful request. Currently encountering "
-                            "status %d.",
-                            endpoint,
-                            lower_limit,
-                            status,
-                        )
-                        return response
-                    http_attempts[status] = 1 + http_attempts.get(status, 0)
-                sleep_timer *= self.cooldown_factor()
-                self.log.warning(
-                    "%s: HTTP error (%d); retrying in %g seconds.",
-                    endpoint,
-                    status,
-                    sleep_timer,
-                )
-                time.sleep(sleep_timer)
-                continue
-            elif status == 429:
-                sleep_timer *= self.cooldown_factor()
-                self.log.debug(
-                    "%s: Hit API rate limit (status 429); retrying in %g "
-                    "seconds",
-                    endpoint,
-                    sleep_timer,
-                )
-                time.sleep(sleep_timer)
-                continue
-            elif status == 401:
-                # Stop. Authentication failed. We shouldn't try doing any more,
-                # because we'll run into the same problem later anyway.
-                raise HttpError(
-                    "Received 401 Unauthorized response from the API. The API "
-                    f"credential ({self.trunc_key}) may be invalid or "
-                    "deactivated, or the client is configured for the wrong "
-                    "service region (in which case updating the url property "
-                    "accordingly may resolve the issue).",
-                    response,
-                )
-            else:
-                # All went according to plan.
-                return response
+        return str(self.auth_method.secret)
 
     @property
     def stagger_cooldown(self) -> float:
@@ -473,6 +839,7 @@ class ApiClient(Client):
         if not new_base_url.startswith("https://"):
             raise UrlError("API base URL must use scheme https://")
         self._url = new_base_url
+        self._default_headers = None
 
     @property
     def user_agent(self) -> str:
@@ -482,3 +849,429 @@ class ApiClient(Client):
             sys.version_info.major,
             sys.version_info.minor,
         )
+
+
+class ApiClient(ApiClientMixin, Client):
+    """
+    Base class for making HTTP requests to PagerDuty APIs
+
+    This is an opinionated wrapper of `httpx2.Client`_, with a few additional
+    features:
+
+    - The client will reattempt the request with auto-increasing cooldown/retry
+      intervals, with attempt limits configurable through the :attr:`retry`
+      attribute.
+    - When making requests, headers specified ad-hoc in calls to HTTP verb
+      functions will not replace, but will be merged into, default headers.
+    - The request URL, if it doesn't already start with the REST API base URL,
+      will be prepended with the default REST API base URL.
+    - It will only perform requests with methods as given in the
+      :attr:`permitted_methods` list, and will raise :class:`Error` for
+      any other HTTP methods.
+
+    Configuration and behavior common to all clients is documented in
+    :class:`pagerduty.api_client.ApiClientMixin`.
+
+    :param auth_method:
+        The authentication method to use for API requests, should be an
+        instance of the AuthMethod class.
+    :param debug:
+        Sets :attr:`print_debug`. Set to ``True`` to enable verbose command
+        line output.
+    :param base_url:
+        Sets the base API URL to be used by the client for all API calls.
+    :param rate_limiter:
+        Sets :attr:`rate_limiter`.
+    :param hooks:
+        Sets :attr:`hooks`.
+    :param connection_pool:
+        Sets :attr:`connection_pool`. The client makes its requests through
+        the pool's transport; this cannot be combined with the ``transport``
+        keyword argument of the HTTPX client.
+    """
+
+    def __init__(
+        self,
+        auth_method: AuthMethod,
+        debug=False,
+        base_url=None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Optional[RequestHooks] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        **kw,
+    ):
+        if connection_pool is not None:
+            if "transport" in kw:
+                raise ValueError(
+                    "The transport and connection_pool arguments cannot be "
+                    "used together"
+                )
+            kw["transport"] = connection_pool.transport
+        self.parent = super(ApiClient, self)
+        self.parent.__init__(**kw)
+        self._init_client(
+            auth_method,
+            debug=debug,
+            base_url=base_url,
+            rate_limiter=rate_limiter,
+            hooks=hooks,
+            connection_pool=connection_pool,
+        )
+
+    def delete(
+        self, url: str, total_timeout: Optional[float] = None, **kwargs
+    ) -> Response:
+        """
+        Make a DELETE request; see :attr:`request`.
+        """
+        with self._total_timeout_scope(total_timeout):
+            return super(ApiClient, self).delete(url, **kwargs)
+
+    def get(
+        self, url: str, total_timeout: Optional[float] = None, **kwargs
+    ) -> Response:
+        """
+        Make a GET request; see :attr:`request`.
+        """
+        with self._total_timeout_scope(total_timeout):
+            return super(ApiClient, self).get(url, **kwargs)
+
+    def patch(
+        self, url: str, total_timeout: Optional[float] = None, **kwargs
+    ) -> Response:
+        """
+        Make a PATCH request; see :attr:`request`.
+        """
+        with self._total_timeout_scope(total_timeout):
+            return super(ApiClient, self).patch(url, **kwargs)
+
+    def post(
+        self, url: str, total_timeout: Optional[float] = None, **kwargs
+    ) -> Response:
+        """
+        Make a POST request; see :attr:`request`.
+        """
+        with self._total_timeout_scope(total_timeout):
+            return super(ApiClient, self).post(url, **kwargs)
+
+    def put(
+        self, url: str, total_timeout: Optional[float] = None, **kwargs
+    ) -> Response:
+        """
+        Make a PUT request; see :attr:`request`.
+        """
+        with self._total_timeout_scope(total_timeout):
+            return super(ApiClient, self).put(url, **kwargs)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        total_timeout: Optional[float] = None,
+        **kwargs,
+    ) -> Response:
+        """
+        Make a generic PagerDuty API request.
+
+        :param method:
+            The request method to use. Case-insensitive. May be one of get, put,
+            post or delete.
+        :param url:
+            The path/URL to request. If it does not start with the base URL,
+            the base URL will be prepended.
+        :param total_timeout:
+            The maximum time in seconds that the request may take, including
+            all retries; see :attr:`total_timeout`, which is used if
+            unspecified. Use ``math.inf`` to lift the client's limit.
+        :param **kwargs:
+            Custom keyword arguments to pass to ``httpx2.Client.request``.
+        :type method: str
+        :type url: str
+        :returns:
+            The `httpx2.Response`_ object corresponding to the HTTP response
+        """
+        sleep_timer = self.sleep_timer
+        network_attempts = 0
+        http_attempts = {}
+        if total_timeout is None:
+            total_timeout = _total_timeout.get()
+        deadline = self._deadline(total_timeout)
+        final = False
+        response = error = None
+        method, full_url, req_kw = self._prepare_request(method, url, **kwargs)
+        endpoint = "%s %s" % (method, full_url)
+
+        hooks = self.hooks
+        context = None
+        if hooks is not None:
+            context = hooks.request_start(self, method, full_url)
+
+        # Make the request (and repeat w/cooldown if the rate limit is reached):
+        try:
+            while True:
+                delay = self._rate_limit_delay(endpoint, final)
+                if delay > 0:
+                    if deadline is not None:
+                        delay, final = self._deadline_cooldown(
+                            endpoint, deadline, delay, final, response, error
+                        )
+                    if hooks is not None:
+                        hooks.rate_limited(self, context, delay)
+                    time.sleep(delay)
+                if deadline is not None:
+                    req_kw["timeout"] = self._attempt_timeout(
+                        endpoint, deadline, response, error
+                    )
+                try:
+                    response = self.parent.request(method, full_url, **req_kw)
+                    error = None
+                    if hooks is not None:
+                        hooks.response(self, context, response)
+                    self.postprocess(response)
+                except TransportError as e:
+                    response, error = None, e
+                    network_attempts += 1
+                    sleep_timer = self._network_error_cooldown(
+                        endpoint, e, network_attempts, sleep_timer
+                    )
+                    wait = sleep_timer
+                    if deadline is not None:
+                        wait, final = self._deadline_cooldown(
+                            endpoint, deadline, wait, final, error=e
+                        )
+                    if hooks is not None:
+                        hooks.retry(self, context, wait, error=e)
+                    time.sleep(wait)
+                    continue
+
+                cooldown = self._response_cooldown(
+                    endpoint, response, http_attempts, sleep_timer
+                )
+                if cooldown is None:
+                    break
+                wait, sleep_timer = cooldown
+                if deadline is not None:
+                    wait, final = self._deadline_cooldown(
+                        endpoint, deadline, wait, final, response
+                    )
+                if hooks is not None:
+                    self._retry_hooks(context, wait, response)
+                time.sleep(wait)
+        except Exception as e:
+            if hooks is not None:
+                hooks.request_end(self, context, error=e)
+            raise
+        if hooks is not None:
+            hooks.request_end(self, context, response=response)
+        return response
+
+
+class AsyncApiClient(ApiClientMixin, AsyncClient):
+    """
+    Base class for making asynchronous HTTP requests to PagerDuty APIs
+
+    This is the `asyncio` counterpart of :class:`ApiClient`, built on
+    `httpx2.AsyncClient`_. It shares the same configuration and retry logic
+    (:attr:`retry`, :attr:`max_http_attempts`, :attr:`sleep_timer` etc.), but
+    its request methods are coroutines and cooldowns between retries are
+    performed with ``asyncio.sleep`` so that other tasks can proceed in the
+    mean time.
+
+    Usage example:
+
+    .. code-block:: python
+
+        async with AsyncRestApiV2Client(API_KEY) as client:
+            user = await client.rget('/users/me')
+
+    :param auth_method:
+        The authentication method to use for API requests, should be an
+        instance of the AuthMethod class.
+    :param debug:
+        Sets :attr:`print_debug`. Set to ``True`` to enable verbose command
+        line output.
+    :param base_url:
+        Sets the base API URL to be used by the client for all API calls.
+    :param rate_limiter:
+        Sets :attr:`rate_limiter`.
+    :param hooks:
+        Sets :attr:`hooks`.
+    :param connection_pool:
+        Sets :attr:`connection_pool`. The client makes its requests through
+        the pool's transport; this cannot be combined with the ``transport``
+        keyword argument of the HTTPX client.
+    """
+
+    def __init__(
+        self,
+        auth_method: AuthMethod,
+        debug=False,
+        base_url=None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Optional[RequestHooks] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        **kw,
+    ):
+        if connection_pool is not None:
+            if "transport" in kw:
+                raise ValueError(
+                    "The transport and connection_pool arguments cannot be "
+                    "used together"
+                )
+            kw["transport"] = connection_pool.async_transport
+        self.parent = super(AsyncApiClient, self)
+        self.parent.__init__(**kw)
+        self._init_client(
+            auth_method,
+            debug=debug,
+            base_url=base_url,
+            rate_limiter=rate_limiter,
+            hooks=hooks,
+            connection_pool=connection_pool,
+        )
+
+    async def delete(
+        self, url: str, total_timeout: Optional[float] = None, **kwargs
+    ) -> Response:
+        """
+        Make a DELETE request; see :attr:`request`.
+        """
+        with self._total_timeout_scope(total_timeout):
+            return await super(AsyncApiClient, self).delete(url, **kwargs)
+
+    async def get(
+        self, url: str, total_timeout: Optional[float] = None, **kwargs
+    ) -> Response:
+        """
+        Make a GET request; see :attr:`request`.
+        """
+        with self._total_timeout_scope(total_timeout):
+            return await super(AsyncApiClient, self).get(url, **kwargs)
+
+    async def patch(
+        self, url: str, total_timeout: Optional[float] = None, **kwargs
+    ) -> Response:
+        """
+        Make a PATCH request; see :attr:`request`.
+        """
+        with self._total_timeout_scope(total_timeout):
+            return await super(AsyncApiClient, self).patch(url, **kwargs)
+
+    async def post(
+        self, url: str, total_timeout: Optional[float] = None, **kwargs
+    ) -> Response:
+        """
+        Make a POST request; see :attr:`request`.
+        """
+        with self._total_timeout_scope(total_timeout):
+            return await super(AsyncApiClient, self).post(url, **kwargs)
+
+    async def put(
+        self, url: str, total_timeout: Optional[float] = None, **kwargs
+    ) -> Response:
+        """
+        Make a PUT request; see :attr:`request`.
+        """
+        with self._total_timeout_scope(total_timeout):
+            return await super(AsyncApiClient, self).put(url, **kwargs)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        total_timeout: Optional[float] = None,
+        **kwargs,
+    ) -> Response:
+        """
+        Make a generic PagerDuty API request asynchronously.
+
+        See: :attr:`pagerduty.ApiClient.request`
+
+        :param method:
+            The request method to use. Case-insensitive.
+        :param url:
+            The path/URL to request. If it does not start with the base URL,
+            the base URL will be prepended.
+        :param total_timeout:
+            The maximum time in seconds that the request may take, including
+            all retries.
+        :param **kwargs:
+            Custom keyword arguments to pass to ``httpx2.AsyncClient.request``.
+        :returns:
+            The `httpx2.Response`_ object corresponding to the HTTP response
+        """
+        sleep_timer = self.sleep_timer
+        network_attempts = 0
+        http_attempts = {}
+        if total_timeout is None:
+            total_timeout = _total_timeout.get()
+        deadline = self._deadline(total_timeout)
+        final = False
+        response = error = None
+        method, full_url, req_kw = self._prepare_request(method, url, **kwargs)
+        endpoint = "%s %s" % (method, full_url)
+
+        hooks = self.hooks
+        context = None
+        if hooks is not None:
+            context = hooks.request_start(self, method, full_url)
+
+        try:
+            while True:
+                delay = self._rate_limit_delay(endpoint, final)
+                if delay > 0:
+                    if deadline is not None:
+                        delay, final = self._deadline_cooldown(
+                            endpoint, deadline, delay, final, response, error
+                        )
+                    if hooks is not None:
+                        hooks.rate_limited(self, context, delay)
+                    await asyncio.sleep(delay)
+                if deadline is not None:
+                    req_kw["timeout"] = self._attempt_timeout(
+                        endpoint, deadline, response, error
+                    )
+                try:
+                    response = await self.parent.request(
+                        method, full_url, **req_kw
+                    )
+                    error = None
+                    if hooks is not None:
+                        hooks.response(self, context, response)
+                    self.postprocess(response)
+                except TransportError as e:
+                    response, error = None, e
+                    network_attempts += 1
+                    sleep_timer = self._network_error_cooldown(
+                        endpoint, e, network_attempts, sleep_timer
+                    )
+                    wait = sleep_timer
+                    if deadline is not None:
+                        wait, final = self._deadline_cooldown(
+                            endpoint, deadline, wait, final, error=e
+                        )
+                    if hooks is not None:
+                        hooks.retry(self, context, wait, error=e)
+                    await asyncio.sleep(wait)
+                    continue
+
+                cooldown = self._response_cooldown(
+                    endpoint, response, http_attempts, sleep_timer
+                )
+                if cooldown is None:
+                    break
+                wait, sleep_timer = cooldown
+                if deadline is not None:
+                    wait, final = self._deadline_cooldown(
+                        endpoint, deadline, wait, final, response
+                    )
+                if hooks is not None:
+                    self._retry_hooks(context, wait, response)
+                await asyncio.sleep(wait)
+        except Exception as e:
+            if hooks is not None:
+                hooks.request_end(self, context, error=e)
+            raise
+        if hooks is not None:
+            hooks.request_end(self, context, response=response)
+        return response
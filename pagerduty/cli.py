@@ -1,22 +1,81 @@
 #!/usr/bin/env python3
 
 import argparse
+import json
 import socket
 import sys
+from collections import deque
 from .events_api_v2_client import EventsApiV2Client
 
 HOSTNAME = socket.gethostname()
 DEFAULT_SOURCE = f"pagerduty.cli on {HOSTNAME}"
 
 
+def send_batch(client: EventsApiV2Client, lines, concurrency: int) -> bool:
+    """
+    Send events read from newline-delimited JSON, reporting per-line results.
+
+    Each non-blank line must be an event object as accepted by
+    :attr:`pagerduty.EventsApiV2Client.submit_many`. For each such line, a JSON
+    object is printed with the line number and either the deduplication key
+    of the event or the error that occurred while parsing or sending it.
+
+    :param client:
+        The Events API client through which to send all the events
+    :param lines:
+        An iterable of lines of text, i.e. a file object
+    :param concurrency:
+        The maximum number of events to send at the same time
+    :returns:
+        True if all events were sent successfully, False otherwise
+    """
+    # Line numbers and parse errors, in the order read; lines are read lazily
+    # as events can be sent, so this holds at most a window of the input.
+    pending = deque()
+    success = True
+
+    def events():
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError as e:
+                pending.append((line_number, e))
+                continue
+            pending.append((line_number, None))
+            yield event
+
+    def report(line_number, result):
+        nonlocal success
+        if isinstance(result, Exception):
+            success = False
+            output = {"line": line_number, "error": str(result)}
+        else:
+            output = {"line": line_number, "dedup_key": result}
+        print(json.dumps(output), flush=True)
+
+    def report_parse_errors():
+        while pending and pending[0][1] is not None:
+            report(*pending.popleft())
+
+    for result in client.iter_submit_many(events(), concurrency=concurrency):
+        report_parse_errors()
+        report(pending.popleft()[0], result)
+    report_parse_errors()
+    return success
+
+
 def run(argv):
     parser = argparse.ArgumentParser(
         description="PagerDuty Events API V2 Command Line Interface"
     )
     parser.add_argument(
         "action",
-        choices=["trigger", "acknowledge", "resolve"],
-        help="Action to perform: trigger, acknowledge, or resolve an incident",
+        choices=["trigger", "acknowledge", "resolve", "send-batch"],
+        help="Action to perform: trigger, acknowledge, or resolve an "
+        "incident, or send-batch to send events read as newline-delimited "
+        "JSON",
     )
     parser.add_argument(
         "-k",
@@ -36,6 +95,19 @@ def run(argv):
     parser.add_argument(
         "--source", help="Source of the alert", default=DEFAULT_SOURCE
     )
+    parser.add_argument(
+        "-f",
+        "--file",
+        default="-",
+        help="File from which send-batch reads events (default: stdin)",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Maximum number of events that send-batch sends at once",
+    )
 
     args = parser.parse_args(argv)
 
@@ -75,6 +147,17 @@ def run(argv):
                 f"Alert resolved successfully. Deduplication key: {dedup_key}"
             )
 
+        elif args.action == "send-batch":
+            if args.concurrency < 1:
+                parser.error("-c/--concurrency must be at least 1")
+            if args.file == "-":
+                success = send_batch(client, sys.stdin, args.concurrency)
+            else:
+                with open(args.file) as lines:
+                    success = send_batch(client, lines, args.concurrency)
+            if not success:
+                sys.exit(1)
+
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
@@ -1,6 +1,9 @@
 # Core
 import functools
+import inspect
+import math
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Callable, List, Optional, Tuple, Union
 from warnings import warn
 from json.decoder import JSONDecodeError
@@ -219,7 +222,16 @@ def requires_success(method: Callable[..., Any]) -> Callable[..., Any]:
     Decorator that validates HTTP responses.
 
     Uses :attr:`pagerduty.common.successful_response` for said validation.
+    If the decorated function is a coroutine function, the resulting function
+    will also be a coroutine function.
     """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def call_async(self, url, **kw):
+            return successful_response(await method(self, url, **kw))
+
+        return call_async
 
     @functools.wraps(method)
     def call(self, url, **kw):
@@ -228,6 +240,61 @@ def requires_success(method: Callable[..., Any]) -> Callable[..., Any]:
     return call
 
 
+def retry_after(
+    response: Response, maximum: Optional[float] = None
+) -> Optional[float]:
+    """
+    The time to wait before making another request, according to the API.
+
+    This is read from the ``Retry-After`` header, which may be either a number
+    of seconds or a HTTP date, or otherwise the ``ratelimit-reset`` header
+    (the number of seconds until the rate limit resets) if the response
+    indicates that the rate limit has been reached, i.e. the status is 429 or
+    the ``ratelimit-remaining`` header is zero.
+
+    Negative times and dates in the past are treated as zero, and values that
+    aren't finite numbers are ignored.
+
+    :param response:
+        The response object
+    :param maximum:
+        If specified, longer times are reduced to this.
+    :returns:
+        The number of seconds to wait, or ``None`` if the response headers do
+        not indicate how long to wait.
+    """
+    headers = response.headers
+    value = headers.get("retry-after")
+    wait = None
+    if value:
+        try:
+            wait = float(value)
+        except ValueError:
+            try:
+                until = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if until.tzinfo is None:
+                until = until.replace(tzinfo=timezone.utc)
+            wait = (until - datetime.now(timezone.utc)).total_seconds()
+    else:
+        reset = headers.get("ratelimit-reset")
+        if reset is not None and (
+            response.status_code == 429
+            or str(headers.get("ratelimit-remaining", "")).strip() == "0"
+        ):
+            try:
+                wait = float(reset)
+            except ValueError:
+                return None
+    if wait is None or not math.isfinite(wait):
+        return None
+    wait = max(0.0, wait)
+    if maximum is not None:
+        wait = min(wait, maximum)
+    return wait
+
+
 def singular_name(r_name: str) -> str:
     """
     Singularizes a name, i.e. for the entity wrapper in a POST request
@@ -0,0 +1,183 @@
+# Core
+import threading
+from typing import Optional
+
+# PyPI
+from httpx2 import (
+    AsyncBaseTransport,
+    AsyncHTTPTransport,
+    BaseTransport,
+    HTTPTransport,
+    Limits,
+    Request,
+    Response,
+)
+
+
+class ConnectionPool(object):
+    """
+    Pool of HTTP connections that can be shared between client objects.
+
+    By default, each client object maintains its own pool of connections, so
+    that an application using several clients (i.e. a
+    :class:`pagerduty.RestApiV2Client` and a :class:`pagerduty.ScimApiClient`)
+    keeps separate connections to the same host. Clients constructed with the
+    same connection pool, via the ``connection_pool`` constructor keyword
+    argument, instead make their requests through a single HTTPX transport, so
+    that connections (and their TLS handshakes) are reused between them and the
+    total number of connections is bounded by :attr:`limits`:
+
+    .. code-block:: python
+
+        pool = pagerduty.ConnectionPool(max_connections=20)
+        rest_client = pagerduty.RestApiV2Client(API_KEY, connection_pool=pool)
+        events_client = pagerduty.EventsApiV2Client(
+            ROUTING_KEY, connection_pool=pool
+        )
+
+    Closing a client that uses the pool does not close the pool, so that the
+    other clients using it are unaffected; the pool should instead be closed
+    with :attr:`close` (and, if used by asynchronous clients, :attr:`aclose`)
+    once no longer needed. It can also be used as a context manager, which
+    closes its synchronous connections upon exit.
+
+    The underlying transports are created upon first use. Synchronous clients
+    share one transport, which is thread-safe, and asynchronous clients share
+    another, which should only be used within a single event loop.
+
+    :param max_connections:
+        The maximum number of concurrent connections, or ``None`` for no limit.
+    :param max_keepalive_connections:
+        The maximum number of idle connections kept open for reuse, or ``None``
+        for no limit.
+    :param keepalive_expiry:
+        The time in seconds after which idle connections are closed, or
+        ``None`` to keep them open indefinitely.
+    :param transport_kw:
+        Additional keyword arguments for constructing the transports, i.e.
+        ``http2``, ``verify`` or ``retries``; see ``httpx2.HTTPTransport``.
+    """
+
+    limits = None
+    """
+    The ``httpx2.Limits`` object with the size and keep-alive settings of the
+    pool.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        **transport_kw,
+    ):
+        if max_connections is not None and max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        if max_keepalive_connections is not None:
+            if max_keepalive_connections < 0:
+                raise ValueError("max_keepalive_connections must be >= 0")
+        if "limits" in transport_kw:
+            raise ValueError(
+                "Specify limits using the max_connections, "
+                "max_keepalive_connections and keepalive_expiry arguments"
+            )
+        self.limits = Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport_kw = transport_kw
+        self._lock = threading.Lock()
+        self._sync_transport = None
+        self._async_transport = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Close the connections of the pool used by asynchronous clients.
+        """
+        with self._lock:
+            transport, self._async_transport = self._async_transport, None
+        if transport is not None:
+            await transport.aclose()
+
+    @property
+    def async_transport(self) -> AsyncBaseTransport:
+        """
+        A transport for an asynchronous client to make requests through the
+        pool.
+
+        Each access returns a new wrapper of the same underlying transport,
+        which the client can close without affecting the pool.
+        """
+        with self._lock:
+            if self._async_transport is None:
+                self._async_transport = AsyncHTTPTransport(
+                    limits=self.limits, **self._transport_kw
+                )
+            return _AsyncSharedTransport(self._async_transport)
+
+    def close(self):
+        """
+        Close the connections of the pool used by synchronous clients.
+        """
+        with self._lock:
+            transport, self._sync_transport = self._sync_transport, None
+        if transport is not None:
+            transport.close()
+
+    @property
+    def transport(self) -> BaseTransport:
+        """
+        A transport for a synchronous client to make requests through the pool.
+
+        Each access returns a new wrapper of the same underlying transport,
+        which the client can close without affecting the pool.
+        """
+        with self._lock:
+            if self._sync_transport is None:
+                self._sync_transport = HTTPTransport(
+                    limits=self.limits, **self._transport_kw
+                )
+            return _SharedTransport(self._sync_transport)
+
+
+class _SharedTransport(BaseTransport):
+    """
+    Transport that delegates to a pool's transport but doesn't close it.
+    """
+
+    def __init__(self, transport: HTTPTransport):
+        self._transport = transport
+
+    def close(self):
+        pass
+
+    def handle_request(self, request: Request) -> Response:
+        return self._transport.handle_request(request)
+
+
+class _AsyncSharedTransport(AsyncBaseTransport):
+    """
+    Asynchronous counterpart of :class:`_SharedTransport`.
+    """
+
+    def __init__(self, transport: AsyncHTTPTransport):
+        self._transport = transport
+
+    async def aclose(self):
+        pass
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self._transport.handle_async_request(request)
@@ -35,6 +35,21 @@ class Error(Exception):
         super(Error, self).__init__(message)
 
 
+class DeadlineExceededError(Error):
+    """
+    Error raised when a request cannot be completed within its total timeout.
+
+    This is raised by the request methods of clients with a total timeout
+    (see :attr:`pagerduty.ApiClient.total_timeout`) if the time spent making
+    the request, including all retries and the cooldowns between them, would
+    otherwise exceed it. If a response was received before the time ran out,
+    i.e. one with a status that would have been retried, it is set as the
+    ``response`` property of the error.
+    """
+
+    pass
+
+
 class HttpError(Error):
     """
     Error class representing errors strictly associated with HTTP responses.
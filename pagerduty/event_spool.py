@@ -0,0 +1,299 @@
+# Core
+import json
+import logging
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+
+SpoolPosition = Tuple[int, int]
+"""
+Position in an event spool: the sequence number of a segment file, and a byte
+offset within it.
+"""
+
+
+class EventSpool(object):
+    """
+    Durable, append-only local queue of events to be sent to the Events API.
+
+    Events are appended as lines of JSON to segment files in a directory, and
+    the position of the next event to send is kept in an index file in the
+    same directory. Segment files are deleted once all the events in them have
+    been sent, and a new one is started whenever the current one exceeds
+    ``segment_size`` bytes.
+
+    To balance throughput with durability, appended events are not flushed to
+    disk individually. Rather, the segment file is synced (``fsync``) after
+    every ``sync_every`` events or after ``sync_interval`` seconds have
+    elapsed since the last sync, whichever comes first, and when the spool is
+    closed.
+
+    Because the index is updated after events are sent, an event may be sent
+    again if the process exits between sending it and updating the index; in
+    other words, delivery is at-least-once. Alert events sent through a
+    spooling client always have a deduplication key, so sending one again has
+    no additional effect.
+
+    Lines in segment files that can't be decoded, i.e. because the previous
+    process exited partway through writing them, are skipped with an error
+    logged for each, and the events after them are still read.
+
+    The spool may be used from multiple threads, but each directory should only
+    be used by one spool object (and one process) at a time. It does not store
+    the routing key; events are sent using the routing key of the client that
+    sends them, so a separate directory should be used for each routing key.
+
+    :param directory:
+        The directory in which to keep the spool. It will be created if it does
+        not exist. If it already contains a spool, i.e. from a previous run of
+        the program, any events in it that were not yet sent will be sent.
+    :param segment_size:
+        The size in bytes beyond which a new segment file is started.
+    :param sync_every:
+        The maximum number of events appended between syncs to disk.
+    :param sync_interval:
+        The maximum time in seconds between syncs to disk while there are
+        appended events that haven't been synced.
+    """
+
+    index_file = "index.json"
+    """The name of the file in which the position of the next event is kept."""
+
+    segment_suffix = ".ndjson"
+    """The file name extension of segment files."""
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = 4 * 1024 * 1024,
+        sync_every: int = 100,
+        sync_interval: float = 1.0,
+    ):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.log = logging.getLogger(__name__)
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._skipped = set()
+        self._appended = threading.Event()
+        self._cursor = self._load_index()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        # Always start a new segment, in case the final line of the last one
+        # was only partially written before the previous process exited:
+        segments = self._segments()
+        self._segment = max(segments + [self._cursor[0]]) + 1
+        self._file = open(self._segment_path(self._segment), "ab")
+        if self._cursor[0] not in segments:
+            self._cursor = (self._first_segment(segments), 0)
+        self._appended.set()
+
+    def _first_segment(self, segments: List[int]) -> int:
+        remaining = [s for s in segments if s >= self._cursor[0]]
+        if remaining:
+            return min(remaining)
+        return self._segment
+
+    def _skip(self, segment: int, offset: int, reason: str):
+        """
+        Log that a line in a segment file is being skipped, once per line.
+        """
+        if (segment, offset) in self._skipped:
+            return
+        self._skipped.add((segment, offset))
+        self.log.error(
+            "Skipping %s line in event spool segment %s at byte offset %d; "
+            "the event in it cannot be sent.",
+            reason,
+            self._segment_path(segment),
+            offset,
+        )
+
+    def _load_index(self) -> SpoolPosition:
+        try:
+            with open(os.path.join(self.directory, self.index_file)) as f:
+                index = json.load(f)
+            return (int(index["segment"]), int(index["offset"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return (0, 0)
+
+    def _save_index(self):
+        path = os.path.join(self.directory, self.index_file)
+        with open(path + ".tmp", "w") as f:
+            json.dump(
+                {"segment": self._cursor[0], "offset": self._cursor[1]}, f
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+        self._sync_directory()
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(
+            self.directory, "%012d%s" % (segment, self.segment_suffix)
+        )
+
+    def _segments(self) -> List[int]:
+        segments = []
+        for name in os.listdir(self.directory):
+            if name.endswith(self.segment_suffix):
+                try:
+                    segments.append(int(name[: -len(self.segment_suffix)]))
+                except ValueError:
+                    pass
+        return sorted(segments)
+
+    def _sync_directory(self):
+        """
+        Sync the directory, so that renaming the index file is durable.
+        """
+        if not hasattr(os, "O_DIRECTORY"):
+            # Directories can't be opened for syncing, i.e. on Windows:
+            return
+        fd = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, path: str, body: dict):
+        """
+        Add an event to the end of the spool.
+
+        :param path:
+            The path of the Events API endpoint to send the event to, i.e.
+            ``/v2/enqueue``
+        :param body:
+            The body of the request to send.
+        :raises ValueError:
+            If the spool has been closed.
+        """
+        line = json.dumps({"path": path, "body": body}).encode() + b"\n"
+        with self._lock:
+            if self._file.closed:
+                raise ValueError(
+                    f"Cannot append to the event spool in {self.directory} "
+                    "because it has been closed."
+                )
+            if self._file.tell() >= self.segment_size:
+                self._sync()
+                self._file.close()
+                self._segment += 1
+                self._file = open(self._segment_path(self._segment), "ab")
+            self._file.write(line)
+            self._unsynced += 1
+            if (
+                self._unsynced >= self.sync_every
+                or time.monotonic() - self._last_sync >= self.sync_interval
+            ):
+                self._sync()
+        self._appended.set()
+
+    def close(self):
+        """
+        Sync any events that have not yet been synced, and close the spool.
+
+        No more events can be appended after closing, but events can still be
+        read and committed.
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
+        # Wake any thread waiting for events, so that it can stop:
+        self._appended.set()
+
+    def commit(self, position: SpoolPosition):
+        """
+        Record that all events up to a given position have been sent.
+
+        Segment files containing only events before that position are deleted.
+        Because this writes and syncs the index file, it should be called once
+        per batch of events returned by :attr:`read` rather than for each.
+
+        :param position:
+            A position returned by :attr:`read`.
+        """
+        with self._lock:
+            previous = self._cursor[0]
+            self._cursor = position
+            self._save_index()
+            for segment in range(previous, position[0]):
+                try:
+                    os.remove(self._segment_path(segment))
+                except FileNotFoundError:
+                    pass
+
+    def read(self, limit: int = 100) -> List[Tuple[SpoolPosition, str, dict]]:
+        """
+        Read the events that have not yet been sent, in order.
+
+        :param limit:
+            The maximum number of events to read.
+        :returns:
+            A list of tuples each containing the position after the event (to
+            pass to :attr:`commit` after sending it), the path to send it to
+            and the body of the request.
+        """
+        events = []
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+            segments = [s for s in self._segments() if s >= self._cursor[0]]
+            for segment in segments:
+                offset = self._cursor[1] if segment == self._cursor[0] else 0
+                with open(self._segment_path(segment), "rb") as f:
+                    f.seek(offset)
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            # Incomplete; the previous process exited while
+                            # writing it, so it can't have been acknowledged:
+                            if segment != self._segment:
+                                self._skip(segment, offset, "an incomplete")
+                            break
+                        try:
+                            record = json.loads(line)
+                            path, body = record["path"], record["body"]
+                        except (ValueError, KeyError, TypeError):
+                            self._skip(segment, offset, "an undecodable")
+                            offset += len(line)
+                            continue
+                        offset += len(line)
+                        events.append(((segment, offset), path, body))
+                        if len(events) >= limit:
+                            return events
+            if not (events or self._file.closed):
+                self._appended.clear()
+        return events
+
+    def sync(self):
+        """
+        Sync appended events to disk if the sync interval has elapsed.
+        """
+        with self._lock:
+            if (
+                self._unsynced
+                and not self._file.closed
+                and time.monotonic() - self._last_sync >= self.sync_interval
+            ):
+                self._sync()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until there may be events to read.
+
+        :param timeout:
+            The maximum time to wait, in seconds.
+        :returns:
+            False if the timeout elapsed without any events being appended.
+        """
+        return self._appended.wait(timeout)
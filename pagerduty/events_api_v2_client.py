@@ -1,15 +1,24 @@
 # Core
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
-from typing import List, Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+from uuid import uuid4
 
 # PyPI
+from httpx2 import Response
 
 # Local
-from .api_client import ApiClient
+from .api_client import ApiClient, AsyncApiClient
 from .auth_method import BodyParameterAuthMethod
 from .common import successful_response, try_decoding, truncate_text
-from .errors import ServerHttpError
+from .errors import Error, ServerHttpError
+from .event_spool import EventSpool, SpoolPosition
 
 
 class RoutingKeyAuthMethod(BodyParameterAuthMethod):
@@ -24,7 +33,218 @@ class RoutingKeyAuthMethod(BodyParameterAuthMethod):
         return {"routing_key": self.secret}
 
 
-class EventsApiV2Client(ApiClient):
+class EventsApiV2ClientMixin:
+    """
+    Features of Events API v2 clients that are independent of I/O model.
+
+    This class composes and validates the events and change events that are
+    sent by :class:`EventsApiV2Client` and :class:`AsyncEventsApiV2Client`,
+    and validates the responses.
+    """
+
+    def _batch_event_args(
+        self, event: dict
+    ) -> Tuple[str, Optional[str], dict]:
+        """
+        Split an event given to submit_many() into arguments to send_event().
+
+        :param event:
+            An event, formatted as the body of a request to the Events API
+        :returns:
+            A tuple containing the event action, deduplication key and other
+            properties of the event
+        """
+        if not isinstance(event, dict):
+            raise ValueError("Each event must be a dict")
+        properties = dict(event)
+        action = properties.pop("event_action", None)
+        dedup_key = properties.pop("dedup_key", None)
+        return action, dedup_key, properties
+
+    def _change_event(
+        self,
+        payload: Optional[dict] = None,
+        links: Optional[List[dict]] = None,
+        images: Optional[List[dict]] = None,
+    ) -> dict:
+        """
+        Compose a change event.
+
+        See: :attr:`EventsApiV2Client.send_change_event`
+        """
+        if payload is None:
+            payload = {}
+        if links is None:
+            links = []
+        if images is None:
+            images = []
+        event = {"payload": deepcopy(payload)}
+        if links:
+            event["links"] = deepcopy(links)
+        if images:
+            event["images"] = deepcopy(images)
+        return event
+
+    @staticmethod
+    def _check_concurrency(concurrency: int):
+        """
+        Validate the number of events to send at the same time in a batch.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+    def _dedup_key(self, response: Response) -> str:
+        """
+        Extract the deduplication key from a response to a submitted event.
+
+        :param response:
+            The successful response from the Events API
+        """
+        response_body = try_decoding(response)
+        if type(response_body) is not dict or "dedup_key" not in response_body:
+            err_msg = (
+                "Malformed response body from the events API; it is "
+                'not a dict that has a key named "dedup_key" after '
+                "decoding. Body = " + truncate_text(response.text)
+            )
+            raise ServerHttpError(err_msg, response)
+        return response_body["dedup_key"]
+
+    def _event(
+        self, action: str, dedup_key: Optional[str] = None, **properties
+    ) -> dict:
+        """
+        Compose and validate an alert event.
+
+        See: :attr:`EventsApiV2Client.send_event`
+        """
+        actions = ("trigger", "acknowledge", "resolve")
+        if action not in actions:
+            raise ValueError(
+                "Event action must be one of: " + ", ".join(actions)
+            )
+
+        event = {"event_action": action}
+
+        event.update(properties)
+        if isinstance(dedup_key, str):
+            event["dedup_key"] = dedup_key
+        elif not action == "trigger":
+            raise ValueError(
+                "The dedup_key property is required for"
+                "event_action=%s events, and it must be a string." % action
+            )
+        return event
+
+    def _init_retry(self):
+        """
+        Set up the retry behavior recommended for the Events API.
+        """
+        # See: https://developer.pagerduty.com/docs/3d063fd4814a6-events-api-v2-overview#response-codes--retry-logic
+        self.retry[500] = 2  # internal server error
+        self.retry[502] = 4  # bad gateway
+        self.retry[503] = 6  # service unavailable
+        self.retry[504] = 6  # gateway timeout
+
+    def _submit_properties(
+        self,
+        summary: str,
+        source: Optional[str] = None,
+        custom_details: Optional[dict] = None,
+        links: Optional[List[dict]] = None,
+        timestamp: Optional[str] = None,
+    ) -> dict:
+        """
+        Compose the arguments to the change event method from submit().
+
+        See: :attr:`EventsApiV2Client.submit`
+        """
+        if not (custom_details is None or isinstance(custom_details, dict)):
+            raise ValueError("custom_details must be a dict")
+        if timestamp is None:
+            timestamp = self.event_timestamp
+        event = {
+            "payload": {
+                "summary": summary,
+                "timestamp": timestamp,
+            }
+        }
+        if isinstance(source, str):
+            event["payload"]["source"] = source
+        if isinstance(custom_details, dict):
+            event["payload"]["custom_details"] = custom_details
+        if links:
+            event["links"] = links
+        return event
+
+    def _supersedes(self, event: dict, pending: dict) -> bool:
+        """
+        Whether an event makes a pending event with the same key redundant.
+
+        An event replaces a pending one with the same action (the last one
+        wins), and a resolve replaces any pending event, since it ends the
+        alert regardless. Otherwise, i.e. an acknowledge or trigger following
+        a different action, both events must be sent to preserve their effect.
+
+        :param event:
+            The new event
+        :param pending:
+            The event waiting to be sent
+        """
+        return event["event_action"] in (pending["event_action"], "resolve")
+
+    def _trigger_properties(
+        self,
+        summary: str,
+        source: str,
+        severity: str = "critical",
+        payload: Optional[dict] = None,
+        custom_details: Optional[dict] = None,
+        images: Optional[List[dict]] = None,
+        links: Optional[List[dict]] = None,
+    ) -> dict:
+        """
+        Compose the properties of a trigger event from trigger().
+
+        See: :attr:`EventsApiV2Client.trigger`
+        """
+        for local in ("payload", "custom_details"):
+            local_var = locals()[local]
+            if not (local_var is None or type(local_var) is dict):
+                raise ValueError(local + " must be a dict")
+        event = {
+            "payload": {
+                "summary": summary,
+                "source": source,
+                "severity": severity,
+            }
+        }
+        if type(payload) is dict:
+            event["payload"].update(payload)
+        if type(custom_details) is dict:
+            details = event.setdefault("payload", {}).get("custom_details", {})
+            details.update(custom_details)
+            event["payload"]["custom_details"] = details
+        if images:
+            event["images"] = images
+        if links:
+            event["links"] = links
+        return event
+
+    @property
+    def default_base_url(self) -> str:
+        return "https://events.pagerduty.com"
+
+    @property
+    def event_timestamp(self) -> str:
+        return datetime.utcnow().isoformat() + "Z"
+
+    @property
+    def permitted_methods(self) -> tuple:
+        return ("POST",)
+
+
+class EventsApiV2Client(EventsApiV2ClientMixin, ApiClient):
     """
     Client class for submitting events to the PagerDuty v2 Events API.
 
@@ -34,6 +254,9 @@ class EventsApiV2Client(ApiClient):
     to the `Events API v2 documentation
     <https://developer.pagerduty.com/docs/events-api-v2/overview/>`_
 
+    For an asynchronous client with the same methods, see
+    :class:`AsyncEventsApiV2Client`.
+
     :param routing_key:
         The routing key to use for authentication with the Events API.
         Sometimes called an ``integration_key`` or ``service_key`` in legacy
@@ -43,52 +266,455 @@ class EventsApiV2Client(ApiClient):
         verbose command line output.
     :param base_url:
         Sets the base API URL to be used by the client for all API calls.
+    :param spool:
+        Sets :attr:`spool`.
+    :param coalesce_window:
+        Sets :attr:`coalesce_window`.
+    """
+
+    coalesce_window = 0.0
+    """
+    Time in seconds for which to hold events so that repeated ones coalesce.
+
+    If nonzero, events that have a deduplication key are not sent right away;
+    instead, each is held for up to this long, and if more events with the
+    same deduplication key are sent in the mean time, only the last one is
+    sent. A resolve event supersedes a held trigger or acknowledge event, but
+    a trigger or acknowledge is never coalesced with an event of a different
+    action, since doing so could change the outcome; rather, the held event is
+    sent first.
+
+    This reduces the number of requests made when the same alert is triggered
+    repeatedly in quick succession. Held events are sent by a background
+    thread, so errors sending them are logged instead of raised. Events still
+    held when the client is closed are sent immediately, before it closes.
+
+    Events without a deduplication key, i.e. triggers for new alerts, and
+    change events are never held.
+    """
+
+    spool = None
+    """
+    Optional :class:`pagerduty.EventSpool` to send events through.
+
+    If set, events are written to the spool rather than sent directly, and are
+    then sent in order by a background thread. Methods that send events return
+    as soon as the event is written, and if the API cannot be reached, the
+    thread retries with increasing delays (up to :attr:`spool_max_backoff`)
+    until it succeeds. Events that the API rejects as invalid (status 4xx
+    other than 408 or 429) are logged and discarded.
+
+    Because events are sent after the method returns, errors from the API are
+    not raised to the caller, and :attr:`send_event` returns the deduplication
+    key sent with the event instead of the one returned by the API. If a
+    trigger event has no deduplication key, a random one is generated.
+    """
+
+    spool_max_backoff = 300.0
+    """
+    The maximum delay in seconds between attempts to send spooled events.
+    """
+
+    spool_send_timeout = 60.0
+    """
+    The maximum time in seconds spent sending each spooled event, including
+    retries (see :attr:`pagerduty.ApiClient.total_timeout`).
+
+    This also bounds how long closing the client waits for the background
+    thread to finish sending the event that it is currently sending.
     """
 
     def __init__(
-        self, routing_key: str, debug: bool = False, base_url=None, **kw
+        self,
+        routing_key: str,
+        debug: bool = False,
+        base_url=None,
+        spool: Optional[EventSpool] = None,
+        coalesce_window: float = 0.0,
+        **kw,
     ):
         auth_method = RoutingKeyAuthMethod(routing_key)
         super(EventsApiV2Client, self).__init__(
             auth_method, debug=debug, base_url=base_url, **kw
         )
-        # See: https://developer.pagerduty.com/docs/3d063fd4814a6-events-api-v2-overview#response-codes--retry-logic
-        self.retry[500] = 2  # internal server error
-        self.retry[502] = 4  # bad gateway
-        self.retry[503] = 6  # service unavailable
-        self.retry[504] = 6  # gateway timeout
+        self._init_retry()
+        self.coalesce_window = coalesce_window
+        self._coalesced = {}
+        self._coalesce_cv = threading.Condition()
+        self._coalesce_thread = None
+        self._coalesce_outbox = deque()
+        self._coalesce_send_lock = threading.Lock()
+        self._spool_thread = None
+        self._spool_stop = threading.Event()
+        if spool is not None:
+            self.spool = spool
+            self._spool_thread = threading.Thread(
+                target=self._drain_spool, daemon=True
+            )
+            self._spool_thread.start()
+
+    def __exit__(self, *args):
+        self._stop_coalescing()
+        self._stop_spool()
+        super(EventsApiV2Client, self).__exit__(*args)
+
+    def _coalesce(self, event: dict) -> str:
+        """
+        Hold an event to be sent after :attr:`coalesce_window` elapses.
+
+        :param event:
+            The event, which must have a deduplication key
+        :returns:
+            The deduplication key
+        """
+        dedup_key = event["dedup_key"]
+        with self._coalesce_cv:
+            if self._coalesce_thread is None:
+                self._coalesce_thread = threading.Thread(
+                    target=self._send_coalesced, daemon=True
+                )
+                self._coalesce_thread.start()
+            deadline = time.monotonic() + self.coalesce_window
+            if dedup_key in self._coalesced:
+                held_deadline, held = self._coalesced[dedup_key]
+                if self._supersedes(event, held):
+                    # Keep the original deadline so that a steady stream of
+                    # events for the same alert can't hold it indefinitely:
+                    deadline = held_deadline
+                else:
+                    # Release the held event ahead of this one, so that i.e.
+                    # a resolve can't be sent before the trigger it follows:
+                    self._coalesce_outbox.append(held)
+            self._coalesced[dedup_key] = (deadline, event)
+            self._coalesce_cv.notify()
+        self._send_held()
+        return dedup_key
+
+    def _drain_spool(self):
+        """
+        Send events from the spool until the client is closed.
+
+        This is the target of the background thread started in the constructor
+        when :attr:`spool` is set. Each batch of events read from the spool is
+        committed once, after sending as many of them as possible.
+        """
+        backoff = self.sleep_timer
+        while not self._spool_stop.is_set():
+            try:
+                self.spool.sync()
+                events = self.spool.read()
+            except OSError as e:
+                # i.e. the disk is full or permissions have changed; keep the
+                # thread alive so that sending resumes once it's resolved:
+                self.log.error("Could not read the event spool: %s", e)
+                events, done = [], False
+            else:
+                if not events:
+                    self.spool.wait(self.spool.sync_interval)
+                    continue
+                position, done = self._send_spooled(events)
+                if position is not None:
+                    try:
+                        self.spool.commit(position)
+                    except OSError as e:
+                        self.log.error(
+                            "Could not record sent events in the event "
+                            "spool: %s",
+                            e,
+                        )
+                        done = False
+                    else:
+                        backoff = self.sleep_timer
+            if not done:
+                self._spool_stop.wait(backoff)
+                backoff = min(
+                    backoff * self.cooldown_factor(), self.spool_max_backoff
+                )
+
+    def _send_coalesced(self):
+        """
+        Send held events as their coalescing windows elapse.
 
-    def acknowledge(self, dedup_key: str) -> str:
+        This is the target of the background thread started by
+        :attr:`_coalesce`; it stops when the client is closed.
+        """
+        while True:
+            with self._coalesce_cv:
+                while True:
+                    if self._coalesce_thread is None:
+                        return
+                    now = time.monotonic()
+                    due = [
+                        key
+                        for key, (deadline, _) in self._coalesced.items()
+                        if deadline <= now
+                    ]
+                    if due:
+                        break
+                    timeout = None
+                    if self._coalesced:
+                        timeout = (
+                            min(d for d, _ in self._coalesced.values()) - now
+                        )
+                    self._coalesce_cv.wait(timeout)
+                self._coalesce_outbox.extend(
+                    self._coalesced.pop(key)[1] for key in due
+                )
+            self._send_held()
+
+    def _send_event(
+        self, event: dict, total_timeout: Optional[float] = None
+    ) -> str:
+        """
+        Send an event now, or write it to :attr:`spool` if set.
+
+        :param event:
+            The event to send
+        :param total_timeout:
+            The maximum time in seconds that sending the event may take
+        :returns:
+            The deduplication key
+        """
+        if self.spool is not None:
+            event.setdefault("dedup_key", uuid4().hex)
+            self.spool.append("/v2/enqueue", event)
+            return event["dedup_key"]
+        response = successful_response(
+            self.post("/v2/enqueue", json=event, total_timeout=total_timeout),
+            context="submitting an event to the events API",
+        )
+        return self._dedup_key(response)
+
+    def _send_held(self):
+        """
+        Send events released from coalescing, logging any errors.
+
+        Events are released by appending them to the outbox while holding the
+        condition that guards held events, and are sent one at a time in that
+        order by whichever thread acquires the send lock, so that events for
+        the same alert are never sent out of order.
+        """
+        with self._coalesce_send_lock:
+            while True:
+                with self._coalesce_cv:
+                    if not self._coalesce_outbox:
+                        return
+                    event = self._coalesce_outbox.popleft()
+                try:
+                    self._send_event(event)
+                except Error as e:
+                    self.log.error(
+                        "Error sending coalesced event (dedup_key=%s): %s",
+                        event["dedup_key"],
+                        e,
+                    )
+
+    def _send_spooled(
+        self, events: List[Tuple[SpoolPosition, str, dict]]
+    ) -> Tuple[Optional[SpoolPosition], bool]:
+        """
+        Send a batch of events read from the spool, in order.
+
+        Sending stops at the first event that could not be sent and should be
+        retried, or when the client is closed.
+
+        :param events:
+            The events, as returned by :attr:`pagerduty.EventSpool.read`
+        :returns:
+            A tuple containing the position after the last event that was
+            either sent or rejected by the API (``None`` if there is none), and
+            whether all the events were.
+        """
+        position = None
+        for event_position, path, body in events:
+            if self._spool_stop.is_set():
+                return position, False
+            try:
+                response = self.request(
+                    "POST",
+                    path,
+                    json=body,
+                    total_timeout=self.spool_send_timeout,
+                )
+            except Error as e:
+                self.log.warning("Could not send spooled event: %s", e)
+                return position, False
+            if not response.is_success and (
+                response.status_code >= 500
+                or response.status_code in (408, 429)
+            ):
+                self.log.warning(
+                    "Could not send spooled event (HTTP %d)",
+                    response.status_code,
+                )
+                return position, False
+            if not response.is_success:
+                self.log.error(
+                    "Discarding spooled event rejected by the API "
+                    "(HTTP %d): %s",
+                    response.status_code,
+                    truncate_text(response.text),
+                )
+            position = event_position
+        return position, True
+
+    def _stop_coalescing(self):
+        """
+        Send all held events and stop the thread that sends them.
+        """
+        with self._coalesce_cv:
+            thread = self._coalesce_thread
+            self._coalesce_thread = None
+            self._coalesce_cv.notify()
+        if thread is not None:
+            thread.join()
+        self.flush_coalesced()
+
+    def _stop_spool(self):
+        """
+        Stop the background thread that sends spooled events, and close the
+        spool.
+        """
+        if self._spool_thread is not None:
+            self._spool_stop.set()
+            self.spool.close()
+            self._spool_thread.join(self.spool_send_timeout)
+            if self._spool_thread.is_alive():
+                self.log.warning(
+                    "Timed out waiting for the thread sending spooled events "
+                    "to stop; unsent events remain in the spool."
+                )
+            self._spool_thread = None
+
+    def acknowledge(
+        self, dedup_key: str, total_timeout: Optional[float] = None
+    ) -> str:
         """
         Acknowledge an alert via Events API.
 
         :param dedup_key:
             The deduplication key of the alert to set as acknowledged.
+        :param total_timeout:
+            The maximum time in seconds that sending the event may take,
+            including all retries; see :attr:`pagerduty.ApiClient.request`.
         :returns:
             The deduplication key
         """
-        return self.send_event("acknowledge", dedup_key=dedup_key)
+        return self.send_event(
+            "acknowledge", dedup_key=dedup_key, total_timeout=total_timeout
+        )
 
-    @property
-    def default_base_url(self) -> str:
-        return "https://events.pagerduty.com"
+    def close(self):
+        """
+        Close the client.
 
-    @property
-    def event_timestamp(self) -> str:
-        return datetime.utcnow().isoformat() + "Z"
+        If :attr:`spool` is set, the background thread that sends spooled
+        events is stopped (after it finishes sending the current event, if
+        any) and the spool is closed. Events not yet sent remain in the spool,
+        to be sent the next time a client is constructed with the same spool
+        directory.
+        """
+        self._stop_coalescing()
+        self._stop_spool()
+        super(EventsApiV2Client, self).close()
 
-    @property
-    def permitted_methods(self) -> tuple:
-        return ("POST",)
+    def flush_coalesced(self):
+        """
+        Send all events held for coalescing (see :attr:`coalesce_window`) now.
+
+        Errors sending each event are logged rather than raised.
+        """
+        with self._coalesce_cv:
+            self._coalesce_outbox.extend(
+                event for _, event in self._coalesced.values()
+            )
+            self._coalesced.clear()
+        self._send_held()
+
+    def flush_spool(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for all events in :attr:`spool` to be sent.
+
+        :param timeout:
+            The maximum time to wait, in seconds. If unspecified, wait
+            indefinitely.
+        :returns:
+            True if the spool is empty, or False if the timeout elapsed first.
+        """
+        if self.spool is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.spool.read(limit=1):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def iter_submit_many(
+        self, events: Iterable[dict], concurrency: int = 10
+    ) -> Iterator[Union[str, Exception]]:
+        """
+        Send many events to the v2 Events API, yielding results as they arrive.
+
+        This works like :attr:`submit_many`, except that events are taken from
+        the iterable only as they can be sent, and the result of each is
+        yielded, in order, as soon as it and those of all preceding events are
+        available. At most ``concurrency`` events are in flight at any given
+        time, so that arbitrarily long streams of events can be sent using a
+        bounded amount of memory.
+
+        :param events:
+            The events to send; see :attr:`submit_many`.
+        :param concurrency:
+            The maximum number of events to send at the same time.
+        :yields:
+            For each event, either the deduplication key returned by the API or
+            the exception raised while sending it; see :attr:`submit_many`.
+        """
+        self._check_concurrency(concurrency)
+
+        def send(event: dict) -> Union[str, Exception]:
+            try:
+                action, dedup_key, properties = self._batch_event_args(event)
+                return self.send_event(
+                    action, dedup_key=dedup_key, **properties
+                )
+            except (Error, TypeError, ValueError) as e:
+                return e
+
+        def results() -> Iterator[Union[str, Exception]]:
+            remaining = iter(events)
+            pool = ThreadPoolExecutor(max_workers=concurrency)
+            pending = deque(
+                pool.submit(send, event)
+                for event in islice(remaining, concurrency)
+            )
+            try:
+                while pending:
+                    result = pending.popleft().result()
+                    for event in islice(remaining, 1):
+                        pending.append(pool.submit(send, event))
+                    yield result
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
 
-    def resolve(self, dedup_key: str) -> str:
+        return results()
+
+    def resolve(
+        self, dedup_key: str, total_timeout: Optional[float] = None
+    ) -> str:
         """
         Resolve an alert via Events API.
 
         :param dedup_key:
             The deduplication key of the alert to resolve.
+        :param total_timeout:
+            The maximum time in seconds that sending the event may take,
+            including all retries; see :attr:`pagerduty.ApiClient.request`.
         """
-        return self.send_event("resolve", dedup_key=dedup_key)
+        return self.send_event(
+            "resolve", dedup_key=dedup_key, total_timeout=total_timeout
+        )
 
     def send_change_event(
         self,
@@ -111,24 +737,21 @@ class EventsApiV2Client(ApiClient):
         :param images:
             Optional list of images to attach to the change event.
         """
-        if payload is None:
-            payload = {}
-        if links is None:
-            links = []
-        if images is None:
-            images = []
-        event = {"payload": deepcopy(payload)}
-        if links:
-            event["links"] = deepcopy(links)
-        if images:
-            event["images"] = deepcopy(images)
+        event = self._change_event(payload=payload, links=links, images=images)
+        if self.spool is not None:
+            self.spool.append("/v2/change/enqueue", event)
+            return
         successful_response(
             self.post("/v2/change/enqueue", json=event),
             context="submitting change event",
         )
 
     def send_event(
-        self, action: str, dedup_key: Optional[str] = None, **properties
+        self,
+        action: str,
+        dedup_key: Optional[str] = None,
+        total_timeout: Optional[float] = None,
+        **properties,
     ) -> str:
         """
         Send an event to the v2 Events API.
@@ -141,6 +764,11 @@ class EventsApiV2Client(ApiClient):
         :param dedup_key:
             The deduplication key; used for determining event uniqueness and
             associating actions with existing incidents.
+        :param total_timeout:
+            The maximum time in seconds that sending the event may take,
+            including all retries; see :attr:`pagerduty.ApiClient.request`.
+            It does not apply to events that are coalesced or written to
+            :attr:`spool`, which are sent later.
         :param **properties:
             Additional properties to set, i.e. if ``action`` is ``trigger``
             this would include ``payload``.
@@ -149,36 +777,10 @@ class EventsApiV2Client(ApiClient):
         :returns:
             The deduplication key of the incident
         """
-
-        actions = ("trigger", "acknowledge", "resolve")
-        if action not in actions:
-            raise ValueError(
-                "Event action must be one of: " + ", ".join(actions)
-            )
-
-        event = {"event_action": action}
-
-        event.update(properties)
-        if isinstance(dedup_key, str):
-            event["dedup_key"] = dedup_key
-        elif not action == "trigger":
-            raise ValueError(
-                "The dedup_key property is required for"
-                "event_action=%s events, and it must be a string." % action
-            )
-        response = successful_response(
-            self.post("/v2/enqueue", json=event),
-            context="submitting an event to the events API",
-        )
-        response_body = try_decoding(response)
-        if type(response_body) is not dict or "dedup_key" not in response_body:
-            err_msg = (
-                "Malformed response body from the events API; it is "
-                'not a dict that has a key named "dedup_key" after '
-                "decoding. Body = " + truncate_text(response.text)
-            )
-            raise ServerHttpError(err_msg, response)
-        return response_body["dedup_key"]
+        event = self._event(action, dedup_key=dedup_key, **properties)
+        if self.coalesce_window > 0 and "dedup_key" in event:
+            return self._coalesce(event)
+        return self._send_event(event, total_timeout=total_timeout)
 
     def submit(
         self,
@@ -215,24 +817,46 @@ class EventsApiV2Client(ApiClient):
         :type links: list
         :type timestamp: str
         """
-        local_var = locals()["custom_details"]
-        if not (local_var is None or isinstance(local_var, dict)):
-            raise ValueError("custom_details must be a dict")
-        if timestamp is None:
-            timestamp = self.event_timestamp
-        event = {
-            "payload": {
-                "summary": summary,
-                "timestamp": timestamp,
-            }
-        }
-        if isinstance(source, str):
-            event["payload"]["source"] = source
-        if isinstance(custom_details, dict):
-            event["payload"]["custom_details"] = custom_details
-        if links:
-            event["links"] = links
-        self.send_change_event(**event)
+        self.send_change_event(
+            **self._submit_properties(
+                summary,
+                source=source,
+                custom_details=custom_details,
+                links=links,
+                timestamp=timestamp,
+            )
+        )
+
+    def submit_many(
+        self, events: Iterable[dict], concurrency: int = 10
+    ) -> List[Union[str, Exception]]:
+        """
+        Send many events to the v2 Events API, several at a time.
+
+        Events are sent in parallel using up to ``concurrency`` threads, which
+        share the client's connection pool. Each event is sent as with
+        :attr:`send_event`, including retrying the request according to
+        :attr:`pagerduty.ApiClient.retry`.
+
+        An error sending any one event does not prevent sending the others.
+        Rather, the exception is returned in place of that event's
+        deduplication key.
+
+        :param events:
+            The events to send. Each should be a dictionary formatted as the
+            body of a request to the Events API, i.e. with ``event_action``,
+            ``dedup_key`` and ``payload`` properties. The ``routing_key``
+            property will be set to the client's routing key.
+        :param concurrency:
+            The maximum number of events to send at the same time.
+        :returns:
+            A list with an entry for each event, in the same order as the
+            events, that is either the deduplication key returned by the API or
+            the exception (:class:`pagerduty.Error`, ``TypeError`` or
+            ``ValueError``) raised while sending it, i.e. if the event is
+            malformed.
+        """
+        return list(self.iter_submit_many(events, concurrency=concurrency))
 
     def trigger(
         self,
@@ -244,6 +868,7 @@ class EventsApiV2Client(ApiClient):
         custom_details: Optional[dict] = None,
         images: Optional[List[dict]] = None,
         links: Optional[List[dict]] = None,
+        total_timeout: Optional[float] = None,
     ) -> str:
         """
         Send an alert-triggering event
@@ -270,28 +895,200 @@ class EventsApiV2Client(ApiClient):
             Set the ``images`` property of the event.
         :param links:
             Set the ``links`` property of the event.
+        :param total_timeout:
+            The maximum time in seconds that sending the event may take,
+            including all retries; see :attr:`pagerduty.ApiClient.request`.
         :returns:
             The deduplication key of the incident, if any.
         """
-        for local in ("payload", "custom_details"):
-            local_var = locals()[local]
-            if not (local_var is None or type(local_var) is dict):
-                raise ValueError(local + " must be a dict")
-        event = {
-            "payload": {
-                "summary": summary,
-                "source": source,
-                "severity": severity,
-            }
-        }
-        if type(payload) is dict:
-            event["payload"].update(payload)
-        if type(custom_details) is dict:
-            details = event.setdefault("payload", {}).get("custom_details", {})
-            details.update(custom_details)
-            event["payload"]["custom_details"] = details
-        if images:
-            event["images"] = images
-        if links:
-            event["links"] = links
-        return self.send_event("trigger", dedup_key=dedup_key, **event)
+        event = self._trigger_properties(
+            summary,
+            source,
+            severity=severity,
+            payload=payload,
+            custom_details=custom_details,
+            images=images,
+            links=links,
+        )
+        return self.send_event(
+            "trigger",
+            dedup_key=dedup_key,
+            total_timeout=total_timeout,
+            **event,
+        )
+
+
+class AsyncEventsApiV2Client(EventsApiV2ClientMixin, AsyncApiClient):
+    """
+    Asynchronous client class for submitting events to the v2 Events API.
+
+    This is the `asyncio` counterpart of :class:`EventsApiV2Client`; it has the
+    same methods and constructor arguments, but all of its methods that send
+    events are coroutines, i.e.
+
+    .. code-block:: python
+
+        async with AsyncEventsApiV2Client(ROUTING_KEY) as client:
+            dedup_key = await client.trigger(
+                "Server is on fire", "dusty.old.server.net"
+            )
+    """
+
+    def __init__(
+        self, routing_key: str, debug: bool = False, base_url=None, **kw
+    ):
+        auth_method = RoutingKeyAuthMethod(routing_key)
+        super(AsyncEventsApiV2Client, self).__init__(
+            auth_method, debug=debug, base_url=base_url, **kw
+        )
+        self._init_retry()
+
+    async def acknowledge(
+        self, dedup_key: str, total_timeout: Optional[float] = None
+    ) -> str:
+        """
+        Acknowledge an alert via Events API.
+
+        See: :attr:`pagerduty.EventsApiV2Client.acknowledge`
+        """
+        return await self.send_event(
+            "acknowledge", dedup_key=dedup_key, total_timeout=total_timeout
+        )
+
+    async def resolve(
+        self, dedup_key: str, total_timeout: Optional[float] = None
+    ) -> str:
+        """
+        Resolve an alert via Events API.
+
+        See: :attr:`pagerduty.EventsApiV2Client.resolve`
+        """
+        return await self.send_event(
+            "resolve", dedup_key=dedup_key, total_timeout=total_timeout
+        )
+
+    async def send_change_event(
+        self,
+        payload: Optional[dict] = None,
+        links: Optional[List[dict]] = None,
+        images: Optional[List[dict]] = None,
+    ):
+        """
+        Send a change event to the v2 Change Events API.
+
+        See: :attr:`pagerduty.EventsApiV2Client.send_change_event`
+        """
+        successful_response(
+            await self.post(
+                "/v2/change/enqueue",
+                json=self._change_event(
+                    payload=payload, links=links, images=images
+                ),
+            ),
+            context="submitting change event",
+        )
+
+    async def send_event(
+        self,
+        action: str,
+        dedup_key: Optional[str] = None,
+        total_timeout: Optional[float] = None,
+        **properties,
+    ) -> str:
+        """
+        Send an event to the v2 Events API.
+
+        See: :attr:`pagerduty.EventsApiV2Client.send_event`
+        """
+        event = self._event(action, dedup_key=dedup_key, **properties)
+        response = successful_response(
+            await self.post(
+                "/v2/enqueue", json=event, total_timeout=total_timeout
+            ),
+            context="submitting an event to the events API",
+        )
+        return self._dedup_key(response)
+
+    async def submit(
+        self,
+        summary: str,
+        source: Optional[str] = None,
+        custom_details: Optional[dict] = None,
+        links: Optional[List[dict]] = None,
+        timestamp: Optional[str] = None,
+    ):
+        """
+        Submit a change event.
+
+        See: :attr:`pagerduty.EventsApiV2Client.submit`
+        """
+        await self.send_change_event(
+            **self._submit_properties(
+                summary,
+                source=source,
+                custom_details=custom_details,
+                links=links,
+                timestamp=timestamp,
+            )
+        )
+
+    async def submit_many(
+        self, events: Iterable[dict], concurrency: int = 10
+    ) -> List[Union[str, Exception]]:
+        """
+        Send many events to the v2 Events API, several at a time.
+
+        Up to ``concurrency`` events are sent concurrently as tasks in the
+        running event loop.
+
+        See: :attr:`pagerduty.EventsApiV2Client.submit_many`
+        """
+        self._check_concurrency(concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(event: dict) -> Union[str, Exception]:
+            async with semaphore:
+                try:
+                    action, dedup_key, properties = self._batch_event_args(
+                        event
+                    )
+                    return await self.send_event(
+                        action, dedup_key=dedup_key, **properties
+                    )
+                except (Error, TypeError, ValueError) as e:
+                    return e
+
+        return list(await asyncio.gather(*(send(e) for e in events)))
+
+    async def trigger(
+        self,
+        summary: str,
+        source: str,
+        dedup_key: Optional[str] = None,
+        severity: str = "critical",
+        payload: Optional[dict] = None,
+        custom_details: Optional[dict] = None,
+        images: Optional[List[dict]] = None,
+        links: Optional[List[dict]] = None,
+        total_timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Send an alert-triggering event
+
+        See: :attr:`pagerduty.EventsApiV2Client.trigger`
+        """
+        event = self._trigger_properties(
+            summary,
+            source,
+            severity=severity,
+            payload=payload,
+            custom_details=custom_details,
+            images=images,
+            links=links,
+        )
+        return await self.send_event(
+            "trigger",
+            dedup_key=dedup_key,
+            total_timeout=total_timeout,
+            **event,
+        )
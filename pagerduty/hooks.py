@@ -0,0 +1,294 @@
+# Core
+import time
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+# PyPI
+from httpx2 import Response
+
+# Local
+from .errors import UrlError
+from .version import __version__
+
+
+class RequestHooks(object):
+    """
+    Interface for observing the life cycle of API requests.
+
+    An object of a class extending this one can be attached to a client via
+    its ``hooks`` attribute or constructor keyword argument, and its methods
+    will be called as requests are made. All methods do nothing by default, so
+    that subclasses need only implement the events of interest. When a client
+    has no hooks, which is the default, no additional work is done.
+
+    The events of each request are:
+
+    * :attr:`request_start`: before making a request (including all retries)
+    * :attr:`rate_limited`: before waiting due to rate limiting, either to pace
+      requests according to the client's
+      :attr:`pagerduty.ApiClient.rate_limiter` or before retrying after a
+      response with status 429
+    * :attr:`response`: each time a response is received
+    * :attr:`retry`: before waiting to retry after a network error or a
+      response with a retryable status
+    * :attr:`request_end`: after the request is complete, whether it
+      succeeded or raised an exception
+
+    Additionally, :attr:`page` is called by the iteration methods of
+    :class:`pagerduty.RestApiV2BaseClient` after each page of results is
+    received.
+
+    The same object can be shared between multiple clients, threads and
+    asynchronous tasks; per-request state should be kept in the context object
+    returned by :attr:`request_start` rather than in the hooks object.
+
+    Usage example:
+
+    .. code-block:: python
+
+        class SlowRequestLogger(pagerduty.RequestHooks):
+
+            def request_start(self, client, method, url):
+                return (method, url, time.monotonic())
+
+            def request_end(self, client, context, response=None, error=None):
+                method, url, start = context
+                if time.monotonic() - start > 5:
+                    print(f"Slow request: {method} {url}")
+
+        client = pagerduty.RestApiV2Client(API_KEY, hooks=SlowRequestLogger())
+    """
+
+    def page(self, client, path: str, results: list):
+        """
+        Called after a page of results has been received during iteration.
+
+        :param client:
+            The client object
+        :param path:
+            The canonical path of the index endpoint
+        :param results:
+            The results in the page
+        """
+        pass
+
+    def rate_limited(self, client, context: Any, wait: float):
+        """
+        Called before waiting due to rate limiting.
+
+        :param client:
+            The client object
+        :param context:
+            The value returned by :attr:`request_start`
+        :param wait:
+            The time in seconds that the client will wait
+        """
+        pass
+
+    def request_end(
+        self,
+        client,
+        context: Any,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None,
+    ):
+        """
+        Called after a request is complete.
+
+        :param client:
+            The client object
+        :param context:
+            The value returned by :attr:`request_start`
+        :param response:
+            The final response, if the request completed
+        :param error:
+            The exception that ended the request, if any
+        """
+        pass
+
+    def request_start(self, client, method: str, url: str) -> Any:
+        """
+        Called before making a request.
+
+        :param client:
+            The client object
+        :param method:
+            The request method, in upper case
+        :param url:
+            The full URL of the request
+        :returns:
+            Any object, which is passed to the other methods called for the
+            same request.
+        """
+        return None
+
+    def response(self, client, context: Any, response: Response):
+        """
+        Called each time that a response is received.
+
+        :param client:
+            The client object
+        :param context:
+            The value returned by :attr:`request_start`
+        :param response:
+            The response
+        """
+        pass
+
+    def retry(
+        self,
+        client,
+        context: Any,
+        wait: float,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None,
+    ):
+        """
+        Called before waiting to retry a request.
+
+        :param client:
+            The client object
+        :param context:
+            The value returned by :attr:`request_start`
+        :param wait:
+            The time in seconds that the client will wait before retrying
+        :param response:
+            The response that prompted the retry, if any
+        :param error:
+            The network error that prompted the retry, if any
+        """
+        pass
+
+
+class OpenTelemetryHooks(RequestHooks):
+    """
+    Request hooks that report traces and metrics to `OpenTelemetry`_.
+
+    Each request, including all of its retries, is recorded as a client span.
+    Retries, rate limiting waits and responses are recorded as span events.
+    The following metrics are also recorded:
+
+    * ``pagerduty.client.request.duration``: histogram of request durations
+    * ``pagerduty.client.request.retries``: counter of retries
+    * ``pagerduty.client.pages``: counter of pages of results received
+
+    To keep the cardinality of span names and metric attributes bounded, they
+    are tagged with the canonical path of the URL (i.e. ``/users/{id}``) for
+    clients that support it, rather than the URL itself; for other clients,
+    the path of the URL is used.
+
+    This requires the ``opentelemetry-api`` package, which is not a dependency
+    of this package and must be installed separately.
+
+    :param tracer_provider:
+        The tracer provider to use. Defaults to the global tracer provider.
+    :param meter_provider:
+        The meter provider to use. Defaults to the global meter provider.
+
+    .. _OpenTelemetry: https://opentelemetry.io/docs/languages/python/
+    """
+
+    def __init__(self, tracer_provider=None, meter_provider=None):
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryHooks requires the opentelemetry-api package; "
+                "install it with: pip install opentelemetry-api"
+            ) from e
+        self._trace = trace
+        self.tracer = trace.get_tracer(
+            "pagerduty", __version__, tracer_provider=tracer_provider
+        )
+        meter = metrics.get_meter(
+            "pagerduty", __version__, meter_provider=meter_provider
+        )
+        self.duration = meter.create_histogram(
+            "pagerduty.client.request.duration",
+            unit="s",
+            description="Duration of PagerDuty API requests, with retries",
+        )
+        self.retries = meter.create_counter(
+            "pagerduty.client.request.retries",
+            description="Number of retried PagerDuty API requests",
+        )
+        self.pages = meter.create_counter(
+            "pagerduty.client.pages",
+            description="Number of pages of results received",
+        )
+
+    @staticmethod
+    def _route(client, url: str) -> str:
+        """
+        Get the low-cardinality route of a URL to tag spans and metrics with.
+        """
+        canonical_path = getattr(client, "canonical_path", None)
+        if canonical_path is not None:
+            try:
+                return canonical_path(url)
+            except UrlError:
+                pass
+        return urlparse(url).path or "/"
+
+    def page(self, client, path: str, results: list):
+        self.pages.add(1, {"http.route": path})
+
+    def rate_limited(self, client, context: Any, wait: float):
+        span = context[0]
+        span.add_event("rate_limited", {"wait": wait})
+
+    def request_end(
+        self,
+        client,
+        context: Any,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None,
+    ):
+        span, attributes, start = context
+        attributes = dict(attributes)
+        if response is not None:
+            attributes["http.response.status_code"] = response.status_code
+        if error is not None:
+            span.record_exception(error)
+            attributes["error.type"] = type(error).__name__
+        if error is not None or (
+            response is not None and response.status_code >= 400
+        ):
+            span.set_status(self._trace.StatusCode.ERROR)
+        self.duration.record(time.monotonic() - start, attributes)
+        span.end()
+
+    def request_start(self, client, method: str, url: str) -> Any:
+        route = self._route(client, url)
+        attributes = {
+            "http.request.method": method,
+            "http.route": route,
+            "server.address": urlparse(url).hostname,
+        }
+        span = self.tracer.start_span(
+            f"{method} {route}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=attributes,
+        )
+        return span, attributes, time.monotonic()
+
+    def response(self, client, context: Any, response: Response):
+        span = context[0]
+        span.set_attribute("http.response.status_code", response.status_code)
+
+    def retry(
+        self,
+        client,
+        context: Any,
+        wait: float,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None,
+    ):
+        span, attributes, _ = context
+        event = {"wait": wait}
+        if response is not None:
+            event["http.response.status_code"] = response.status_code
+        if error is not None:
+            event["error.type"] = type(error).__name__
+        span.add_event("retry", event)
+        self.retries.add(1, attributes)
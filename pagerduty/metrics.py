@@ -0,0 +1,415 @@
+# Core
+import math
+import threading
+from collections.abc import MutableMapping
+from typing import Iterator, Optional, Tuple
+
+
+class LatencyHistogram(object):
+    """
+    Compact histogram of request latencies with fixed log-linear buckets.
+
+    Each power of two between :attr:`min_latency` and ``min_latency *
+    2**powers`` seconds is divided into :attr:`sub_buckets` buckets of equal
+    width, so that percentiles are accurate to within ``1 / sub_buckets`` of
+    the true value regardless of scale, i.e. 6.25% with the defaults. Latencies
+    below the range are counted in the first bucket and latencies above it in
+    the last.
+
+    Because all histograms share the same buckets, they can be combined with
+    :attr:`merge`, i.e. to aggregate the latencies recorded by several worker
+    processes. Histogram objects can be pickled.
+
+    This class is not thread-safe on its own; :class:`ApiMetrics` serializes
+    access to the histograms that it holds.
+    """
+
+    min_latency = 0.001
+    """The lower bound of the histogram's range, in seconds."""
+
+    powers = 20
+    """The number of powers of two spanned by the histogram."""
+
+    sub_buckets = 16
+    """The number of buckets into which each power of two is divided."""
+
+    def __init__(self):
+        self.counts = [0] * (self.powers * self.sub_buckets + 2)
+        self.count = 0
+        self.total = 0.0
+
+    def _bucket(self, latency: float) -> int:
+        """
+        Get the index of the bucket in which to count a latency.
+        """
+        if latency < self.min_latency:
+            return 0
+        mantissa, exponent = math.frexp(latency / self.min_latency)
+        # frexp returns a mantissa in [0.5, 1): scale it to [0, sub_buckets)
+        sub_bucket = int((mantissa * 2 - 1) * self.sub_buckets)
+        return min(
+            len(self.counts) - 1,
+            1 + (exponent - 1) * self.sub_buckets + sub_bucket,
+        )
+
+    def _upper_bound(self, bucket: int) -> float:
+        """
+        Get the upper bound of the latencies counted in a bucket.
+        """
+        if bucket == 0:
+            return self.min_latency
+        power, sub_bucket = divmod(bucket - 1, self.sub_buckets)
+        return (
+            self.min_latency
+            * 2**power
+            * (1 + (sub_bucket + 1) / self.sub_buckets)
+        )
+
+    def add(self, latency: float):
+        """
+        Count a latency.
+
+        :param latency:
+            The latency in seconds
+        """
+        self.counts[self._bucket(latency)] += 1
+        self.count += 1
+        self.total += latency
+
+    def copy(self) -> "LatencyHistogram":
+        """
+        Make an independent copy of the histogram.
+        """
+        histogram = LatencyHistogram.__new__(type(self))
+        histogram.counts = list(self.counts)
+        histogram.count = self.count
+        histogram.total = self.total
+        return histogram
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The mean latency, or ``None`` if nothing has been counted."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def merge(self, other: "LatencyHistogram"):
+        """
+        Add the counts of another histogram to this one.
+
+        :param other:
+            The histogram to merge into this one; it must use the same buckets.
+        """
+        if len(other.counts) != len(self.counts):
+            raise ValueError("Cannot merge histograms with different buckets")
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate a percentile of the latencies counted.
+
+        :param q:
+            The percentile, from 0 to 100
+        :returns:
+            The upper bound of the bucket containing the percentile, in
+            seconds, or ``None`` if nothing has been counted.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100")
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * q / 100))
+        cumulative = 0
+        for bucket, n in enumerate(self.counts):
+            cumulative += n
+            if cumulative >= rank:
+                return self._upper_bound(bucket)
+
+    def percentiles(self, qs: Tuple[float, ...] = (50, 95, 99)) -> dict:
+        """
+        Estimate several percentiles of the latencies counted.
+
+        :param qs:
+            The percentiles to estimate
+        :returns:
+            A dict mapping each percentile to its estimate; see
+            :attr:`percentile`.
+        """
+        return {q: self.percentile(q) for q in qs}
+
+
+class ApiMetrics(object):
+    """
+    Thread-safe store of performance information about API calls.
+
+    Statistics are recorded per endpoint, i.e. the request method and
+    canonical path of the URL (see :attr:`pagerduty.canonical_path`). For each
+    endpoint, the following are recorded:
+
+    * ``calls``: the number of responses received, including those that were
+      subsequently retried
+    * ``time``: the total time in seconds spent awaiting responses
+    * ``bytes``: the total number of bytes of response content received
+    * ``retries``: the number of requests that were retried, whether after an
+      error response or a network error
+    * ``statuses``: a dict counting the responses received per HTTP status
+    * ``latency``: a :class:`LatencyHistogram` of the time taken by each call
+
+    To minimize contention when a client is shared between many threads,
+    endpoints are distributed between a fixed number of independently-locked
+    stripes, so that recording a call to one endpoint only waits for other
+    threads recording calls to endpoints in the same stripe.
+
+    :param stripes:
+        The number of stripes (locks) to use.
+    """
+
+    def __init__(self, stripes: int = 16):
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._stats = [{} for _ in range(stripes)]
+
+    @staticmethod
+    def _endpoint_stats(stats: dict, endpoint: str) -> dict:
+        """
+        Get the statistics of an endpoint, initializing them if necessary.
+
+        Must be called while holding the lock of the stripe.
+        """
+        endpoint_stats = stats.get(endpoint)
+        if endpoint_stats is None:
+            endpoint_stats = stats[endpoint] = {
+                "calls": 0,
+                "time": 0.0,
+                "bytes": 0,
+                "retries": 0,
+                "statuses": {},
+                "latency": LatencyHistogram(),
+            }
+        return endpoint_stats
+
+    def _stripe(self, endpoint: str) -> Tuple[threading.Lock, dict]:
+        """
+        Get the lock and statistics dict of the stripe holding an endpoint.
+        """
+        i = hash(endpoint) % len(self._locks)
+        return self._locks[i], self._stats[i]
+
+    @staticmethod
+    def merge(*snapshots: dict) -> dict:
+        """
+        Combine snapshots of metrics, i.e. from several worker processes.
+
+        :param snapshots:
+            Return values of :attr:`snapshot`
+        :returns:
+            A new snapshot with the sums of the statistics of each endpoint
+        """
+        merged = {}
+        for snapshot in snapshots:
+            for endpoint, endpoint_stats in snapshot.items():
+                total = ApiMetrics._endpoint_stats(merged, endpoint)
+                for key in ("calls", "time", "bytes", "retries"):
+                    total[key] += endpoint_stats[key]
+                for status, n in endpoint_stats["statuses"].items():
+                    total["statuses"][status] = (
+                        total["statuses"].get(status, 0) + n
+                    )
+                total["latency"].merge(endpoint_stats["latency"])
+        return merged
+
+    def record(
+        self, endpoint: str, status: int, elapsed: float, num_bytes: int = 0
+    ):
+        """
+        Record a response received from the API.
+
+        :param endpoint:
+            The request method and canonical path, i.e. ``GET /users/{id}``
+        :param status:
+            The HTTP status of the response
+        :param elapsed:
+            The time in seconds that the request took
+        :param num_bytes:
+            The number of bytes of response content received
+        """
+        lock, stats = self._stripe(endpoint)
+        with lock:
+            endpoint_stats = self._endpoint_stats(stats, endpoint)
+            endpoint_stats["calls"] += 1
+            endpoint_stats["time"] += elapsed
+            endpoint_stats["bytes"] += num_bytes
+            statuses = endpoint_stats["statuses"]
+            statuses[status] = statuses.get(status, 0) + 1
+            endpoint_stats["latency"].add(elapsed)
+
+    def record_retry(self, endpoint: str):
+        """
+        Record that a request is being retried.
+
+        :param endpoint:
+            The request method and canonical path, i.e. ``GET /users/{id}``
+        """
+        lock, stats = self._stripe(endpoint)
+        with lock:
+            self._endpoint_stats(stats, endpoint)["retries"] += 1
+
+    def replace_totals(self, key: str, values: dict):
+        """
+        Replace one numeric statistic of every endpoint.
+
+        :param key:
+            The name of the statistic, i.e. ``calls`` or ``time``
+        :param values:
+            A dict mapping endpoints to the new value of the statistic.
+            Endpoints that it doesn't include have the statistic set to zero.
+        """
+        for lock, stats in zip(self._locks, self._stats):
+            with lock:
+                for endpoint, endpoint_stats in stats.items():
+                    endpoint_stats[key] = values.get(endpoint, 0)
+        for endpoint, value in values.items():
+            self.set_total(endpoint, key, value)
+
+    def reset(self):
+        """
+        Discard all statistics recorded so far.
+        """
+        for lock, stats in zip(self._locks, self._stats):
+            with lock:
+                stats.clear()
+
+    def set_total(self, endpoint: str, key: str, value: float):
+        """
+        Set one numeric statistic of an endpoint.
+
+        :param endpoint:
+            The request method and canonical path, i.e. ``GET /users/{id}``
+        :param key:
+            The name of the statistic, i.e. ``calls`` or ``time``
+        :param value:
+            The new value of the statistic
+        """
+        lock, stats = self._stripe(endpoint)
+        with lock:
+            self._endpoint_stats(stats, endpoint)[key] = value
+
+    def snapshot(self) -> dict:
+        """
+        Get a copy of the statistics recorded so far.
+
+        Each stripe is copied while holding its lock, so the statistics of each
+        endpoint are internally consistent.
+
+        :returns:
+            A dict mapping each endpoint to a dict of its statistics. It can be
+            modified freely without affecting the recorded statistics.
+        """
+        snapshot = {}
+        for lock, stats in zip(self._locks, self._stats):
+            with lock:
+                for endpoint, endpoint_stats in stats.items():
+                    snapshot[endpoint] = dict(
+                        endpoint_stats,
+                        statuses=dict(endpoint_stats["statuses"]),
+                        latency=endpoint_stats["latency"].copy(),
+                    )
+        return snapshot
+
+    def total(self, endpoint: str, key: str) -> Optional[float]:
+        """
+        Get one numeric statistic of an endpoint.
+
+        :param endpoint:
+            The request method and canonical path, i.e. ``GET /users/{id}``
+        :param key:
+            The name of the statistic, i.e. ``calls`` or ``time``
+        :returns:
+            The value of the statistic, or ``None`` if nothing has been
+            recorded for the endpoint.
+        """
+        lock, stats = self._stripe(endpoint)
+        with lock:
+            endpoint_stats = stats.get(endpoint)
+            if endpoint_stats is None:
+                return None
+            return endpoint_stats[key]
+
+    def totals(self, key: str) -> dict:
+        """
+        Get one numeric statistic of each endpoint.
+
+        This is cheaper than :attr:`snapshot` because latency histograms are
+        not copied.
+
+        :param key:
+            The name of the statistic, i.e. ``calls`` or ``time``
+        :returns:
+            A dict mapping each endpoint to the value of the statistic
+        """
+        totals = {}
+        for lock, stats in zip(self._locks, self._stats):
+            with lock:
+                for endpoint, endpoint_stats in stats.items():
+                    totals[endpoint] = endpoint_stats[key]
+        return totals
+
+    def totals_view(self, key: str) -> MutableMapping:
+        """
+        Get a live, writable mapping of one numeric statistic of each endpoint.
+
+        This is how the legacy ``api_call_counts`` and ``api_time`` attributes
+        of REST API clients are provided.
+
+        :param key:
+            The name of the statistic, i.e. ``calls`` or ``time``
+        :returns:
+            A mapping from each endpoint for which the statistic is nonzero to
+            its value. Setting or deleting an item sets the statistic of the
+            endpoint (deleting sets it to zero).
+        """
+        return _TotalsView(self, key)
+
+
+class _TotalsView(MutableMapping):
+    """
+    Mapping returned by :attr:`ApiMetrics.totals_view`.
+    """
+
+    def __init__(self, metrics: ApiMetrics, key: str):
+        self._metrics = metrics
+        self._key = key
+
+    def __delitem__(self, endpoint: str):
+        if endpoint not in self:
+            raise KeyError(endpoint)
+        self._metrics.set_total(endpoint, self._key, 0)
+
+    def __getitem__(self, endpoint: str) -> float:
+        value = self._metrics.total(endpoint, self._key)
+        if not value:
+            raise KeyError(endpoint)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._nonzero())
+
+    def __len__(self) -> int:
+        return len(self._nonzero())
+
+    def __repr__(self) -> str:
+        return repr(self._nonzero())
+
+    def __setitem__(self, endpoint: str, value: float):
+        self._metrics.set_total(endpoint, self._key, value)
+
+    def _nonzero(self) -> dict:
+        return {
+            endpoint: value
+            for endpoint, value in self._metrics.totals(self._key).items()
+            if value
+        }
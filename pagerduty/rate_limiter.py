@@ -0,0 +1,166 @@
+# Core
+import threading
+import time
+from typing import Optional
+
+# PyPI
+from httpx2 import Response
+
+# Local
+from .common import retry_after
+
+
+class RateLimiter(object):
+    """
+    Client-side rate limiter for pacing API requests proactively.
+
+    Requests are paced using a `token bucket
+    <https://en.wikipedia.org/wiki/Token_bucket>`_ for each API credential:
+    tokens accumulate at a rate of :attr:`rate` per second, up to
+    :attr:`burst`, and each request consumes one. When the bucket is empty,
+    requests are delayed until a token becomes available instead of being sent
+    only to be rejected with status 429.
+
+    The budget for each credential is also adjusted according to the headers
+    of each response received. If a response's ``ratelimit-remaining`` header
+    is lower than the number of tokens in the bucket, the bucket is drained to
+    match. If the response indicates that the rate limit has been reached
+    (status 429, or no requests remaining), requests using the same credential
+    are held until the time given in the ``Retry-After`` or
+    ``ratelimit-reset`` header (see :attr:`pagerduty.common.retry_after`), but
+    for no longer than :attr:`max_hold`.
+
+    A single object may be shared between multiple client objects and threads,
+    so that all clients in a process that use the same credential share a
+    single budget. It is attached to a client via its ``rate_limiter``
+    attribute or constructor keyword argument:
+
+    .. code-block:: python
+
+        limiter = pagerduty.RateLimiter(rate=10)
+        client1 = pagerduty.RestApiV2Client(API_KEY, rate_limiter=limiter)
+        client2 = pagerduty.RestApiV2Client(API_KEY, rate_limiter=limiter)
+
+    :param rate:
+        The sustained number of requests per second permitted per credential.
+    :param burst:
+        The number of requests per credential that can be made in quick
+        succession before pacing takes effect. Defaults to ``rate``, i.e. one
+        second's worth of requests.
+    :param max_hold:
+        Sets :attr:`max_hold`.
+    """
+
+    rate = 16.0
+    """
+    The number of requests per second that each credential's budget allows.
+    """
+
+    burst = None
+    """
+    The maximum number of tokens each credential's bucket can hold.
+    """
+
+    max_hold = 300.0
+    """
+    The longest time in seconds for which a response can hold requests.
+
+    This keeps one response with an excessive ``Retry-After`` header, i.e.
+    from a misconfigured proxy, from stalling every client that shares the
+    limiter. Clients pass their own ``max_retry_after`` instead.
+    """
+
+    def __init__(
+        self,
+        rate: float = 16.0,
+        burst: Optional[float] = None,
+        max_hold: float = 300.0,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be a positive number")
+        if max_hold < 0:
+            raise ValueError("max_hold must not be negative")
+        self.max_hold = float(max_hold)
+        self.rate = float(rate)
+        if burst is None:
+            burst = max(1.0, self.rate)
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.burst = float(burst)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: str, now: float) -> list:
+        """
+        Get the bucket for a credential, refilled as of the current time.
+
+        Each bucket is a list containing the number of tokens and the time
+        from which tokens accumulate; the latter may be in the future if
+        requests are being held.
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [self.burst, now]
+        elif now > bucket[1]:
+            bucket[0] = min(
+                self.burst, bucket[0] + (now - bucket[1]) * self.rate
+            )
+            bucket[1] = now
+        return bucket
+
+    def reserve(self, key: str) -> float:
+        """
+        Consume a token for a request, and get how long to wait to send it.
+
+        The caller is expected to wait the returned number of seconds before
+        sending the request. This method itself never blocks, so that it can
+        be used in both threaded and asynchronous programs.
+
+        :param key:
+            Identifies the budget, i.e. the API credential being used.
+        :returns:
+            The number of seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(key, now)
+            bucket[0] -= 1
+            return max(0.0, bucket[1] - now) + max(0.0, -bucket[0]) / self.rate
+
+    def update(
+        self, key: str, response: Response, max_hold: Optional[float] = None
+    ):
+        """
+        Adjust a credential's budget according to a response from the API.
+
+        :param key:
+            Identifies the budget, i.e. the API credential being used.
+        :param response:
+            The response received.
+        :param max_hold:
+            The longest time in seconds to hold requests; defaults to
+            :attr:`max_hold`.
+        """
+        if max_hold is None:
+            max_hold = self.max_hold
+        remaining = response.headers.get("ratelimit-remaining")
+        hold = retry_after(response, maximum=max_hold)
+        if hold is None and response.status_code == 429:
+            # The limit was reached but the API didn't say for how long; wait
+            # at least as long as it would take for a token to accumulate:
+            hold = 1 / self.rate
+        if remaining is None and hold is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(key, now)
+            if remaining is not None:
+                try:
+                    bucket[0] = min(bucket[0], float(remaining))
+                except ValueError:
+                    pass
+            if hold is not None:
+                # Let exactly one request through when the hold ends, even if
+                # the budget was already drained, and pace any others after it:
+                bucket[0] = 1.0
+                bucket[1] = max(bucket[1], now + hold)
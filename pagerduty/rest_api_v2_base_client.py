@@ -1,8 +1,15 @@
 # Core
+import asyncio
 import functools
+import inspect
+from collections import deque
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from itertools import islice
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Iterator,
     List,
@@ -13,13 +20,14 @@ from typing import (
 from warnings import warn
 
 # PyPI
-from httpx2 import Response
+from httpx2 import Response, TransportError
 
 # Local
-from .api_client import ApiClient, normalize_url
+from .api_client import ApiClient, ApiClientMixin, AsyncApiClient
 from .auth_method import AuthMethod, HeaderAuthMethod, PassThruHeaderAuthMethod
 
 from .common import (
+    normalize_url,
     requires_success,
     singular_name,
     successful_response,
@@ -27,6 +35,7 @@ from .common import (
     try_decoding,
 )
 from .errors import ServerHttpError, UrlError
+from .metrics import ApiMetrics
 
 #######################
 ### CLIENT DEFAULTS ###
@@ -62,8 +71,73 @@ variable parameter versus a literal substring of the path.
 """
 
 
+class CanonicalPathTrie(object):
+    """
+    Index of canonical paths for fast matching of URL paths against them.
+
+    Each node in the tree corresponds to a node (value between slashes) in a
+    canonical path. Literal path nodes are stored as children keyed by value,
+    and all variable parameters (see
+    :attr:`pagerduty.rest_api_v2_base_client.is_path_param`) at a given
+    position share a single wildcard child. Matching a URL path therefore takes
+    time proportional to its depth rather than to the number of canonical
+    paths.
+
+    :param paths:
+        The list of canonical paths to index.
+    """
+
+    __slots__ = ("literals", "wildcard", "paths")
+
+    def __init__(self, paths: Optional[List[CanonicalPath]] = None):
+        self.literals = {}
+        self.wildcard = None
+        # Paths that end at this node, as (position, path) tuples, so that
+        # matches can be reported in the same order as in the original list:
+        self.paths = []
+        for i, path in enumerate(paths or []):
+            node = self
+            for path_node in path.split("/")[1:]:
+                if is_path_param(path_node):
+                    if node.wildcard is None:
+                        node.wildcard = CanonicalPathTrie()
+                    node = node.wildcard
+                else:
+                    node = node.literals.setdefault(
+                        path_node, CanonicalPathTrie()
+                    )
+            node.paths.append((i, path))
+
+    def match(self, url_path: str) -> List[CanonicalPath]:
+        """
+        All canonical paths that match a URL path.
+
+        :param url_path:
+            The path portion of a URL, starting with ``/``, without the base
+            URL or query string.
+        :returns:
+            The matching canonical paths, in the order in which they were
+            originally given.
+        """
+        nodes = [self]
+        for url_node in url_path.split("/")[1:]:
+            next_nodes = []
+            for node in nodes:
+                literal = node.literals.get(url_node)
+                if literal is not None:
+                    next_nodes.append(literal)
+                if node.wildcard is not None:
+                    next_nodes.append(node.wildcard)
+            nodes = next_nodes
+            if not nodes:
+                return []
+        return [path for _, path in sorted(p for n in nodes for p in n.paths)]
+
+
 def canonical_path(
-    paths: List[CanonicalPath], base_url: str, url: str
+    paths: Union[List[CanonicalPath], CanonicalPathTrie],
+    base_url: str,
+    url: str,
 ) -> CanonicalPath:
     """
     The canonical path from the API documentation corresponding to a URL.
@@ -79,7 +153,9 @@ def canonical_path(
 
     :param paths:
         A list of paths supported by the API client. One example of this is
-        ``pagerduty.rest_api_v2_client.CANONICAL_PATHS``.
+        ``pagerduty.rest_api_v2_client.CANONICAL_PATHS``. A list is indexed
+        anew on every call; to match many URLs against the same paths, give
+        an index (a :class:`CanonicalPathTrie`) instead.
     :param base_url:
         The base URL of the API
     :param url:
@@ -90,23 +166,11 @@ def canonical_path(
     full_url = normalize_url(base_url, url)
     # Starting with / after hostname before the query string:
     url_path = full_url.replace(base_url.rstrip("/"), "").split("?")[0]
-    # Root node (blank) counts so we include it:
-    n_nodes = url_path.count("/")
-    # First winnow the list down to paths with the same number of nodes:
-    patterns = list(filter(lambda p: p.count("/") == n_nodes, paths))
-    # Match against each node, skipping index zero because the root node always
-    # matches, and using the adjusted index "j":
-    for i, node in enumerate(url_path.split("/")[1:]):
-        j = i + 1
-        patterns = list(
-            filter(
-                lambda p: (
-                    p.split("/")[j] == node or is_path_param(p.split("/")[j])
-                ),
-                patterns,
-            )
-        )
-        # Don't break early if len(patterns) == 1, but require an exact match...
+    if not isinstance(paths, CanonicalPathTrie):
+        paths = CanonicalPathTrie(paths)
+    # Every node must match, either literally or as a path parameter, and the
+    # number of nodes must be the same:
+    patterns = paths.match(url_path)
 
     if len(patterns) == 0:
         raise UrlError(
@@ -247,31 +311,7 @@ def entity_wrappers(
 
     if len(match) == 1:
         # Look up entity wrapping info from the global dictionary and validate:
-        wrapper = wrapper_config[match[0]]
-        invalid_config_error = (
-            "Invalid entity wrapping configuration for "
-            f"{endpoint}: {wrapper}; this is most likely a bug."
-        )
-        if wrapper is not None and type(wrapper) not in (tuple, str):
-            # Catch-all for invalid types.
-            raise Exception(invalid_config_error)
-        elif wrapper is None or type(wrapper) is str:
-            # Both request and response have the same wrapping at this endpoint.
-            return (wrapper, wrapper)
-        elif type(wrapper) is tuple and len(wrapper) == 2:
-            # Endpoint may use different wrapping for request/response bodies.
-            #
-            # Each element must be either str or None. The first element is the
-            # request body wrapper and the second is the response body wrapper.
-            # If a value is None, that indicates that the request or response
-            # value should be encoded and decoded as-is without modifications.
-            if False in [w is None or type(w) is str for w in wrapper]:
-                # One or both is neither a string nor None, which is invalid:
-                raise Exception(invalid_config_error)
-            return wrapper
-        else:
-            # If a tuple but not of length 2, what are we doing here?
-            raise Exception(invalid_config_error)
+        return entity_wrapping_spec(endpoint, wrapper_config[match[0]])
     elif len(match) == 0:
         # Nothing in entity wrapper config matches. In this case it is assumed
         # that the endpoint follows classic API patterns and the wrapper name
@@ -286,6 +326,101 @@ def entity_wrappers(
         )
 
 
+def entity_wrapping_spec(
+    endpoint: str, wrapper: Union[EntityWrapping, tuple]
+) -> EntityWrappingSpec:
+    """
+    Validate an entity wrapper configuration value and expand it to a tuple.
+
+    :param endpoint:
+        The endpoint or endpoint pattern that the value is configured for, for
+        error messages.
+    :param wrapper:
+        A value in an entity wrapper configuration dictionary; see
+        :attr:`pagerduty.rest_api_v2_base_client.entity_wrappers`.
+    :returns:
+        The entity wrapping specification.
+    """
+    invalid_config_error = (
+        "Invalid entity wrapping configuration for "
+        f"{endpoint}: {wrapper}; this is most likely a bug."
+    )
+    if wrapper is not None and type(wrapper) not in (tuple, str):
+        # Catch-all for invalid types.
+        raise Exception(invalid_config_error)
+    elif wrapper is None or type(wrapper) is str:
+        # Both request and response have the same wrapping at this endpoint.
+        return (wrapper, wrapper)
+    elif type(wrapper) is tuple and len(wrapper) == 2:
+        # Endpoint may use different wrapping for request/response bodies.
+        #
+        # Each element must be either str or None. The first element is the
+        # request body wrapper and the second is the response body wrapper.
+        # If a value is None, that indicates that the request or response
+        # value should be encoded and decoded as-is without modifications.
+        if False in [w is None or type(w) is str for w in wrapper]:
+            # One or both is neither a string nor None, which is invalid:
+            raise Exception(invalid_config_error)
+        return wrapper
+    else:
+        # If a tuple but not of length 2, what are we doing here?
+        raise Exception(invalid_config_error)
+
+
+class EntityWrapperTable(object):
+    """
+    Precompiled entity wrapper configuration for fast lookups.
+
+    Equivalent to calling
+    :attr:`pagerduty.rest_api_v2_base_client.entity_wrappers` with the same
+    configuration dictionary, except that the entire configuration is
+    validated once, up front, and the result for each method and canonical
+    path is remembered after it is first looked up.
+
+    :param wrapper_config:
+        A dictionary containing entity wrapper antipattern configuration
+    """
+
+    def __init__(self, wrapper_config: dict):
+        self.explicit = {}
+        for pattern, wrapper in wrapper_config.items():
+            method, path = pattern.split(" ", 1)
+            self.explicit[(method, path)] = entity_wrapping_spec(
+                pattern, wrapper
+            )
+        for method, path in self.explicit:
+            if method != "*" and ("*", path) in self.explicit:
+                raise Exception(
+                    f"{method} {path} matches more than one pattern: "
+                    f"{method} {path}, * {path}; this is most likely a bug."
+                )
+        self.specs = {}
+
+    def lookup(self, method: str, path: CanonicalPath) -> EntityWrappingSpec:
+        """
+        Obtains entity wrapping information for a given canonical path and method.
+
+        :param method:
+            A HTTP method.
+        :param path:
+            A canonical API path.
+        :returns:
+            The entity wrapping specification.
+        """
+        key = (method.upper(), path)
+        spec = self.specs.get(key)
+        if spec is None:
+            if key in self.explicit:
+                spec = self.explicit[key]
+            elif ("*", path) in self.explicit:
+                spec = self.explicit[("*", path)]
+            else:
+                wrapper = infer_entity_wrapper(method, path)
+                spec = (wrapper, wrapper)
+            self.specs[key] = spec
+        return spec
+
+
 def infer_entity_wrapper(method: str, path: CanonicalPath) -> EntityWrapper:
     """
     Infer the entity wrapper name from the endpoint using orthodox patterns.
@@ -323,7 +458,11 @@ def infer_entity_wrapper(method: str, path: CanonicalPath) -> EntityWrapper:
         return path_nodes[-1]
 
 
-def unwrap(response: Response, wrapper: EntityWrapping) -> Union[dict, list]:
+def unwrap(
+    response: Response,
+    wrapper: EntityWrapping,
+    body: Optional[Union[dict, list, str]] = None,
+) -> Union[dict, list]:
     """
     Unwraps a wrapped entity from a HTTP response.
 
@@ -331,11 +470,17 @@ def unwrap(response: Response, wrapper: EntityWrapping) -> Union[dict, list]:
         The response object.
     :param wrapper:
         The entity wrapper (string), or None to skip unwrapping
+    :param body:
+        The JSON-decoded body of the response, if it has already been decoded.
+        If not given, the body will be decoded from the response. Supplying it
+        avoids parsing the same response body twice, i.e. when the caller also
+        needs to read other properties of the body.
     :returns:
         The value associated with the wrapper key in the JSON-decoded body of
         the response, which is expected to be a dictionary (map).
     """
-    body = try_decoding(response)
+    if body is None:
+        body = try_decoding(response)
     endpoint = "%s %s" % (
         response.request.method.upper(),
         response.request.url,
@@ -377,7 +522,18 @@ def auto_json(method: Callable[..., Any]) -> Callable[..., Any]:
     by keyword arguments and return a `httpx2.Response`_ object.
 
     The new return value is the JSON-decoded response body.
+
+    If the decorated function is a coroutine function, the resulting function
+    will also be a coroutine function.
     """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def call_async(self, url, **kw):
+            r = await method(self, url, **kw)
+            return try_decoding(successful_response(r))
+
+        return call_async
 
     @functools.wraps(method)
     def call(self, url, **kw):
@@ -399,8 +555,7 @@ def resource_url(method: Callable[..., Any]) -> Callable[..., Any]:
     """
     NAME = method.__name__
 
-    @functools.wraps(method)
-    def call(self, resource, **kw):
+    def resource_to_url(resource: Union[str, dict]) -> str:
         url = resource
         if type(resource) is dict:
             if "self" in resource:  # passing an object
@@ -416,7 +571,19 @@ def resource_url(method: Callable[..., Any]) -> Callable[..., Any]:
             raise UrlError(
                 f"Value passed to {NAME} is not a str or dict with key 'self'"
             )
-        return method(self, url, **kw)
+        return url
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def call_async(self, resource, **kw):
+            return await method(self, resource_to_url(resource), **kw)
+
+        return call_async
+
+    @functools.wraps(method)
+    def call(self, resource, **kw):
+        return method(self, resource_to_url(resource), **kw)
 
     return call
 
@@ -452,9 +619,8 @@ def wrapped_entities(method: Callable[..., Any]) -> Callable[..., Any]:
     """
     HTTP_METHOD = method.__name__.lstrip("r")
 
-    @functools.wraps(method)
-    def call(self, url, **kw):
-        pass_kw = deepcopy(kw)  # Make a copy for modification
+    def wrap_request(self, url, kw) -> Tuple[dict, EntityWrapping]:
+        pass_kw = dict(kw)  # Only the json argument may be replaced
         path = self.canonical_path(url)
         req_w, res_w = self.entity_wrappers(HTTP_METHOD, path)
         # Validate the abbreviated (or full) request payload, and automatically
@@ -466,6 +632,21 @@ def wrapped_entities(method: Callable[..., Any]) -> Callable[..., Any]:
             and req_w not in pass_kw["json"]
         ):
             pass_kw["json"] = {req_w: pass_kw["json"]}
+        return pass_kw, res_w
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def call_async(self, url, **kw):
+            pass_kw, res_w = wrap_request(self, url, kw)
+            r = successful_response(await method(self, url, **pass_kw))
+            return unwrap(r, res_w)
+
+        return call_async
+
+    @functools.wraps(method)
+    def call(self, url, **kw):
+        pass_kw, res_w = wrap_request(self, url, kw)
 
         # Make the request:
         r = successful_response(method(self, url, **pass_kw))
@@ -509,34 +690,25 @@ class OAuthTokenAuthMethod(HeaderAuthMethod):
 ####################
 
 
-class RestApiV2BaseClient(ApiClient):
+class RestApiV2BaseClientMixin(ApiClientMixin):
     """
-    Abstract base class of API clients supporting APIs similar to REST API v2.
-
-    This class implements some common features like numeric pagination that
-    also appear and are supported to varying degrees outside of REST API v2.
+    Features of REST API v2-like clients that are independent of I/O model.
 
-    :param api_key:
-        REST API access token to use for HTTP requests.
-    :param auth_type:
-        The type of credential in use. This parameter determines how the
-        ``Authorization`` header is constructed for API requests.
-            - For OAuth access tokens, set this to ``oauth2`` or ``bearer``.
-            - To send the credential string exactly as provided (without any
-              prefix formatting), set this to ``header_passthru``.
-            - For classic API tokens, the default value ``token`` should be used.
-    :param debug:
-        Sets :attr:`pagerduty.ApiClient.print_debug`. Set to ``True`` to enable
-        verbose command-line output.
-    :param base_url:
-        Sets the base API URL to be used by the client for all API calls.
+    This class holds the configuration and logic shared between
+    :class:`RestApiV2BaseClient` and :class:`AsyncRestApiV2BaseClient`, i.e.
+    URL classification, entity wrapping, authentication types and
+    bookkeeping for classic and cursor-based pagination.
     """
 
-    api_call_counts = None
-    """A dict object recording the number of API calls per endpoint"""
+    metrics = None
+    """
+    A :class:`pagerduty.ApiMetrics` object recording the number, duration,
+    statuses, size and retries of API calls per endpoint.
 
-    api_time = None
-    """A dict object recording the total time of API calls to each endpoint"""
+    It is safe to share the client between threads; see
+    :attr:`pagerduty.ApiMetrics.snapshot` and
+    :attr:`pagerduty.ApiMetrics.reset` for reading and clearing the metrics.
+    """
 
     default_page_size = 100
     """
@@ -544,22 +716,6 @@ class RestApiV2BaseClient(ApiClient):
     iterating/querying an index (the ``limit`` parameter).
     """
 
-    def __init__(
-        self,
-        api_key: str,
-        auth_type: str = "token",
-        debug: bool = False,
-        base_url=None,
-        **kw,
-    ):
-        self.api_call_counts = {}
-        self.api_time = {}
-        self.auth_type = auth_type
-        auth_method = self._build_auth_method(api_key)
-        super(RestApiV2BaseClient, self).__init__(
-            auth_method, debug=debug, base_url=base_url, **kw
-        )
-
     def _build_auth_method(self, api_key: str) -> AuthMethod:
         """
         Constructs an AuthMethod according to the configured :attr:`auth_type`
@@ -570,6 +726,305 @@ class RestApiV2BaseClient(ApiClient):
         """
         return self.auth_type_mapping[self.auth_type](api_key)
 
+    def _classic_pagination_page(
+        self, response: Response, path: CanonicalPath, wrapper: EntityWrapper
+    ) -> Tuple[list, bool, Union[int, str]]:
+        """
+        Unpack a page of results from a classic pagination index endpoint.
+
+        :param response:
+            The successful response containing the page of results
+        :param path:
+            The canonical path of the index endpoint
+        :param wrapper:
+            The entity wrapper of the response
+        :returns:
+            A tuple containing the results, whether there are more results and
+            the total number of results (or ``"?"`` if not included)
+        """
+        body = try_decoding(response)
+        results = unwrap(response, wrapper, body=body)
+        more = False
+        if "total" in body:
+            total_count = body["total"]
+        else:
+            total_count = "?"
+        if "more" in body:
+            more = body["more"]
+        else:
+            warn(
+                f'Response from endpoint GET {path} lacks a "more" '
+                "property and therefore does not support pagination. Only "
+                "results from the first request will be yielded. You can "
+                'use "rget" with this endpoint instead to avoid this'
+                "warning."
+            )
+        return results, more, total_count
+
+    def _classic_pagination_params(
+        self,
+        url: str,
+        path: CanonicalPath,
+        params: Optional[dict] = None,
+        page_size: Optional[int] = None,
+        total: Optional[bool] = False,
+    ) -> Tuple[EntityWrapper, dict, int]:
+        """
+        Validate an index URL for classic pagination and compose parameters.
+
+        :param url:
+            The index endpoint URL
+        :param path:
+            The canonical path of the URL
+        :params params, page_size, total:
+            See :attr:`RestApiV2BaseClient.iter_all`
+        :returns:
+            A tuple containing the response entity wrapper, the query
+            parameters and the starting offset
+        """
+        endpoint = f"GET {path}"
+        nodes = path.split("/")
+        if is_path_param(nodes[-1]):
+            # NOTE: If this happens for a newer endpoint in REST API v2, and
+            # the final path parameter is one of a fixed list of literal
+            # strings, the path might need to be added to the EXPAND_PATHS
+            # dictionary in scripts/get_path_list/get_path_list.py, after which
+            # CANONICAL_PATHS will then need to be updated accordingly based on
+            # the new output of the script.
+            raise UrlError(
+                f"Path {path} (URL={url}) is formatted like an "
+                "individual resource versus a resource collection. It is "
+                "therefore assumed to not support pagination."
+            )
+        _, wrapper = self.entity_wrappers("GET", path)
+
+        if wrapper is None:
+            raise UrlError(f"Pagination is not supported for {endpoint}.")
+
+        # Parameters to send:
+        data = {
+            "limit": (self.default_page_size, page_size)[int(bool(page_size))],
+        }
+        if total is not None:
+            # This is to ensure that the correct literal string is passed
+            # through as the final parameter value rather than letting the HTTP
+            # client middleware serialize it as it sees fit. The PagerDuty API
+            # requires lower case "true/false".
+            data["total"] = str(total).lower()
+        if isinstance(params, (dict, list)):
+            # Override defaults with values given:
+            data.update(dict(params))
+
+        offset = 0
+        if params is not None:
+            offset = int(params.get("offset", 0))
+        return wrapper, data, offset
+
+    def _cursor_pagination_params(
+        self,
+        path: CanonicalPath,
+        params: Optional[dict] = None,
+        page_size: Optional[int] = None,
+    ) -> Tuple[EntityWrapper, dict]:
+        """
+        Validate an index URL for cursor-based pagination and compose parameters.
+
+        :param path:
+            The canonical path of the index endpoint
+        :params params, page_size:
+            See :attr:`RestApiV2BaseClient.iter_cursor`
+        :returns:
+            A tuple containing the response entity wrapper and the query
+            parameters
+        """
+        if path not in self.cursor_based_pagination_paths:
+            raise UrlError(f"{path} does not support cursor-based pagination.")
+        _, wrapper = self.entity_wrappers("GET", path)
+        user_params = {
+            "limit": (self.default_page_size, page_size)[int(bool(page_size))]
+        }
+        if isinstance(params, (dict, list)):
+            # Override defaults with values given:
+            user_params.update(dict(params))
+        return wrapper, user_params
+
+    def _exceeds_iteration_limit(
+        self, path: CanonicalPath, data: dict
+    ) -> bool:
+        """
+        Whether the next page in classic pagination would exceed the hard limit
+
+        If so, a warning is issued.
+
+        :param path:
+            The canonical path of the index endpoint
+        :param data:
+            The query parameters of the next request, including ``offset`` and
+            ``limit``
+        """
+        highest_record_index = int(data["offset"]) + int(data["limit"])
+        if highest_record_index > ITERATION_LIMIT:
+            iter_limit = "%d" % ITERATION_LIMIT
+            warn(
+                f"Stopping iter_all on GET {path} at "
+                f"limit+offset={highest_record_index} "
+                "as this exceeds the maximum permitted by the API "
+                f"({iter_limit}). The set of results may be incomplete."
+            )
+            return True
+        return False
+
+    def _metrics_endpoint(self, method: str, url: str) -> str:
+        """
+        Compose the key under which to record metrics about a request.
+
+        :param method:
+            The request method, in upper case
+        :param url:
+            The full URL of the request
+        :returns:
+            The method and canonical path of the URL separated by a space
+        """
+        try:
+            return "%s %s" % (method, self.canonical_path(url))
+        except UrlError:
+            # This is necessary so that profiling can also support using the
+            # basic get / post / put / delete methods with APIs that are not yet
+            # explicitly supported by inclusion in CANONICAL_PATHS.
+            return "%s %s" % (method, url)
+
+    def _network_error_cooldown(
+        self,
+        endpoint: str,
+        error: TransportError,
+        network_attempts: int,
+        sleep_timer: float,
+    ) -> float:
+        """
+        Record a network error retry in :attr:`metrics`.
+
+        See: :attr:`pagerduty.ApiClient._network_error_cooldown`
+        """
+        sleep_timer = super()._network_error_cooldown(
+            endpoint, error, network_attempts, sleep_timer
+        )
+        self.metrics.record_retry(
+            self._metrics_endpoint(*endpoint.split(" ", 1))
+        )
+        return sleep_timer
+
+    def _prefetch_offsets(
+        self, path: CanonicalPath, data: dict, total_count: int
+    ) -> List[int]:
+        """
+        Offsets of all remaining pages in classic pagination, given the total
+
+        Pages that would exceed :attr:`ITERATION_LIMIT` are excluded, in which
+        case a warning is issued.
+
+        :param path:
+            The canonical path of the index endpoint
+        :param data:
+            The query parameters of the next request, including ``offset`` and
+            ``limit`` (the page size established by the first response)
+        :param total_count:
+            The total number of records reported in the first response
+        :returns:
+            A list of the offsets of the pages remaining to be requested
+        """
+        limit = int(data["limit"])
+        offsets = []
+        if limit < 1:
+            return offsets
+        for offset in range(int(data["offset"]), int(total_count), limit):
+            if self._exceeds_iteration_limit(
+                path, {"offset": offset, "limit": limit}
+            ):
+                break
+            offsets.append(offset)
+        return offsets
+
+    def _response_cooldown(
+        self,
+        endpoint: str,
+        response: Response,
+        http_attempts: dict,
+        sleep_timer: float,
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Record a retry after an error response in :attr:`metrics`.
+
+        See: :attr:`pagerduty.ApiClient._response_cooldown`
+        """
+        cooldown = super()._response_cooldown(
+            endpoint, response, http_attempts, sleep_timer
+        )
+        if cooldown is not None:
+            self.metrics.record_retry(
+                self._metrics_endpoint(*endpoint.split(" ", 1))
+            )
+        return cooldown
+
+    def _total_from_response(self, url: str, response: Response) -> int:
+        """
+        Extract the total number of records from a classic pagination response.
+
+        :param url:
+            The URL that was requested
+        :param response:
+            The successful response
+        """
+        response_json = try_decoding(response)
+        if "total" not in response_json:
+            path = self.canonical_path(url)
+            raise ServerHttpError(
+                f'Response from endpoint GET {path} lacks a "total" property. '
+                "This may be because the endpoint does not support classic "
+                "pagination, or implements it incompletely or incorrectly.",
+                response,
+            )
+        return int(response_json["total"])
+
+    def _total_params(self, params: Optional[dict] = None) -> dict:
+        """
+        Compose the query parameters for a request for the total record count.
+        """
+        query_params = deepcopy(params)
+        if query_params is None:
+            query_params = {}
+        query_params.update({"total": True, "limit": 1, "offset": 0})
+        return query_params
+
+    @property
+    def api_call_counts(self) -> MutableMapping:
+        """
+        A dict-like object recording the number of API calls per endpoint.
+
+        This is a live view of :attr:`metrics`. Items can be set or deleted,
+        and assigning a dict to it replaces the call counts, i.e. ``{}`` to
+        clear them.
+        """
+        return self.metrics.totals_view("calls")
+
+    @api_call_counts.setter
+    def api_call_counts(self, value: dict):
+        self.metrics.replace_totals("calls", value)
+
+    @property
+    def api_time(self) -> MutableMapping:
+        """
+        A dict-like object recording the total time of API calls per endpoint.
+
+        This is a live view of :attr:`metrics`. Items can be set or deleted,
+        and assigning a dict to it replaces the times, i.e. ``{}`` to clear
+        them.
+        """
+        return self.metrics.totals_view("time")
+
+    @api_time.setter
+    def api_time(self, value: dict):
+        self.metrics.replace_totals("time", value)
+
     @property
     def auth_type(self) -> str:
         """
@@ -618,15 +1073,31 @@ class RestApiV2BaseClient(ApiClient):
         :returns:
             The canonical path corresponding to the URL.
         """
-        return canonical_path(self.canonical_paths, self.url, url)
+        return canonical_path(self.canonical_path_trie, self.url, url)
 
     @property
-    def canonical_paths(self) -> List[CanonicalPath]:
+    def canonical_path_trie(self) -> CanonicalPathTrie:
         """
-        List of canonical paths supported by the particular API client.
+        Index of :attr:`canonical_paths` used for matching URLs to them.
 
-        Child classes that do not implement this method do not a-priori support
-        any API endpoints for features that require entity wrapping, e.g.
+        It is constructed once per client class, the first time it is needed.
+        """
+        cls = type(self)
+        # Look up in the class's own namespace so that subclasses, which may
+        # support a different set of paths, don't reuse their parent's index:
+        trie = cls.__dict__.get("_canonical_path_trie")
+        if trie is None:
+            trie = CanonicalPathTrie(self.canonical_paths)
+            cls._canonical_path_trie = trie
+        return trie
+
+    @property
+    def canonical_paths(self) -> List[CanonicalPath]:
+        """
+        List of canonical paths supported by the particular API client.
+
+        Child classes that do not implement this method do not a-priori support
+        any API endpoints for features that require entity wrapping, e.g.
         pagination.
 
         This value is used as the first argument to
@@ -642,32 +1113,6 @@ class RestApiV2BaseClient(ApiClient):
         """
         return []
 
-    def dict_all(self, path: str, by: str = "id", **kw) -> dict:
-        """
-        Dictionary representation of all results from an index endpoint.
-
-        With the exception of ``by``, all keyword arguments passed to this
-        method are also passed to :attr:`iter_all`; see the documentation on
-        that method for further details.
-
-        :param path:
-            The index endpoint URL to use.
-        :param by:
-            The attribute of each object to use for the key values of the
-            dictionary.  This is ``id`` by default. Please note, there is no
-            uniqueness validation, so if you use an attribute that is not
-            distinct for the data set, this function will omit some data in the
-            results. If a property is named that the schema of the API
-            requested does not have, this method will raise ``KeyError``.
-        :param kw:
-            Keyword arguments to pass to :attr:`iter_all`.
-        :returns:
-            A dictionary keyed by the values of the property of each result
-            specified by the ``by`` parameter.
-        """
-        iterator = self.iter_all(path, **kw)
-        return {obj[by]: obj for obj in iterator}
-
     @property
     def entity_wrapper_config(self) -> dict:
         """
@@ -702,7 +1147,207 @@ class RestApiV2BaseClient(ApiClient):
         :returns:
             The entity wrapper tuple to use in the given request.
         """
-        return entity_wrappers(self.entity_wrapper_config, http_method, path)
+        return self.entity_wrapper_table.lookup(http_method, path)
+
+    @property
+    def entity_wrapper_table(self) -> EntityWrapperTable:
+        """
+        Precompiled :attr:`entity_wrapper_config` used for looking up wrappers.
+
+        It is constructed once per client class, the first time it is needed.
+        """
+        cls = type(self)
+        table = cls.__dict__.get("_entity_wrapper_table")
+        if table is None:
+            table = EntityWrapperTable(self.entity_wrapper_config)
+            cls._entity_wrapper_table = table
+        return table
+
+    def postprocess(self, response: Response, suffix: Optional[str] = None):
+        """
+        Records performance information / request metadata about the API call.
+
+        :param response:
+            The `httpx2.Response`_ object returned by the request method
+        :param suffix:
+            Optional suffix to append to the key
+        :type method: str
+        :type response: `httpx2.Response`_
+        :type suffix: str or None
+        """
+        method = response.request.method.upper()
+        url = str(response.request.url)
+        status = response.status_code
+        request_date = response.headers.get("date", "(missing header)")
+        request_id = response.headers.get("x-request-id", "(missing header)")
+        request_time = response.elapsed.total_seconds()
+
+        self.metrics.record(
+            self._metrics_endpoint(method, url),
+            status,
+            request_time,
+            num_bytes=response.num_bytes_downloaded,
+        )
+
+        # Request ID / timestamp logging
+        self.log.debug(
+            "Request completed: #method=%s|#url=%s|#status=%d|"
+            "#x_request_id=%s|#date=%s|#wall_time_s=%g",
+            method,
+            url,
+            status,
+            request_id,
+            request_date,
+            request_time,
+        )
+        if int(status // 100) == 5:
+            self.log.error(
+                "PagerDuty API server error (%d)! "
+                "For additional diagnostics, contact PagerDuty support "
+                "and reference x_request_id=%s / date=%s",
+                status,
+                request_id,
+                request_date,
+            )
+
+    @property
+    def total_call_count(self) -> int:
+        """The total number of API calls made by this instance."""
+        return sum(self.metrics.totals("calls").values())
+
+    @property
+    def total_call_time(self) -> float:
+        """The total time spent making API calls."""
+        return sum(self.metrics.totals("time").values())
+
+
+class RestApiV2BaseClient(RestApiV2BaseClientMixin, ApiClient):
+    """
+    Abstract base class of API clients supporting APIs similar to REST API v2.
+
+    This class implements some common features like numeric pagination that
+    also appear and are supported to varying degrees outside of REST API v2.
+
+    Configuration and behavior common to this class and
+    :class:`AsyncRestApiV2BaseClient` is documented in
+    :class:`pagerduty.rest_api_v2_base_client.RestApiV2BaseClientMixin`.
+
+    :param api_key:
+        REST API access token to use for HTTP requests.
+    :param auth_type:
+        The type of credential in use. This parameter determines how the
+        ``Authorization`` header is constructed for API requests.
+            - For OAuth access tokens, set this to ``oauth2`` or ``bearer``.
+            - To send the credential string exactly as provided (without any
+              prefix formatting), set this to ``header_passthru``.
+            - For classic API tokens, the default value ``token`` should be used.
+    :param debug:
+        Sets :attr:`pagerduty.ApiClient.print_debug`. Set to ``True`` to enable
+        verbose command-line output.
+    :param base_url:
+        Sets the base API URL to be used by the client for all API calls.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        auth_type: str = "token",
+        debug: bool = False,
+        base_url=None,
+        **kw,
+    ):
+        self.metrics = ApiMetrics()
+        self.auth_type = auth_type
+        auth_method = self._build_auth_method(api_key)
+        super(RestApiV2BaseClient, self).__init__(
+            auth_method, debug=debug, base_url=base_url, **kw
+        )
+
+    def _prefetch_pages(
+        self,
+        url: str,
+        path: CanonicalPath,
+        wrapper: EntityWrapper,
+        data: dict,
+        offsets: List[int],
+        concurrency: int,
+    ) -> Iterator[list]:
+        """
+        Request pages of classic pagination in parallel and yield them in order
+
+        At most ``concurrency`` requests are in flight at any given time.
+        Iteration stops early if a page indicates that there are no more
+        results, in which case requests that have not yet started are
+        cancelled.
+
+        :param url:
+            The index endpoint URL
+        :param path:
+            The canonical path of the URL
+        :param wrapper:
+            The entity wrapper of the response
+        :param data:
+            Query parameters to send with each request; the ``offset`` of each
+            will be replaced with an entry in ``offsets``
+        :param offsets:
+            Offsets of the pages to request
+        :param concurrency:
+            The number of requests to perform in parallel
+        :yields:
+            Lists of results, one for each page
+        """
+
+        def fetch(page_offset: int) -> Tuple[list, bool, Union[int, str]]:
+            page_params = dict(data, offset=page_offset)
+            r = successful_response(
+                self.get(url, params=page_params),
+                context="classic pagination",
+            )
+            return self._classic_pagination_page(r, path, wrapper)
+
+        remaining = iter(offsets)
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        pending = deque(
+            pool.submit(fetch, page_offset)
+            for page_offset in islice(remaining, concurrency)
+        )
+        try:
+            while pending:
+                results, more, _ = pending.popleft().result()
+                next_offset = next(remaining, None)
+                if next_offset is not None:
+                    pending.append(pool.submit(fetch, next_offset))
+                yield results
+                if not more:
+                    return
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def dict_all(self, path: str, by: str = "id", **kw) -> dict:
+        """
+        Dictionary representation of all results from an index endpoint.
+
+        With the exception of ``by``, all keyword arguments passed to this
+        method are also passed to :attr:`iter_all`; see the documentation on
+        that method for further details.
+
+        :param path:
+            The index endpoint URL to use.
+        :param by:
+            The attribute of each object to use for the key values of the
+            dictionary.  This is ``id`` by default. Please note, there is no
+            uniqueness validation, so if you use an attribute that is not
+            distinct for the data set, this function will omit some data in the
+            results. If a property is named that the schema of the API
+            requested does not have, this method will raise ``KeyError``.
+        :param kw:
+            Keyword arguments to pass to :attr:`iter_all`.
+        :returns:
+            A dictionary keyed by the values of the property of each result
+            specified by the ``by`` parameter.
+        """
+        iterator = self.iter_all(path, **kw)
+        return {obj[by]: obj for obj in iterator}
 
     def get_total(self, url: str, params: Optional[dict] = None) -> int:
         """
@@ -718,21 +1363,9 @@ class RestApiV2BaseClient(ApiClient):
         :returns:
             The total number of results from the endpoint given the parameters.
         """
-        query_params = deepcopy(params)
-        if query_params is None:
-            query_params = {}
-        query_params.update({"total": True, "limit": 1, "offset": 0})
+        query_params = self._total_params(params)
         response = successful_response(self.get(url, params=query_params))
-        response_json = try_decoding(response)
-        if "total" not in response_json:
-            path = self.canonical_path(url)
-            raise ServerHttpError(
-                f'Response from endpoint GET {path} lacks a "total" property. '
-                "This may be because the endpoint does not support classic "
-                "pagination, or implements it incompletely or incorrectly.",
-                response,
-            )
-        return int(response_json["total"])
+        return self._total_from_response(url, response)
 
     def iter_all(
         self,
@@ -741,6 +1374,7 @@ class RestApiV2BaseClient(ApiClient):
         page_size: Optional[int] = None,
         item_hook: Optional[Callable[..., Any]] = None,
         total: Optional[bool] = False,
+        concurrency: Optional[int] = None,
     ) -> Iterator[dict]:
         """
         Iterator for the contents of an index endpoint or query.
@@ -785,79 +1419,53 @@ class RestApiV2BaseClient(ApiClient):
             total count of records that match the query. Leaving this as False
             confers a small performance advantage, as the API in this case does
             not have to compute the total count of results in the query.
+        :param concurrency:
+            If set to a number greater than 1, then after the first page is
+            received, the remaining pages will be requested in parallel using
+            up to this many threads, and results will still be yielded in
+            order. The offsets of all pages are computed from the total count
+            of records reported in the first response, so this implies
+            ``total=True``. It is not applicable to endpoints that use
+            cursor-based pagination.
         :yields:
             Results from each page of results.
         """
         # Get entity wrapping and validate that the URL being requested is
         # likely to support pagination:
         path = self.canonical_path(url)
-        endpoint = f"GET {path}"
 
         # Short-circuit to cursor-based pagination if appropriate:
         if path in self.cursor_based_pagination_paths:
-            return self.iter_cursor(
+            yield from self.iter_cursor(
                 url, params=params, page_size=page_size, item_hook=item_hook
             )
+            return
 
-        nodes = path.split("/")
-        if is_path_param(nodes[-1]):
-            # NOTE: If this happens for a newer endpoint in REST API v2, and
-            # the final path parameter is one of a fixed list of literal
-            # strings, the path might need to be added to the EXPAND_PATHS
-            # dictionary in scripts/get_path_list/get_path_list.py, after which
-            # CANONICAL_PATHS will then need to be updated accordingly based on
-            # the new output of the script.
-            raise UrlError(
-                f"Path {path} (URL={url}) is formatted like an "
-                "individual resource versus a resource collection. It is "
-                "therefore assumed to not support pagination."
-            )
-        _, wrapper = self.entity_wrappers("GET", path)
-
-        if wrapper is None:
-            raise UrlError(f"Pagination is not supported for {endpoint}.")
-
-        # Parameters to send:
-        data = {
-            "limit": (self.default_page_size, page_size)[int(bool(page_size))],
-        }
-        if total is not None:
-            # This is to ensure that the correct literal string is passed
-            # through as the final parameter value rather than letting the HTTP
-            # client middleware serialize it as it sees fit. The PagerDuty API
-            # requires lower case "true/false".
-            data["total"] = str(total).lower()
-        if isinstance(params, (dict, list)):
-            # Override defaults with values given:
-            data.update(dict(params))
-
+        prefetch = concurrency is not None and concurrency > 1
+        if prefetch:
+            total = True
+        wrapper, data, offset = self._classic_pagination_params(
+            url, path, params=params, page_size=page_size, total=total
+        )
         more = True
-        offset = 0
-        if params is not None:
-            offset = int(params.get("offset", 0))
         n = 0
         while more:
             # Check the offset and limit:
             data["offset"] = offset
-            highest_record_index = int(data["offset"]) + int(data["limit"])
-            if highest_record_index > ITERATION_LIMIT:
-                iter_limit = "%d" % ITERATION_LIMIT
-                warn(
-                    f"Stopping iter_all on {endpoint} at "
-                    f"limit+offset={highest_record_index} "
-                    "as this exceeds the maximum permitted by the API "
-                    f"({iter_limit}). The set of results may be incomplete."
-                )
+            if self._exceeds_iteration_limit(path, data):
                 return
 
             # Make the request and validate/unpack the response:
             r = successful_response(
                 self.get(url, params=data.copy()), context="classic pagination"
             )
-            body = try_decoding(r)
-            results = unwrap(r, wrapper)
+            results, more, total_count = self._classic_pagination_page(
+                r, path, wrapper
+            )
+            if self.hooks is not None:
+                self.hooks.page(self, path, results)
 
-            # Validate and update pagination parameters
+            # Update pagination parameters
             #
             # Note, the number of the results in the actual response is always
             # the most appropriate amount to increment the offset by after
@@ -870,23 +1478,9 @@ class RestApiV2BaseClient(ApiClient):
             # it is that it could potentially result in skipping results or
             # yielding duplicates if there's a mismatch, or potentially issues
             # like PagerDuty/pdpyras#61
+            requested_limit = data["limit"]
             data["limit"] = len(results)
             offset += data["limit"]
-            more = False
-            if "total" in body:
-                total_count = body["total"]
-            else:
-                total_count = "?"
-            if "more" in body:
-                more = body["more"]
-            else:
-                warn(
-                    f'Response from endpoint GET {path} lacks a "more" '
-                    "property and therefore does not support pagination. Only "
-                    "results from the first request will be yielded. You can "
-                    'use "rget" with this endpoint instead to avoid this'
-                    "warning."
-                )
 
             # Perform per-page actions on the response data
             for result in results:
@@ -896,6 +1490,28 @@ class RestApiV2BaseClient(ApiClient):
                     item_hook(result, n, total_count)
                 yield result
 
+            # Once the total is known, the remaining pages can be fetched in
+            # parallel, since their offsets are all predictable:
+            if more and prefetch and isinstance(total_count, int):
+                data["offset"] = offset
+                if not results:
+                    # An empty page doesn't indicate the page size, so fall
+                    # back to the limit that was requested:
+                    data["limit"] = requested_limit
+                    data["offset"] = offset + int(requested_limit)
+                offsets = self._prefetch_offsets(path, data, total_count)
+                for results in self._prefetch_pages(
+                    url, path, wrapper, data, offsets, concurrency
+                ):
+                    if self.hooks is not None:
+                        self.hooks.page(self, path, results)
+                    for result in results:
+                        n += 1
+                        if hasattr(item_hook, "__call__"):
+                            item_hook(result, n, total_count)
+                        yield result
+                return
+
     def iter_cursor(
         self,
         url: str,
@@ -920,15 +1536,9 @@ class RestApiV2BaseClient(ApiClient):
             Results from each page of results.
         """
         path = self.canonical_path(url)
-        if path not in self.cursor_based_pagination_paths:
-            raise UrlError(f"{path} does not support cursor-based pagination.")
-        _, wrapper = self.entity_wrappers("GET", path)
-        user_params = {
-            "limit": (self.default_page_size, page_size)[int(bool(page_size))]
-        }
-        if isinstance(params, (dict, list)):
-            # Override defaults with values given:
-            user_params.update(dict(params))
+        wrapper, user_params = self._cursor_pagination_params(
+            path, params=params, page_size=page_size
+        )
 
         more = True
         next_cursor = None
@@ -945,7 +1555,9 @@ class RestApiV2BaseClient(ApiClient):
 
             # Unpack and yield results
             body = try_decoding(r)
-            results = unwrap(r, wrapper)
+            results = unwrap(r, wrapper, body=body)
+            if self.hooks is not None:
+                self.hooks.page(self, path, results)
             for result in results:
                 total += 1
                 if hasattr(item_hook, "__call__"):
@@ -992,58 +1604,6 @@ class RestApiV2BaseClient(ApiClient):
         """
         return list(self.iter_all(url, **kw))
 
-    def postprocess(self, response: Response, suffix: Optional[str] = None):
-        """
-        Records performance information / request metadata about the API call.
-
-        :param response:
-            The `httpx2.Response`_ object returned by the request method
-        :param suffix:
-            Optional suffix to append to the key
-        :type method: str
-        :type response: `httpx2.Response`_
-        :type suffix: str or None
-        """
-        method = response.request.method.upper()
-        url = str(response.request.url)
-        status = response.status_code
-        request_date = response.headers.get("date", "(missing header)")
-        request_id = response.headers.get("x-request-id", "(missing header)")
-        request_time = response.elapsed.total_seconds()
-
-        try:
-            endpoint = "%s %s" % (method, self.canonical_path(url))
-        except UrlError:
-            # This is necessary so that profiling can also support using the
-            # basic get / post / put / delete methods with APIs that are not yet
-            # explicitly supported by inclusion in CANONICAL_PATHS.
-            endpoint = "%s %s" % (method, url)
-        self.api_call_counts.setdefault(endpoint, 0)
-        self.api_time.setdefault(endpoint, 0.0)
-        self.api_call_counts[endpoint] += 1
-        self.api_time[endpoint] += request_time
-
-        # Request ID / timestamp logging
-        self.log.debug(
-            "Request completed: #method=%s|#url=%s|#status=%d|"
-            "#x_request_id=%s|#date=%s|#wall_time_s=%g",
-            method,
-            url,
-            status,
-            request_id,
-            request_date,
-            request_time,
-        )
-        if int(status // 100) == 5:
-            self.log.error(
-                "PagerDuty API server error (%d)! "
-                "For additional diagnostics, contact PagerDuty support "
-                "and reference x_request_id=%s / date=%s",
-                status,
-                request_id,
-                request_date,
-            )
-
     @resource_url
     @requires_success
     def rdelete(self, resource: Union[str, dict], **kw) -> Response:
@@ -1120,12 +1680,288 @@ class RestApiV2BaseClient(ApiClient):
         """
         return self.put(resource, **kw)
 
-    @property
-    def total_call_count(self) -> int:
-        """The total number of API calls made by this instance."""
-        return sum(self.api_call_counts.values())
 
-    @property
-    def total_call_time(self) -> float:
-        """The total time spent making API calls."""
-        return sum(self.api_time.values())
+class AsyncRestApiV2BaseClient(RestApiV2BaseClientMixin, AsyncApiClient):
+    """
+    Asynchronous counterpart of :class:`RestApiV2BaseClient`.
+
+    All request methods are coroutines, and the pagination methods
+    :attr:`iter_all` and :attr:`iter_cursor` are asynchronous generators, i.e.
+
+    .. code-block:: python
+
+        async for incident in client.iter_all('/incidents'):
+            ...
+
+    For constructor arguments, see :class:`RestApiV2BaseClient`.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        auth_type: str = "token",
+        debug: bool = False,
+        base_url=None,
+        **kw,
+    ):
+        self.metrics = ApiMetrics()
+        self.auth_type = auth_type
+        auth_method = self._build_auth_method(api_key)
+        super(AsyncRestApiV2BaseClient, self).__init__(
+            auth_method, debug=debug, base_url=base_url, **kw
+        )
+
+    async def _prefetch_pages(
+        self,
+        url: str,
+        path: CanonicalPath,
+        wrapper: EntityWrapper,
+        data: dict,
+        offsets: List[int],
+        concurrency: int,
+    ) -> AsyncIterator[list]:
+        """
+        Request pages of classic pagination concurrently and yield them in order
+
+        See: :attr:`pagerduty.RestApiV2BaseClient._prefetch_pages`
+        """
+
+        async def fetch(
+            page_offset: int,
+        ) -> Tuple[list, bool, Union[int, str]]:
+            page_params = dict(data, offset=page_offset)
+            r = successful_response(
+                await self.get(url, params=page_params),
+                context="classic pagination",
+            )
+            return self._classic_pagination_page(r, path, wrapper)
+
+        remaining = iter(offsets)
+        pending = deque(
+            asyncio.ensure_future(fetch(page_offset))
+            for page_offset in islice(remaining, concurrency)
+        )
+        try:
+            while pending:
+                results, more, _ = await pending.popleft()
+                next_offset = next(remaining, None)
+                if next_offset is not None:
+                    pending.append(asyncio.ensure_future(fetch(next_offset)))
+                yield results
+                if not more:
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def dict_all(self, path: str, by: str = "id", **kw) -> dict:
+        """
+        Dictionary representation of all results from an index endpoint.
+
+        See: :attr:`pagerduty.RestApiV2BaseClient.dict_all`
+        """
+        return {obj[by]: obj async for obj in self.iter_all(path, **kw)}
+
+    async def get_total(self, url: str, params: Optional[dict] = None) -> int:
+        """
+        Gets the total count of records from a classic pagination index endpoint.
+
+        See: :attr:`pagerduty.RestApiV2BaseClient.get_total`
+        """
+        query_params = self._total_params(params)
+        response = successful_response(
+            await self.get(url, params=query_params)
+        )
+        return self._total_from_response(url, response)
+
+    async def iter_all(
+        self,
+        url,
+        params: Optional[dict] = None,
+        page_size: Optional[int] = None,
+        item_hook: Optional[Callable[..., Any]] = None,
+        total: Optional[bool] = False,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Asynchronous iterator for the contents of an index endpoint or query.
+
+        If ``concurrency`` is greater than 1, the remaining pages after the
+        first are requested concurrently as tasks in the running event loop.
+
+        See: :attr:`pagerduty.RestApiV2BaseClient.iter_all`
+        """
+        path = self.canonical_path(url)
+
+        if path in self.cursor_based_pagination_paths:
+            async for result in self.iter_cursor(
+                url, params=params, page_size=page_size, item_hook=item_hook
+            ):
+                yield result
+            return
+
+        prefetch = concurrency is not None and concurrency > 1
+        if prefetch:
+            total = True
+        wrapper, data, offset = self._classic_pagination_params(
+            url, path, params=params, page_size=page_size, total=total
+        )
+        more = True
+        n = 0
+        while more:
+            data["offset"] = offset
+            if self._exceeds_iteration_limit(path, data):
+                return
+            r = successful_response(
+                await self.get(url, params=data.copy()),
+                context="classic pagination",
+            )
+            results, more, total_count = self._classic_pagination_page(
+                r, path, wrapper
+            )
+            if self.hooks is not None:
+                self.hooks.page(self, path, results)
+            requested_limit = data["limit"]
+            data["limit"] = len(results)
+            offset += data["limit"]
+            for result in results:
+                n += 1
+                if hasattr(item_hook, "__call__"):
+                    item_hook(result, n, total_count)
+                yield result
+            if more and prefetch and isinstance(total_count, int):
+                data["offset"] = offset
+                if not results:
+                    # An empty page doesn't indicate the page size, so fall
+                    # back to the limit that was requested:
+                    data["limit"] = requested_limit
+                    data["offset"] = offset + int(requested_limit)
+                offsets = self._prefetch_offsets(path, data, total_count)
+                async for results in self._prefetch_pages(
+                    url, path, wrapper, data, offsets, concurrency
+                ):
+                    if self.hooks is not None:
+                        self.hooks.page(self, path, results)
+                    for result in results:
+                        n += 1
+                        if hasattr(item_hook, "__call__"):
+                            item_hook(result, n, total_count)
+                        yield result
+                return
+
+    async def iter_cursor(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        item_hook: Optional[Callable[..., Any]] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Asynchronous iterator for an endpoint using cursor-based pagination.
+
+        See: :attr:`pagerduty.RestApiV2BaseClient.iter_cursor`
+        """
+        path = self.canonical_path(url)
+        wrapper, user_params = self._cursor_pagination_params(
+            path, params=params, page_size=page_size
+        )
+        more = True
+        next_cursor = None
+        total = 0
+        while more:
+            if next_cursor:
+                user_params.update({"cursor": next_cursor})
+            r = successful_response(
+                await self.get(url, params=user_params),
+                context="cursor-based pagination",
+            )
+            body = try_decoding(r)
+            results = unwrap(r, wrapper, body=body)
+            if self.hooks is not None:
+                self.hooks.page(self, path, results)
+            for result in results:
+                total += 1
+                if hasattr(item_hook, "__call__"):
+                    item_hook(result, total, "?")
+                yield result
+            next_cursor = body.get("next_cursor", None)
+            more = bool(next_cursor)
+
+    @resource_url
+    @auto_json
+    async def jget(self, url: Union[str, dict], **kw) -> Union[dict, list]:
+        """
+        Performs a GET request, returning the JSON-decoded body as a dictionary
+        """
+        return await self.get(url, **kw)
+
+    @resource_url
+    @auto_json
+    async def jpost(self, url: Union[str, dict], **kw) -> Union[dict, list]:
+        """
+        Performs a POST request, returning the JSON-decoded body
+        """
+        return await self.post(url, **kw)
+
+    @resource_url
+    @auto_json
+    async def jput(
+        self, url: Union[str, dict], **kw
+    ) -> Optional[Union[dict, list]]:
+        """
+        Performs a PUT request, returning the JSON-decoded body
+        """
+        return await self.put(url, **kw)
+
+    async def list_all(self, url: str, **kw) -> list:
+        """
+        Returns a list of all objects from a given index endpoint.
+
+        See: :attr:`pagerduty.RestApiV2BaseClient.list_all`
+        """
+        return [obj async for obj in self.iter_all(url, **kw)]
+
+    @resource_url
+    @requires_success
+    async def rdelete(self, resource: Union[str, dict], **kw) -> Response:
+        """
+        Delete a resource.
+
+        See: :attr:`pagerduty.RestApiV2BaseClient.rdelete`
+        """
+        return await self.delete(resource, **kw)
+
+    @resource_url
+    @wrapped_entities
+    async def rget(
+        self, resource: Union[str, dict], **kw
+    ) -> Union[dict, list]:
+        """
+        Wrapped-entity-aware GET function.
+
+        See: :attr:`pagerduty.RestApiV2BaseClient.rget`
+        """
+        return await self.get(resource, **kw)
+
+    @wrapped_entities
+    async def rpost(self, path: str, **kw) -> Union[dict, list]:
+        """
+        Wrapped-entity-aware POST function.
+
+        See: :attr:`pagerduty.RestApiV2BaseClient.rpost`
+        """
+        return await self.post(path, **kw)
+
+    @resource_url
+    @wrapped_entities
+    async def rput(
+        self, resource: Union[str, dict], **kw
+    ) -> Optional[Union[dict, list]]:
+        """
+        Wrapped-entity-aware PUT function.
+
+        See: :attr:`pagerduty.RestApiV2BaseClient.rput`
+        """
+        return await self.put(resource, **kw)
@@ -1,17 +1,33 @@
 # Core
+import asyncio
+import functools
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
+from itertools import islice
 from sys import getrecursionlimit
-from typing import Iterator, List, Optional
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 from warnings import warn
 
 # Local
-from .common import datetime_intervals, strftime, truncate_text, try_decoding
+from .common import (
+    datetime_intervals,
+    strftime,
+    successful_response,
+    truncate_text,
+    try_decoding,
+)
 from .errors import Error, HttpError, UrlError
 from .rest_api_v2_base_client import (
     ITERATION_LIMIT,
+    AsyncRestApiV2BaseClient,
     CanonicalPath,
+    CanonicalPathTrie,
+    EntityWrapper,
     RestApiV2BaseClient,
+    RestApiV2BaseClientMixin,
     canonical_path as canonical_path_common,
     entity_wrappers as entity_wrappers_common,
     wrapped_entities,
@@ -24,7 +40,7 @@ from .rest_api_v2_base_client import (
 RECURSION_LIMIT = getrecursionlimit() // 2
 
 ITER_HIST_RECURSION_WARNING_TEMPLATE = """
-RestApiV2Client.iter_history cannot continue bisecting historical time
+RestApiV2Client.iter_history cannot continue subdividing historical time
 intervals because {reason}, but the total number of results in the current
 requested time sub-interval ({since_until}) still exceeds the hard limit for
 classic pagination, {iteration_limit}. Results will be incomplete.{suggestion}
@@ -508,7 +524,17 @@ def canonical_path(base_url: str, url: str) -> str:
     reasons it cannot be deprecated; as an internal helper method there is
     little chance it has seen use outside of the library.
     """
-    return canonical_path_common(CANONICAL_PATHS, base_url, url)
+    return canonical_path_common(_canonical_path_trie(), base_url, url)
+
+
+@functools.lru_cache(maxsize=None)
+def _canonical_path_trie() -> CanonicalPathTrie:
+    """
+    Index of :attr:`CANONICAL_PATHS` for :attr:`canonical_path`.
+
+    It is constructed the first time it is needed.
+    """
+    return CanonicalPathTrie(CANONICAL_PATHS)
 
 
 ###############################
@@ -527,18 +553,375 @@ def entity_wrappers(method: str, path: str) -> tuple:
     return entity_wrappers_common(ENTITY_WRAPPER_CONFIG, method, path)
 
 
+###############################
+### HISTORICAL RECORD TYPES ###
+###############################
+
+HistoryInterval = Tuple[datetime, datetime, int, Optional[float]]
+"""
+A time interval to be probed by iter_history.
+
+This is a tuple containing the beginning and end of the interval, the level of
+recursion at which it was produced, and the expected number of records in it,
+if known.
+"""
+
+HistoryLeaf = Tuple[datetime, datetime, int, Optional[Tuple[list, bool]]]
+"""
+A time interval that can be paginated by iter_history.
+
+This is a tuple containing the beginning and end of the interval, the total
+number of records in it, and if already requested, a tuple of the first page of
+records and whether there are more.
+"""
+
 ################
 # CLIENT CLASS #
 ################
 
 
-class RestApiV2Client(RestApiV2BaseClient):
+class RestApiV2ClientMixin(RestApiV2BaseClientMixin):
+    """
+    Features of REST API v2 clients that are independent of I/O model.
+
+    This class holds the REST API v2 configuration (canonical paths, entity
+    wrapping, headers, etc.) shared between :class:`RestApiV2Client` and
+    :class:`AsyncRestApiV2Client`.
+    """
+
+    default_from = None
+    """The default value to use as the ``From`` request header"""
+
+    history_leaf_size = ITERATION_LIMIT // 2
+    """
+    Target number of records per time interval paginated by iter_history.
+
+    When the total number of records in a time interval exceeds the maximum
+    that can be paginated, :attr:`RestApiV2Client.iter_history` divides it
+    into as many sub-intervals as it would take for each to contain at most
+    this many records if they were evenly distributed over time, and divides
+    again any sub-interval that still contains too many. A lower value makes
+    it less likely that sub-intervals will need to be divided again when
+    records are unevenly distributed, at the cost of paginating more
+    intervals.
+    """
+
+    def _init_default_headers(self, default_from: Optional[str] = None):
+        """
+        Set the default headers sent to REST API v2 with every request.
+
+        :param default_from:
+            The default value of the ``From`` header, if any.
+        """
+        self.default_from = default_from
+        if default_from is not None:
+            self.headers.update({"From": default_from})
+
+        self.headers.update(
+            {
+                "Accept": "application/vnd.pagerduty+json;version=2",
+            }
+        )
+
+    def _iter_history_is_leaf(
+        self,
+        total: int,
+        since: datetime,
+        until: datetime,
+        recursion_depth: int,
+        since_until: dict,
+    ) -> bool:
+        """
+        Whether to paginate a time interval in iter_history versus subdivide it.
+
+        A warning is logged if the interval cannot be subdivided any further
+        but still contains more results than can be retrieved.
+
+        :param total:
+            The total number of records in the interval
+        :param since:
+            The beginning of the interval
+        :param until:
+            The end of the interval
+        :param recursion_depth:
+            The current level of recursion
+        :param since_until:
+            The formatted ``since`` and ``until`` query parameters, for logging
+        """
+        can_fully_paginate = total <= ITERATION_LIMIT
+        min_interval_len = int((until - since).total_seconds()) == 1
+        stop_recursion = recursion_depth >= RECURSION_LIMIT
+        if not (can_fully_paginate or min_interval_len or stop_recursion):
+            return False
+        if not can_fully_paginate:
+            # Issue a warning log message
+            if stop_recursion:
+                reason = "the recursion depth limit has been reached"
+                suggestion = (
+                    " To avoid this issue, try requesting a smaller "
+                    "initial time interval."
+                )
+            elif min_interval_len:
+                reason = "the time interval is already the minimum length (1s)"
+                # In practice, this scenario can only happen if PagerDuty
+                # ingests and processes, for a single account, >10k alert
+                # history events in less than one second (to use
+                # `/log_entries` as an example). There is unfortunately
+                # nothing more that can be done in this case, though it is
+                # a very extreme case that we have yet to encounter.
+                suggestion = ""
+            self.log.warning(
+                ITER_HIST_RECURSION_WARNING_TEMPLATE.format(
+                    reason=reason,
+                    since_until=str(since_until),
+                    iteration_limit=ITERATION_LIMIT,
+                    suggestion=suggestion,
+                )
+            )
+        return True
+
+    def _iter_history_page_params(
+        self,
+        url: str,
+        params: dict,
+        interval: HistoryInterval,
+        page_size: Optional[int] = None,
+    ) -> Optional[Tuple[CanonicalPath, EntityWrapper, dict]]:
+        """
+        Compose the request for the first page of records in a time interval.
+
+        When probing a time interval in iter_history, if it might contain few
+        enough records to paginate, i.e. its expected total is unknown or
+        within :attr:`ITERATION_LIMIT`, a full page of records is requested
+        along with the total. That way, the first page doesn't have to be
+        requested again when paginating the interval.
+
+        :param url:
+            The index endpoint URL
+        :param params:
+            The query parameters given by the caller, if any
+        :param interval:
+            The time interval to probe
+        :param page_size:
+            The page size given by the caller, if any
+        :returns:
+            A tuple of the canonical path, entity wrapper and query parameters,
+            or None if only the total number of records should be requested
+        """
+        since, until, _, expected_total = interval
+        if expected_total is not None and expected_total > ITERATION_LIMIT:
+            return None
+        path = self.canonical_path(url)
+        wrapper, data, _ = self._classic_pagination_params(
+            url,
+            path,
+            params=self._iter_history_params(params, since, until),
+            page_size=page_size,
+            total=True,
+        )
+        data["offset"] = 0
+        return path, wrapper, data
+
+    def _iter_history_params(
+        self, params: dict, since: datetime, until: datetime
+    ) -> dict:
+        """
+        Add the time interval to query parameters for iter_history.
+
+        :param params:
+            The query parameters given by the caller, if any
+        :param since:
+            The beginning of the interval
+        :param until:
+            The end of the interval
+        :returns:
+            A new dictionary of query parameters
+        """
+        return dict(params, since=strftime(since), until=strftime(until))
+
+    def _iter_history_path(self, url: str) -> CanonicalPath:
+        """
+        Validate a URL for use with :attr:`RestApiV2Client.iter_history`.
+
+        :param url:
+            The index endpoint URL
+        :returns:
+            The canonical path of the URL
+        """
+        path = self.canonical_path(url)
+        if path not in HISTORICAL_RECORD_PATHS:
+            # Cannot continue; incompatible endpoint that doesn't accept
+            # since/until parameters:
+            raise UrlError(
+                f"Method iter_history does not support endpoint GET {path}"
+            )
+        elif path == "/oncalls":
+            # Warn for this specific endpoint but continue:
+            warn(
+                "iter_history may yield duplicate results when used with "
+                "GET /oncalls"
+            )
+        return path
+
+    def _iter_history_remainder(
+        self, leaf: HistoryLeaf, params: dict, kw: dict
+    ) -> Tuple[list, Optional[dict]]:
+        """
+        Plan the pagination of a time interval in iter_history.
+
+        If the first page of records in the interval was received when probing
+        it, the item hook (if any) is called for each record in it, and
+        pagination resumes at the next page.
+
+        :param leaf:
+            The time interval
+        :param params:
+            The query parameters given by the caller, if any
+        :param kw:
+            Keyword arguments given by the caller to pass to ``iter_all``
+        :returns:
+            A tuple of the records already received, which should be yielded
+            first, and keyword arguments for ``iter_all`` to yield the rest (or
+            None if there are no more)
+        """
+        since, until, total, page = leaf
+        all_kw = dict(
+            kw, params=self._iter_history_params(params, since, until)
+        )
+        if page is None:
+            return [], all_kw
+        results, more = page
+        item_hook = kw.get("item_hook")
+        if hasattr(item_hook, "__call__"):
+            hook_total = total if kw.get("total") else "?"
+            for n, result in enumerate(results, 1):
+                item_hook(result, n, hook_total)
+            n_received = len(results)
+            all_kw["item_hook"] = lambda result, n, total_count: item_hook(
+                result, n + n_received, total_count
+            )
+        if not more:
+            return results, None
+        all_kw["params"]["offset"] = len(results)
+        return results, all_kw
+
+    def _iter_history_split(
+        self, total: int, since: datetime, until: datetime
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Divide a time interval with too many records to paginate in iter_history.
+
+        :param total:
+            The total number of records in the interval
+        :param since:
+            The beginning of the interval
+        :param until:
+            The end of the interval
+        :returns:
+            The sub-intervals; see :attr:`history_leaf_size`
+        """
+        n = max(2, math.ceil(total / self.history_leaf_size))
+        return datetime_intervals(since, until, n=n)
+
+    def _iter_history_subdivide(
+        self,
+        intervals: List[HistoryInterval],
+        probes: List[Tuple[int, Optional[Tuple[list, bool]]]],
+    ) -> Tuple[List[HistoryLeaf], List[HistoryInterval]]:
+        """
+        Sort time intervals into ones to paginate and ones to subdivide further.
+
+        :param intervals:
+            The time intervals that were probed
+        :param probes:
+            The result of probing each interval: the total number of records in
+            it, and the first page of records and whether there are more (if
+            requested)
+        :returns:
+            A tuple containing a list of the intervals that can be paginated,
+            and a list of sub-intervals to probe next
+        """
+        leaves = []
+        subintervals = []
+        for interval, (total, page) in zip(intervals, probes):
+            since, until, recursion_depth, _ = interval
+            if total == 0:
+                continue
+            since_until = self._iter_history_params({}, since, until)
+            if self._iter_history_is_leaf(
+                total, since, until, recursion_depth, since_until
+            ):
+                leaves.append((since, until, total, page))
+            else:
+                split = self._iter_history_split(total, since, until)
+                subintervals.extend(
+                    (
+                        sub_since,
+                        sub_until,
+                        recursion_depth + 1,
+                        total / len(split),
+                    )
+                    for sub_since, sub_until in split
+                )
+        return leaves, subintervals
+
+    def after_set_auth_method(self):
+        self._subdomain = None
+        self._api_key_access = None
+
+    @property
+    def canonical_paths(self) -> List[CanonicalPath]:
+        return CANONICAL_PATHS
+
+    @property
+    def cursor_based_pagination_paths(self) -> List[CanonicalPath]:
+        return CURSOR_BASED_PAGINATION_PATHS
+
+    @property
+    def default_base_url(self) -> str:
+        return "https://api.pagerduty.com"
+
+    @property
+    def entity_wrapper_config(self) -> dict:
+        return ENTITY_WRAPPER_CONFIG
+
+    def normalize_params(self, params: dict) -> dict:
+        """
+        Modify the user-supplied parameters to ease implementation.
+
+        Current behavior:
+
+        * If a parameter's value is of type list, and the parameter name does
+          not already end in "[]", then the square brackets are appended to
+          keep in line with the requirement that all set filters' parameter
+          names end in "[]".
+
+        :returns:
+            The query parameters after modification
+        """
+        updated_params = {}
+        for param, value in params.items():
+            if type(value) is list and not param.endswith("[]"):
+                updated_params[param + "[]"] = value
+            else:
+                updated_params[param] = value
+        return updated_params
+
+    @property
+    def permitted_methods(self) -> tuple:
+        return ("GET", "PATCH", "POST", "PUT", "DELETE")
+
+
+class RestApiV2Client(RestApiV2ClientMixin, RestApiV2BaseClient):
     """
     PagerDuty REST API v2 client class.
 
     Implements abstractions for the particular features of PagerDuty's REST API
     v2.  Inherits from :class:`pagerduty.RestApiV2BaseClient`.
 
+    For an asynchronous client with the same configuration, see
+    :class:`AsyncRestApiV2Client`.
+
     :param api_key:
         REST API access token to use for HTTP requests.
     :param default_from:
@@ -556,9 +939,6 @@ class RestApiV2Client(RestApiV2BaseClient):
         Sets the base API URL to be used by the client for all API calls.
     """
 
-    default_from = None
-    """The default value to use as the ``From`` request header"""
-
     def __init__(
         self,
         api_key: str,
@@ -571,16 +951,157 @@ class RestApiV2Client(RestApiV2BaseClient):
         super(RestApiV2Client, self).__init__(
             api_key, auth_type, debug=debug, base_url=base_url, **kw
         )
+        self._init_default_headers(default_from)
 
-        self.default_from = default_from
-        if default_from is not None:
-            self.headers.update({"From": default_from})
+    def _iter_history_concurrently(
+        self,
+        url: str,
+        params: dict,
+        intervals: List[HistoryInterval],
+        concurrency: int,
+        **kw,
+    ) -> Iterator[dict]:
+        """
+        Yield historical records, making requests in parallel.
 
-        self.headers.update(
-            {
-                "Accept": "application/vnd.pagerduty+json;version=2",
-            }
+        See: :attr:`iter_history`
+
+        :param url:
+            The index endpoint URL
+        :param params:
+            The query parameters given by the caller, if any
+        :param intervals:
+            The time intervals to probe
+        :param concurrency:
+            The number of requests to perform in parallel
+        :param kw:
+            Keyword arguments to pass to :attr:`iter_all`
+        :yields:
+            The records in the time intervals, in chronological order
+        """
+        page_size = kw.get("page_size")
+
+        def probe(interval: HistoryInterval) -> tuple:
+            return self._iter_history_probe(url, params, interval, page_size)
+
+        def paginate(leaf: HistoryLeaf) -> List[dict]:
+            return list(self._iter_history_leaf(url, params, leaf, **kw))
+
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            leaves = []
+            while intervals:
+                new_leaves, intervals = self._iter_history_subdivide(
+                    intervals, list(pool.map(probe, intervals))
+                )
+                leaves.extend(new_leaves)
+            remaining = iter(sorted(leaves, key=lambda leaf: leaf[0]))
+            pending = deque(
+                pool.submit(paginate, leaf)
+                for leaf in islice(remaining, concurrency)
+            )
+            while pending:
+                results = pending.popleft().result()
+                leaf = next(remaining, None)
+                if leaf is not None:
+                    pending.append(pool.submit(paginate, leaf))
+                yield from results
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_history_leaf(
+        self, url: str, params: dict, leaf: HistoryLeaf, **kw
+    ) -> Iterator[dict]:
+        """
+        Yield the records in a time interval that can be fully paginated.
+
+        :param url:
+            The index endpoint URL
+        :param params:
+            The query parameters given by the caller, if any
+        :param leaf:
+            The time interval
+        :param kw:
+            Keyword arguments to pass to :attr:`iter_all`
+        """
+        results, all_kw = self._iter_history_remainder(leaf, params, kw)
+        yield from results
+        if all_kw is not None:
+            yield from self.iter_all(url, **all_kw)
+
+    def _iter_history_probe(
+        self,
+        url: str,
+        params: dict,
+        interval: HistoryInterval,
+        page_size: Optional[int] = None,
+    ) -> Tuple[int, Optional[Tuple[list, bool]]]:
+        """
+        Get the total number of records in a time interval for iter_history.
+
+        See :attr:`_iter_history_page_params` regarding when the first page of
+        records is also requested.
+
+        :param url:
+            The index endpoint URL
+        :param params:
+            The query parameters given by the caller, if any
+        :param interval:
+            The time interval
+        :param page_size:
+            The page size given by the caller, if any
+        :returns:
+            A tuple of the total number of records, and if requested, a tuple
+            of the first page of records and whether there are more
+        """
+        request = self._iter_history_page_params(
+            url, params, interval, page_size
         )
+        if request is None:
+            since, until = interval[:2]
+            total = self.get_total(
+                url, params=self._iter_history_params(params, since, until)
+            )
+            return total, None
+        path, wrapper, data = request
+        response = successful_response(
+            self.get(url, params=data), context="classic pagination"
+        )
+        total = self._total_from_response(url, response)
+        results, more, _ = self._classic_pagination_page(
+            response, path, wrapper
+        )
+        return total, (results, more)
+
+    def _iter_history_serially(
+        self, url: str, params: dict, intervals: List[HistoryInterval], **kw
+    ) -> Iterator[dict]:
+        """
+        Yield historical records, making requests one at a time.
+
+        See: :attr:`iter_history`
+
+        :param url:
+            The index endpoint URL
+        :param params:
+            The query parameters given by the caller, if any
+        :param intervals:
+            The time intervals to probe
+        :param kw:
+            Keyword arguments to pass to :attr:`iter_all`
+        """
+        for interval in intervals:
+            probe = self._iter_history_probe(
+                url, params, interval, kw.get("page_size")
+            )
+            leaves, subintervals = self._iter_history_subdivide(
+                [interval], [probe]
+            )
+            for leaf in leaves:
+                yield from self._iter_history_leaf(url, params, leaf, **kw)
+            yield from self._iter_history_serially(
+                url, params, subintervals, **kw
+            )
 
     def account_has_ability(self, ability: str) -> bool:
         """
@@ -614,10 +1135,6 @@ class RestApiV2Client(RestApiV2BaseClient):
             )
         return False
 
-    def after_set_auth_method(self):
-        self._subdomain = None
-        self._api_key_access = None
-
     @property
     def api_key_access(self) -> str:
         """
@@ -650,22 +1167,6 @@ class RestApiV2Client(RestApiV2BaseClient):
                 self._api_key_access = "user"
         return self._api_key_access
 
-    @property
-    def canonical_paths(self) -> List[CanonicalPath]:
-        return CANONICAL_PATHS
-
-    @property
-    def cursor_based_pagination_paths(self) -> List[CanonicalPath]:
-        return CURSOR_BASED_PAGINATION_PATHS
-
-    @property
-    def default_base_url(self) -> str:
-        return "https://api.pagerduty.com"
-
-    @property
-    def entity_wrapper_config(self) -> dict:
-        return ENTITY_WRAPPER_CONFIG
-
     def find(
         self,
         resource: str,
@@ -825,6 +1326,7 @@ class RestApiV2Client(RestApiV2BaseClient):
         since: datetime,
         until: datetime,
         recursion_depth: int = 0,
+        concurrency: Optional[int] = None,
         **kw,
     ) -> Iterator[dict]:
         """
@@ -833,8 +1335,22 @@ class RestApiV2Client(RestApiV2BaseClient):
         This method works around the hard maximum result limit in classic
         pagination (see: `Pagination
         <https://developer.pagerduty.com/docs/pagination>`_) by recursively
-        bisecting the initially-provided time interval until the total number
+        subdividing the initially-provided time interval until the total number
         of results in each sub-interval is less than the hard pagination limit.
+        The number of sub-intervals is chosen according to the total number of
+        results in the interval; see :attr:`history_leaf_size`.
+
+        Unless an interval is expected to contain too many results, the request
+        for its total also requests the first page of its results, so that the
+        page does not need to be requested again when paginating it.
+
+        If ``concurrency`` is given, the total number of records in each of the
+        sub-intervals at each level of subdivision is requested in parallel,
+        after which the sub-intervals that can be fully paginated are
+        paginated in parallel. Up to ``concurrency`` requests are made at once,
+        and the results are still yielded in chronological order. This
+        requires holding the records of up to ``concurrency`` sub-intervals
+        in memory at once.
 
         :param url:
             Index endpoint (API URL) from which to yield results. In the event
@@ -851,6 +1367,9 @@ class RestApiV2Client(RestApiV2BaseClient):
         :param until:
             The end of the time interval. A timezone-aware datetime object must
             be supplied for the same reason as for the ``since`` parameter.
+        :param concurrency:
+            The number of requests to make in parallel. If unspecified,
+            requests are made one at a time.
         :param kw:
             Custom keyword arguments to pass to the iteration method. Note, if
             providing ``params`` in order to add query string parameters for
@@ -860,79 +1379,26 @@ class RestApiV2Client(RestApiV2BaseClient):
             All results from the resource collection API within the time range
             specified by ``since`` and ``until``.
         """
-        path = self.canonical_path(url)
-        since_until = {"since": strftime(since), "until": strftime(until)}
+        path = self._iter_history_path(url)
         iter_kw = deepcopy(kw)
-        if path not in HISTORICAL_RECORD_PATHS:
-            # Cannot continue; incompatible endpoint that doesn't accept
-            # since/until parameters:
-            raise UrlError(
-                f"Method iter_history does not support endpoint GET {path}"
+        params = iter_kw.pop("params", None) or {}
+        if path in self.cursor_based_pagination_paths:
+            # Short-circuit to iter_cursor:
+            yield from self.iter_cursor(
+                url,
+                params=self._iter_history_params(params, since, until),
+                **iter_kw,
             )
-        elif path == "/oncalls":
-            # Warn for this specific endpoint but continue:
-            warn(
-                "iter_history may yield duplicate results when used with "
-                "GET /oncalls"
+            return
+        intervals = [(since, until, recursion_depth, None)]
+        if concurrency is not None:
+            yield from self._iter_history_concurrently(
+                url, params, intervals, concurrency, **iter_kw
             )
-        elif path in self.cursor_based_pagination_paths:
-            # Short-circuit to iter_cursor:
-            iter_kw.setdefault("params", {})
-            iter_kw["params"].update(since_until)
-            return self.iter_cursor(url, **iter_kw)
-        # Obtain the total number of records for the interval:
-        query_params = kw.get("params", {})
-        query_params.update(since_until)
-        total = self.get_total(url, params=query_params)
-
-        no_results = total == 0
-        can_fully_paginate = total <= ITERATION_LIMIT
-        min_interval_len = int((until - since).total_seconds()) == 1
-        stop_recursion = recursion_depth >= RECURSION_LIMIT
-        if no_results:
-            # Nothing to be done for this interval
-            pass
-        elif can_fully_paginate or min_interval_len or stop_recursion:
-            # Do not subdivide; it is not necessary or not feasible.
-            if not can_fully_paginate:
-                # Issue a warning log message
-                if stop_recursion:
-                    reason = "the recursion depth limit has been reached"
-                    suggestion = (
-                        " To avoid this issue, try requesting a smaller "
-                        "initial time interval."
-                    )
-                elif min_interval_len:
-                    reason = (
-                        "the time interval is already the minimum length (1s)"
-                    )
-                    # In practice, this scenario can only happen if PagerDuty
-                    # ingests and processes, for a single account, >10k alert
-                    # history events in less than one second (to use
-                    # `/log_entries` as an example). There is unfortunately
-                    # nothing more that can be done in this case, though it is
-                    # a very extreme case that we have yet to encounter.
-                    suggestion = ""
-                self.log.warning(
-                    ITER_HIST_RECURSION_WARNING_TEMPLATE.format(
-                        reason=reason,
-                        since_until=str(since_until),
-                        iteration_limit=ITERATION_LIMIT,
-                        suggestion=suggestion,
-                    )
-                )
-            iter_kw.setdefault("params", {})
-            iter_kw["params"].update(since_until)
-            for item in self.iter_all(url, **iter_kw):
-                yield item
         else:
-            # If total exceeds maximum, bisect the time window and recurse:
-            iter_kw["recursion_depth"] = recursion_depth + 1
-            for sub_since, sub_until in datetime_intervals(since, until, n=2):
-                for item in self.iter_history(
-                    url, sub_since, sub_until, **iter_kw
-                ):
-                    yield item
+            yield from self._iter_history_serially(
+                url, params, intervals, **iter_kw
+            )
 
     def iter_incident_notes(
         self, incident_id: Optional[str] = None, **kw
@@ -973,32 +1439,6 @@ class RestApiV2Client(RestApiV2BaseClient):
             )
         )
 
-    def normalize_params(self, params: dict) -> dict:
-        """
-        Modify the user-supplied parameters to ease implementation.
-
-        Current behavior:
-
-        * If a parameter's value is of type list, and the parameter name does
-          not already end in "[]", then the square brackets are appended to
-          keep in line with the requirement that all set filters' parameter
-          names end in "[]".
-
-        :returns:
-            The query parameters after modification
-        """
-        updated_params = {}
-        for param, value in params.items():
-            if type(value) is list and not param.endswith("[]"):
-                updated_params[param + "[]"] = value
-            else:
-                updated_params[param] = value
-        return updated_params
-
-    @property
-    def permitted_methods(self) -> tuple:
-        return ("GET", "PATCH", "POST", "PUT", "DELETE")
-
     def persist(
         self, resource: str, attr: str, values: dict, update: bool = False
     ) -> dict:
@@ -1081,3 +1521,235 @@ class RestApiV2Client(RestApiV2BaseClient):
                 self._subdomain = None
                 raise e
         return self._subdomain
+
+
+class AsyncRestApiV2Client(RestApiV2ClientMixin, AsyncRestApiV2BaseClient):
+    """
+    Asynchronous PagerDuty REST API v2 client class.
+
+    This is the `asyncio` counterpart of :class:`RestApiV2Client`, with the
+    same configuration and constructor arguments. Its request methods are
+    coroutines, and its iteration methods (:attr:`iter_all`,
+    :attr:`iter_cursor` and :attr:`iter_history`) are asynchronous
+    generators, so that many API calls can be in flight concurrently within a
+    single event loop, i.e.:
+
+    .. code-block:: python
+
+        async with AsyncRestApiV2Client(API_KEY) as client:
+            incidents, services = await asyncio.gather(
+                client.list_all('/incidents'),
+                client.list_all('/services'),
+            )
+
+    For constructor arguments, see :class:`RestApiV2Client`.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        default_from: Optional[str] = None,
+        auth_type: str = "token",
+        debug: bool = False,
+        base_url=None,
+        **kw,
+    ):
+        super(AsyncRestApiV2Client, self).__init__(
+            api_key, auth_type, debug=debug, base_url=base_url, **kw
+        )
+        self._init_default_headers(default_from)
+
+    async def _iter_history_concurrently(
+        self,
+        url: str,
+        params: dict,
+        intervals: List[HistoryInterval],
+        concurrency: int,
+        **kw,
+    ) -> AsyncIterator[dict]:
+        """
+        Yield historical records, making requests concurrently.
+
+        See: :attr:`pagerduty.RestApiV2Client._iter_history_concurrently`
+        """
+        page_size = kw.get("page_size")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def probe(interval: HistoryInterval) -> tuple:
+            async with semaphore:
+                return await self._iter_history_probe(
+                    url, params, interval, page_size
+                )
+
+        async def paginate(leaf: HistoryLeaf) -> List[dict]:
+            return [
+                item
+                async for item in self._iter_history_leaf(
+                    url, params, leaf, **kw
+                )
+            ]
+
+        leaves = []
+        while intervals:
+            probes = await asyncio.gather(*(probe(i) for i in intervals))
+            new_leaves, intervals = self._iter_history_subdivide(
+                intervals, list(probes)
+            )
+            leaves.extend(new_leaves)
+        remaining = iter(sorted(leaves, key=lambda leaf: leaf[0]))
+        pending = deque(
+            asyncio.ensure_future(paginate(leaf))
+            for leaf in islice(remaining, concurrency)
+        )
+        try:
+            while pending:
+                results = await pending.popleft()
+                leaf = next(remaining, None)
+                if leaf is not None:
+                    pending.append(asyncio.ensure_future(paginate(leaf)))
+                for item in results:
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _iter_history_leaf(
+        self, url: str, params: dict, leaf: HistoryLeaf, **kw
+    ) -> AsyncIterator[dict]:
+        """
+        Yield the records in a time interval that can be fully paginated.
+
+        See: :attr:`pagerduty.RestApiV2Client._iter_history_leaf`
+        """
+        results, all_kw = self._iter_history_remainder(leaf, params, kw)
+        for item in results:
+            yield item
+        if all_kw is not None:
+            async for item in self.iter_all(url, **all_kw):
+                yield item
+
+    async def _iter_history_probe(
+        self,
+        url: str,
+        params: dict,
+        interval: HistoryInterval,
+        page_size: Optional[int] = None,
+    ) -> Tuple[int, Optional[Tuple[list, bool]]]:
+        """
+        Get the total number of records in a time interval for iter_history.
+
+        See: :attr:`pagerduty.RestApiV2Client._iter_history_probe`
+        """
+        request = self._iter_history_page_params(
+            url, params, interval, page_size
+        )
+        if request is None:
+            since, until = interval[:2]
+            total = await self.get_total(
+                url, params=self._iter_history_params(params, since, until)
+            )
+            return total, None
+        path, wrapper, data = request
+        response = successful_response(
+            await self.get(url, params=data), context="classic pagination"
+        )
+        total = self._total_from_response(url, response)
+        results, more, _ = self._classic_pagination_page(
+            response, path, wrapper
+        )
+        return total, (results, more)
+
+    async def _iter_history_serially(
+        self, url: str, params: dict, intervals: List[HistoryInterval], **kw
+    ) -> AsyncIterator[dict]:
+        """
+        Yield historical records, making requests one at a time.
+
+        See: :attr:`pagerduty.RestApiV2Client._iter_history_serially`
+        """
+        for interval in intervals:
+            probe = await self._iter_history_probe(
+                url, params, interval, kw.get("page_size")
+            )
+            leaves, subintervals = self._iter_history_subdivide(
+                [interval], [probe]
+            )
+            for leaf in leaves:
+                async for item in self._iter_history_leaf(
+                    url, params, leaf, **kw
+                ):
+                    yield item
+            async for item in self._iter_history_serially(
+                url, params, subintervals, **kw
+            ):
+                yield item
+
+    async def find(
+        self,
+        resource: str,
+        query: str,
+        attribute: str = "name",
+        params: Optional[dict] = None,
+    ) -> Optional[dict]:
+        """
+        Finds an object of a given resource type exactly matching a query.
+
+        See: :attr:`pagerduty.RestApiV2Client.find`
+        """
+        query_params = {}
+        if params is not None:
+            query_params.update(params)
+        query_params.update({"query": query})
+        search_term = str(query).lower()
+        async for obj in self.iter_all(resource, params=query_params):
+            if str(obj[attribute]).lower() == search_term:
+                return obj
+        return None
+
+    async def iter_history(
+        self,
+        url: str,
+        since: datetime,
+        until: datetime,
+        recursion_depth: int = 0,
+        concurrency: Optional[int] = None,
+        **kw,
+    ) -> AsyncIterator[dict]:
+        """
+        Yield all historical records from an endpoint in a given time interval.
+
+        See: :attr:`pagerduty.RestApiV2Client.iter_history`
+        """
+        path = self._iter_history_path(url)
+        iter_kw = deepcopy(kw)
+        params = iter_kw.pop("params", None) or {}
+        if path in self.cursor_based_pagination_paths:
+            async for item in self.iter_cursor(
+                url,
+                params=self._iter_history_params(params, since, until),
+                **iter_kw,
+            ):
+                yield item
+            return
+        intervals = [(since, until, recursion_depth, None)]
+        if concurrency is not None:
+            iterator = self._iter_history_concurrently(
+                url, params, intervals, concurrency, **iter_kw
+            )
+        else:
+            iterator = self._iter_history_serially(
+                url, params, intervals, **iter_kw
+            )
+        async for item in iterator:
+            yield item
+
+    @wrapped_entities
+    async def rpatch(self, path: str, **kw) -> dict:
+        """
+        Wrapped-entity-aware PATCH function.
+
+        See: :attr:`pagerduty.RestApiV2Client.rpatch`
+        """
+        return await self.patch(path, **kw)
@@ -1,4 +1,7 @@
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
 from .api_client import ApiClient
 from .common import successful_response, try_decoding
@@ -8,8 +11,8 @@ class ScimApiClient(ApiClient):
     """
     Client class for the PagerDuty SCIM API.
 
-    This class features a method :attr:`list_users` that provides an interface
-    for retrieving all users that match a given filter.
+    This class features methods :attr:`iter_users` and :attr:`list_users` that
+    provide an interface for retrieving all users that match a given filter.
 
     Other endpoints of the PagerDuty SCIM API can be accessed through the
     standard methods named after the HTTP methods.
@@ -47,47 +50,64 @@ class ScimApiClient(ApiClient):
     def default_base_url(self) -> str:
         return "https://api.pagerduty.com/scim/v2"
 
-    def list_users(
-        self,
-        fltr: Optional[str] = None,
-        start_index: int = 1,
-        page_size: int = 100,
-    ) -> List[dict]:
+    def _fetch_users(
+        self, start_index: int, page_size: int, fltr: Optional[str] = None
+    ) -> Tuple[List[dict], int, int]:
         """
-        List all users using SCIM API with automatic pagination.
+        Request one page of users from the SCIM Users endpoint.
 
-        :param fltr:
-            Optional SCIM filter expression to limit results
         :param start_index:
-            The 1-based index of the first result to return (SCIM standard)
+            The 1-based index of the first result to return
         :param page_size:
-            Number of results per page (default 100)
+            Number of results to request
+        :param fltr:
+            Optional SCIM filter expression to limit results
         :returns:
-            List of all user entries from the SCIM Users endpoint
+            A tuple of the users in the page, the total number of results and
+            the number of items per page reported by the API
         """
-        all_users = []
-        current_start_index = start_index
+        params = {"startIndex": start_index, "count": page_size}
 
-        while True:
-            params = {"startIndex": current_start_index, "count": page_size}
+        if fltr:
+            params["filter"] = fltr
 
-            if fltr:
-                params["filter"] = fltr
+        response = successful_response(
+            self.get("/Users", params=params),
+            context="SCIM list users pagination",
+        )
 
-            response = successful_response(
-                self.get("/Users", params=params),
-                context="SCIM list users pagination",
-            )
+        body = try_decoding(response)
 
-            body = try_decoding(response)
+        # Extract users from the SCIM response
+        users = body.get("Resources", [])
 
-            # Extract users from the SCIM response
-            users = body.get("Resources", [])
-            all_users.extend(users)
+        # Check if there are more results
+        total_results = body.get("totalResults", 0)
+        items_per_page = body.get("itemsPerPage", len(users))
+        if items_per_page < 1:
+            # Not a usable step between pages; go by what was received:
+            items_per_page = len(users)
+        return users, total_results, items_per_page
 
-            # Check if there are more results
-            total_results = body.get("totalResults", 0)
-            items_per_page = body.get("itemsPerPage", len(users))
+    def _iter_user_pages(
+        self,
+        start_index: int,
+        page_size: int,
+        fltr: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Tuple[List[dict], int]]:
+        """
+        Yield pages of users along with the total number of results.
+
+        See: :attr:`iter_users`
+        """
+        current_start_index = start_index
+
+        while True:
+            users, total_results, items_per_page = self._fetch_users(
+                current_start_index, page_size, fltr=fltr
+            )
+            yield users, total_results
 
             # If no results are left, break:
             next_start_index = current_start_index + items_per_page - 1
@@ -97,7 +117,141 @@ class ScimApiClient(ApiClient):
             # Move to next page
             current_start_index += items_per_page
 
-        return all_users
+            if max_workers is not None and max_workers > 1:
+                # All remaining windows are now known; fetch them in parallel:
+                start_indices = range(
+                    current_start_index, total_results + 1, items_per_page
+                )
+                for users in self._prefetch_users(
+                    list(start_indices), page_size, fltr, max_workers
+                ):
+                    yield users, total_results
+                break
+
+    def _prefetch_users(
+        self,
+        start_indices: List[int],
+        page_size: int,
+        fltr: Optional[str],
+        max_workers: int,
+    ) -> Iterator[List[dict]]:
+        """
+        Request pages of users in parallel and yield them in order.
+
+        At most ``max_workers`` requests are in flight at any given time.
+        Iteration stops early if a page comes back empty, in which case
+        requests that have not yet started are cancelled.
+
+        :param start_indices:
+            The 1-based start indices of the pages to request
+        :param page_size:
+            Number of results to request per page
+        :param fltr:
+            Optional SCIM filter expression to limit results
+        :param max_workers:
+            The number of requests to perform in parallel
+        :yields:
+            Lists of users, one for each page
+        """
+
+        def fetch(start_index: int) -> List[dict]:
+            return self._fetch_users(start_index, page_size, fltr=fltr)[0]
+
+        remaining = iter(start_indices)
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque(
+            pool.submit(fetch, start_index)
+            for start_index in islice(remaining, max_workers)
+        )
+        try:
+            while pending:
+                users = pending.popleft().result()
+                next_start_index = next(remaining, None)
+                if next_start_index is not None:
+                    pending.append(pool.submit(fetch, next_start_index))
+                if not users:
+                    return
+                yield users
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def iter_users(
+        self,
+        fltr: Optional[str] = None,
+        start_index: int = 1,
+        page_size: int = 100,
+        item_hook: Optional[Callable[..., Any]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """
+        Iterate through all users using SCIM API with automatic pagination.
+
+        Users are yielded as each page of results is received, so that only
+        one page of results needs to be held in memory at a time.
+
+        If ``max_workers`` is greater than 1, the ``totalResults`` and
+        ``itemsPerPage`` of the first response are used to request all of the
+        remaining pages in parallel, with at most that many requests in flight
+        at a time. Users are still yielded in order.
+
+        :param fltr:
+            Optional SCIM filter expression to limit results
+        :param start_index:
+            The 1-based index of the first result to return (SCIM standard)
+        :param page_size:
+            Number of results per page (default 100)
+        :param item_hook:
+            Callable object that will be invoked for each user yielded, i.e.
+            for printing progress. It will be called with three parameters: a
+            dict representing the user, an int representing the number of the
+            user in the series, and the total number of results reported by the
+            API.
+        :param max_workers:
+            The number of pages to request in parallel after the first.
+        :yields:
+            User entries from the SCIM Users endpoint
+        """
+        n = 0
+        pages = self._iter_user_pages(
+            start_index, page_size, fltr=fltr, max_workers=max_workers
+        )
+        for users, total_results in pages:
+            for user in users:
+                n += 1
+                if hasattr(item_hook, "__call__"):
+                    item_hook(user, n, total_results)
+                yield user
+
+    def list_users(
+        self,
+        fltr: Optional[str] = None,
+        start_index: int = 1,
+        page_size: int = 100,
+        max_workers: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        List all users using SCIM API with automatic pagination.
+
+        :param fltr:
+            Optional SCIM filter expression to limit results
+        :param start_index:
+            The 1-based index of the first result to return (SCIM standard)
+        :param page_size:
+            Number of results per page (default 100)
+        :param max_workers:
+            The number of pages to request in parallel; see
+            :attr:`iter_users`.
+        :returns:
+            List of all user entries from the SCIM Users endpoint
+        """
+        return list(
+            self.iter_users(
+                fltr=fltr,
+                start_index=start_index,
+                page_size=page_size,
+                max_workers=max_workers,
+            )
+        )
 
     @property
     def permitted_methods(self) -> tuple:
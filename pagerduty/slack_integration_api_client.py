@@ -32,10 +32,14 @@ class SlackIntegrationApiClient(RestApiV2BaseClient):
     """
 
     def __init__(
-        self, api_key: str, auth_type: str = "token", debug: bool = False
+        self,
+        api_key: str,
+        auth_type: str = "token",
+        debug: bool = False,
+        **kw,
     ):
         super(SlackIntegrationApiClient, self).__init__(
-            api_key, auth_type=auth_type, debug=debug
+            api_key, auth_type=auth_type, debug=debug, **kw
         )
         self.headers.update(
             {
@@ -33,4 +33,13 @@ def get_version():
             return get_version_via_tomllib()
 
 
-__version__ = get_version()
+__version__ = "7.0.0"
+"""
+The version of this package.
+
+This is set to a constant rather than determined via :attr:`get_version` when
+the package is imported, because looking up the metadata of installed packages
+or parsing ``pyproject.toml`` slows down importing the package considerably.
+It must be updated along with the version in ``pyproject.toml``; the unit tests
+verify that the two match.
+"""
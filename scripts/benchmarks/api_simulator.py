@@ -0,0 +1,231 @@
+"""
+In-process simulator of the PagerDuty REST API v2 and Events API v2.
+
+The simulator is an HTTPX transport, so that it can be given to any client via
+the ``transport`` keyword argument; requests are then handled in the same
+process without using the network:
+
+.. code-block:: python
+
+    simulator = ApiSimulator(records=5000, latency=0.01)
+    client = pagerduty.RestApiV2Client("token", transport=simulator.transport)
+
+It serves the following endpoints from synthetic datasets:
+
+* ``GET /users`` and ``GET /log_entries``: classic pagination, including the
+  ``total`` parameter and, for log entries, the ``since`` and ``until``
+  parameters
+* ``GET /audit/records``: cursor-based pagination
+* ``GET /users/{id}`` and ``PUT /users/{id}``
+* ``POST /v2/enqueue`` (Events API v2)
+
+Every response can be delayed by a fixed latency, and every ``N``-th request
+can be answered with status 429 to exercise the client's retry logic.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from httpx2 import ByteStream, MockTransport, Request, Response
+
+ITERATION_LIMIT = 10000
+
+DATETIME_FMT = "%Y-%m-%dT%H:%M:%S%z"
+
+HISTORY_START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class ApiSimulator(object):
+    """
+    Fake PagerDuty API server.
+
+    :param records:
+        The number of records in each synthetic dataset
+    :param latency:
+        The time in seconds to wait before responding to each request
+    :param rate_limit_every:
+        If nonzero, respond to every request with this ordinal number with
+        status 429
+    :param history_days:
+        The number of days over which log entries are distributed, starting
+        from ``HISTORY_START``
+    """
+
+    def __init__(
+        self,
+        records: int = 1000,
+        latency: float = 0.0,
+        rate_limit_every: int = 0,
+        history_days: int = 30,
+    ):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self.users = [
+            {
+                "id": f"PU{i:06d}",
+                "type": "user",
+                "name": f"User {i}",
+                "email": f"user{i}@example.com",
+                "role": "user",
+            }
+            for i in range(records)
+        ]
+        self.users_by_id = {user["id"]: user for user in self.users}
+        step = timedelta(days=history_days) / max(1, records)
+        self.log_entries = [
+            {
+                "id": f"PL{i:06d}",
+                "type": "trigger_log_entry",
+                "created_at": (HISTORY_START + step * i).strftime(
+                    DATETIME_FMT
+                ),
+                "summary": f"Triggered through the API ({i})",
+            }
+            for i in range(records)
+        ]
+        self.audit_records = [
+            {"id": f"PA{i:06d}", "action": "update"} for i in range(records)
+        ]
+        self.transport = MockTransport(self.handle)
+
+    def _classic_page(self, request: Request, wrapper: str, records: list):
+        """
+        Respond with a page of records using classic pagination.
+        """
+        params = request.url.params
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", 25))
+        if offset + limit > ITERATION_LIMIT:
+            return self._error(
+                400, "Offset must be less than or equal to 10000"
+            )
+        page = records[offset : offset + limit]
+        total = params.get("total") == "true"
+        return self._json(
+            200,
+            {
+                wrapper: page,
+                "limit": limit,
+                "offset": offset,
+                "more": offset + len(page) < len(records),
+                "total": len(records) if total else None,
+            },
+        )
+
+    def _cursor_page(self, request: Request, wrapper: str, records: list):
+        """
+        Respond with a page of records using cursor-based pagination.
+        """
+        params = request.url.params
+        start = int(params.get("cursor", 0))
+        limit = int(params.get("limit", 100))
+        end = start + limit
+        return self._json(
+            200,
+            {
+                wrapper: records[start:end],
+                "limit": limit,
+                "next_cursor": str(end) if end < len(records) else None,
+            },
+        )
+
+    @staticmethod
+    def _error(status: int, message: str) -> Response:
+        return ApiSimulator._json(
+            status, {"error": {"code": status, "message": message}}
+        )
+
+    def _history(self, request: Request) -> list:
+        """
+        Get the log entries within the requested time interval.
+        """
+        params = request.url.params
+        since = params.get("since")
+        until = params.get("until")
+        records = self.log_entries
+        # The timestamps all use the same format, so they sort lexically:
+        if since is not None:
+            since = self._timestamp(since)
+            records = [r for r in records if r["created_at"] >= since]
+        if until is not None:
+            until = self._timestamp(until)
+            records = [r for r in records if r["created_at"] < until]
+        return records
+
+    @staticmethod
+    def _json(status: int, body: dict, headers: Optional[dict] = None):
+        # The content is given as a stream rather than bytes so that, as with
+        # a real transport, it is read by the client, which then records the
+        # elapsed time of the request.
+        content = json.dumps(body).encode()
+        return Response(
+            status,
+            stream=ByteStream(content),
+            headers=dict(
+                headers or {},
+                **{
+                    "content-type": "application/json",
+                    "content-length": str(len(content)),
+                },
+            ),
+        )
+
+    @staticmethod
+    def _timestamp(value: str) -> str:
+        """
+        Normalize a timestamp query parameter to the format of the dataset.
+        """
+        parsed = datetime.strptime(value, DATETIME_FMT)
+        return parsed.astimezone(timezone.utc).strftime(DATETIME_FMT)
+
+    def handle(self, request: Request) -> Response:
+        """
+        Respond to a request.
+        """
+        with self._lock:
+            self.request_count += 1
+            count = self.request_count
+        if self.latency:
+            time.sleep(self.latency)
+        if self.rate_limit_every and count % self.rate_limit_every == 0:
+            return self._json(
+                429,
+                {"error": {"code": 2020, "message": "Rate Limit Exceeded"}},
+                headers={"retry-after": "0"},
+            )
+        method = request.method
+        path = request.url.path
+        if request.url.host == "events.pagerduty.com":
+            if method == "POST" and path == "/v2/enqueue":
+                event = json.loads(request.content)
+                return self._json(
+                    202,
+                    {
+                        "status": "success",
+                        "message": "Event processed",
+                        "dedup_key": event.get("dedup_key", "generated"),
+                    },
+                )
+        elif method == "GET" and path == "/users":
+            return self._classic_page(request, "users", self.users)
+        elif method == "GET" and path == "/log_entries":
+            return self._classic_page(
+                request, "log_entries", self._history(request)
+            )
+        elif method == "GET" and path == "/audit/records":
+            return self._cursor_page(request, "records", self.audit_records)
+        elif path.startswith("/users/") and path.count("/") == 2:
+            user = self.users_by_id.get(path.split("/")[2])
+            if user is None:
+                return self._error(404, "Not Found")
+            if method == "GET":
+                return self._json(200, {"user": user})
+            elif method == "PUT":
+                update = json.loads(request.content).get("user", {})
+                return self._json(200, {"user": dict(user, **update)})
+        return self._error(404, "Not Found")
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+"""
+Usage: client_suite.py [-n RECORDS] [-c CALLS] [-l LATENCY] [-e EVERY]
+                       [-s SCENARIO ...] [-o OUTPUT]
+
+  Benchmark suite measuring the throughput, CPU time and memory usage of the
+  clients against an in-process API simulator (see api_simulator.py), with
+  results emitted as JSON for tracking regressions between versions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import timedelta
+
+# Benchmark the working copy of the library rather than an installed version:
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+)
+
+import pagerduty  # noqa: E402
+from api_simulator import HISTORY_START, ApiSimulator  # noqa: E402
+
+
+def iter_all(clients: dict, args) -> int:
+    return sum(1 for _ in clients["rest"].iter_all("/users"))
+
+
+def iter_all_concurrent(clients: dict, args) -> int:
+    users = clients["rest"].iter_all("/users", concurrency=4)
+    return sum(1 for _ in users)
+
+
+def iter_cursor(clients: dict, args) -> int:
+    return sum(1 for _ in clients["rest"].iter_cursor("/audit/records"))
+
+
+def iter_history(clients: dict, args) -> int:
+    log_entries = clients["rest"].iter_history(
+        "/log_entries", HISTORY_START, HISTORY_START + timedelta(days=30)
+    )
+    return sum(1 for _ in log_entries)
+
+
+def rget(clients: dict, args) -> int:
+    for i in range(args.calls):
+        clients["rest"].rget(f"/users/PU{i % args.records:06d}")
+    return args.calls
+
+
+def rput(clients: dict, args) -> int:
+    for i in range(args.calls):
+        clients["rest"].rput(
+            f"/users/PU{i % args.records:06d}", json={"name": f"Name {i}"}
+        )
+    return args.calls
+
+
+def send_event(clients: dict, args) -> int:
+    for i in range(args.calls):
+        clients["events"].trigger(
+            f"Benchmark alert {i}", "benchmark", dedup_key=f"alert-{i}"
+        )
+    return args.calls
+
+
+SCENARIOS = {
+    "iter_all": iter_all,
+    "iter_all_concurrent": iter_all_concurrent,
+    "iter_cursor": iter_cursor,
+    "iter_history": iter_history,
+    "rget": rget,
+    "rput": rput,
+    "send_event": send_event,
+}
+
+
+def new_clients(simulator: ApiSimulator) -> dict:
+    rest = pagerduty.RestApiV2Client("token", transport=simulator.transport)
+    events = pagerduty.EventsApiV2Client(
+        "routing-key", transport=simulator.transport
+    )
+    # Retry immediately after simulated rate limiting:
+    for client in (rest, events):
+        client.sleep_timer = 0
+    return {"rest": rest, "events": events}
+
+
+def run_scenario(name: str, args) -> dict:
+    """
+    Run a scenario twice: once for timing and once for measuring memory.
+
+    Memory is measured separately because tracing allocations slows down the
+    code being measured considerably.
+    """
+    func = SCENARIOS[name]
+    simulator = ApiSimulator(
+        records=args.records,
+        latency=args.latency,
+        rate_limit_every=args.rate_limit_every,
+    )
+    clients = new_clients(simulator)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    items = func(clients, args)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    requests = simulator.request_count
+
+    simulator = ApiSimulator(
+        records=args.records,
+        latency=args.latency,
+        rate_limit_every=args.rate_limit_every,
+    )
+    clients = new_clients(simulator)
+    tracemalloc.start()
+    try:
+        func(clients, args)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "items": items,
+        "requests": requests,
+        "wall_time_s": wall,
+        "cpu_time_s": cpu,
+        "requests_per_s": requests / wall if wall else None,
+        "items_per_s": items / wall if wall else None,
+        "cpu_per_request_us": cpu / requests * 1e6 if requests else None,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("-n", "--records", type=int, default=5000)
+    parser.add_argument("-c", "--calls", type=int, default=500)
+    parser.add_argument("-l", "--latency", type=float, default=0.0)
+    parser.add_argument(
+        "-e",
+        "--rate-limit-every",
+        type=int,
+        default=0,
+        help="Respond to every Nth request with status 429",
+    )
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run; may be given more than once (default: all)",
+    )
+    parser.add_argument(
+        "-o", "--output", help="Write results to this file instead of stdout"
+    )
+    args = parser.parse_args()
+    results = {
+        "python": platform.python_version(),
+        "pagerduty": pagerduty.__version__,
+        "parameters": {
+            "records": args.records,
+            "calls": args.calls,
+            "latency": args.latency,
+            "rate_limit_every": args.rate_limit_every,
+        },
+        "results": {
+            name: run_scenario(name, args)
+            for name in (args.scenario or sorted(SCENARIOS))
+        },
+    }
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Usage: import_time.py [-r REPEAT] [-m MAX_MS]
+
+  Benchmark of the time it takes to import the package in a new interpreter,
+  and to then access one client class, compared with starting an interpreter
+  that imports nothing. If a maximum is given, the exit status is nonzero if
+  importing the package alone takes longer than that many milliseconds.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+STATEMENTS = {
+    "baseline": "pass",
+    "import pagerduty": "import pagerduty",
+    "RestApiV2Client": "import pagerduty; pagerduty.RestApiV2Client",
+    "EventsApiV2Client": "import pagerduty; pagerduty.EventsApiV2Client",
+}
+
+
+def best_time(statement: str, repeat: int) -> float:
+    """
+    Measure the fastest of several runs of a statement in a new interpreter.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        # Benchmark the working copy of the library rather than an installed
+        # version, by running the interpreter in the repository root:
+        subprocess.run([sys.executable, "-c", statement], cwd=ROOT, check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("-r", "--repeat", type=int, default=20)
+    parser.add_argument("-m", "--max-ms", type=float, default=None)
+    args = parser.parse_args()
+    timings = {
+        label: best_time(statement, args.repeat)
+        for label, statement in STATEMENTS.items()
+    }
+    baseline = timings.pop("baseline")
+    print(f"Interpreter startup: {baseline * 1e3:.1f} ms")
+    for label, timing in timings.items():
+        print(f"{label}: +{(timing - baseline) * 1e3:.1f} ms")
+    import_ms = (timings["import pagerduty"] - baseline) * 1e3
+    if args.max_ms is not None and import_ms > args.max_ms:
+        print(
+            f"Importing the package took {import_ms:.1f} ms, which exceeds "
+            f"the maximum of {args.max_ms:g} ms."
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Usage: page_decoding.py [-n NUMBER] [-r REPEAT] [-s PAGE_SIZE]
+
+  Micro-benchmark comparing the cost of unpacking a page of results in
+  pagination when the response body is JSON-decoded twice (once to read
+  pagination properties and once again to unwrap the results) versus once.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+from httpx2 import Request, Response
+
+# Benchmark the working copy of the library rather than an installed version:
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+)
+
+from pagerduty.common import try_decoding  # noqa: E402
+from pagerduty.rest_api_v2_base_client import unwrap  # noqa: E402
+
+
+def incident_page(page_size: int) -> Response:
+    """
+    Construct a response containing a page of incidents with large bodies.
+    """
+    incidents = [
+        {
+            "id": f"PINC{i:04d}",
+            "type": "incident",
+            "summary": f"Incident number {i}",
+            "status": "resolved",
+            "body": {
+                "details": {
+                    f"metric_{j}": {"value": j * 1.5, "tags": ["a", "b"]}
+                    for j in range(50)
+                }
+            },
+        }
+        for i in range(page_size)
+    ]
+    body = {
+        "incidents": incidents,
+        "limit": page_size,
+        "offset": 0,
+        "more": True,
+        "total": None,
+    }
+    return Response(
+        200,
+        content=json.dumps(body).encode(),
+        request=Request("GET", "https://api.pagerduty.com/incidents"),
+    )
+
+
+def decode_twice(response: Response):
+    body = try_decoding(response)
+    return unwrap(response, "incidents"), body.get("more")
+
+
+def decode_once(response: Response):
+    body = try_decoding(response)
+    return unwrap(response, "incidents", body=body), body.get("more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("-n", "--number", type=int, default=200)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-s", "--page-size", type=int, default=100)
+    args = parser.parse_args()
+    response = incident_page(args.page_size)
+    print(f"Page body size: {len(response.content)} bytes")
+    timings = {}
+    for label, func in (("twice", decode_twice), ("once", decode_once)):
+        best = min(
+            timeit.repeat(
+                lambda func=func: func(response),
+                number=args.number,
+                repeat=args.repeat,
+            )
+        )
+        timings[label] = best / args.number
+        print(f"Decode {label}: {timings[label] * 1e3:.3f} ms/page")
+    print(f"Speedup: {timings['twice'] / timings['once']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Usage: request_copying.py [-n NUMBER] [-r REPEAT] [-s BODY_SIZE]
+
+  Micro-benchmark of the client-side cost of preparing a bulk incident update
+  request, comparing copy-on-write argument handling with deep-copying all
+  keyword arguments in both the entity wrapping decorator and the request
+  method, as was done previously.
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+from copy import deepcopy
+
+# Benchmark the working copy of the library rather than an installed version:
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+)
+
+from pagerduty import RestApiV2Client  # noqa: E402
+
+
+def incident_updates(body_size: int) -> dict:
+    """
+    Construct the keyword arguments of a bulk incident update request.
+    """
+    incidents = [
+        {
+            "id": f"PINC{i:04d}",
+            "type": "incident_reference",
+            "status": "resolved",
+            "resolution": f"Resolved in bulk; incident number {i}",
+            "escalation_policy": {
+                "id": "PESCPOL",
+                "type": "escalation_policy_reference",
+            },
+        }
+        for i in range(body_size)
+    ]
+    return {
+        "json": {"incidents": incidents},
+        "headers": {"From": "user@example.com"},
+    }
+
+
+def prepare_deep_copied(client: RestApiV2Client, kw: dict):
+    # One copy in wrapped_entities, then another in _prepare_request:
+    return client._prepare_request(
+        "PUT", "/incidents", **deepcopy(deepcopy(kw))
+    )
+
+
+def prepare_copy_on_write(client: RestApiV2Client, kw: dict):
+    return client._prepare_request("PUT", "/incidents", **dict(kw))
+
+
+def allocated(func) -> int:
+    """
+    Measure the peak memory allocated in a single call.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("-n", "--number", type=int, default=200)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-s", "--body-size", type=int, default=500)
+    args = parser.parse_args()
+    client = RestApiV2Client("token", default_from="user@example.com")
+    kw = incident_updates(args.body_size)
+    print(f"Incidents in request body: {args.body_size}")
+    timings = {}
+    for label, func in (
+        ("deep-copied", prepare_deep_copied),
+        ("copy-on-write", prepare_copy_on_write),
+    ):
+        best = min(
+            timeit.repeat(
+                lambda func=func: func(client, kw),
+                number=args.number,
+                repeat=args.repeat,
+            )
+        )
+        timings[label] = best / args.number
+        peak = allocated(lambda func=func: func(client, kw))
+        print(
+            f"Prepare {label}: {timings[label] * 1e6:.1f} us/request, "
+            f"{peak} bytes allocated"
+        )
+    print(f"Speedup: {timings['deep-copied'] / timings['copy-on-write']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
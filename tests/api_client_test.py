@@ -1,9 +1,11 @@
 import json
 import logging
 import httpx2
+import math
 import random
 import sys
-from unittest.mock import Mock, MagicMock, patch
+import unittest
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 
 import pagerduty
 from pagerduty.auth_method import AuthMethod
@@ -104,6 +106,52 @@ class ApiClientTest(ClientTest):
             )
         )
 
+    def test_prepare_headers_cached(self):
+        client = self.new_client()
+        headers = client.prepare_headers("POST")
+        self.assertEqual("application/json", headers["Content-Type"])
+        # Modifying the returned headers doesn't affect the cached defaults:
+        headers["Content-Type"] = "text/plain"
+        self.assertEqual(
+            "application/json", client.prepare_headers("POST")["Content-Type"]
+        )
+        self.assertNotIn("Content-Type", client.prepare_headers("GET"))
+        # The authentication header takes precedence over user headers:
+        self.assertEqual(
+            "some format idk secret=token",
+            client.prepare_headers("GET", {"Authorization": "nope"})[
+                "Authorization"
+            ],
+        )
+        # Setting a new auth method invalidates the cache:
+        client.auth_method = DummyAuthMethod("new-token")
+        self.assertEqual(
+            "some format idk secret=new-token",
+            client.prepare_headers("GET")["Authorization"],
+        )
+
+    def test_prepare_request(self):
+        client = self.new_client()
+        incidents = [{"id": f"P{i}", "type": "incident"} for i in range(3)]
+        body = {"incidents": incidents}
+        headers = {"X-Arbitrary-Header": "arbitrary-value"}
+        method, url, req_kw = client._prepare_request(
+            "post", "/incidents", json=body, headers=headers
+        )
+        self.assertEqual("POST", method)
+        self.assertEqual(f"{client.url}/incidents", url)
+        # The auth parameter is added to a new body, without copying the
+        # contents or modifying the caller's arguments:
+        self.assertEqual(
+            {"incidents": incidents, "secret": "token"}, req_kw["json"]
+        )
+        self.assertIs(incidents, req_kw["json"]["incidents"])
+        self.assertEqual({"incidents": incidents}, body)
+        self.assertEqual({"X-Arbitrary-Header": "arbitrary-value"}, headers)
+        # Bodies are passed through as-is when there is nothing to add:
+        _, _, req_kw = client._prepare_request("get", "/incidents", json=body)
+        self.assertIs(body, req_kw["json"])
+
     def test_print_debug(self):
         client = self.new_client()
         log = Mock()
@@ -381,6 +429,196 @@ class ApiClientTest(ClientTest):
                 r = client.get("/users/P123456")
                 self.assertEqual(404, r.status_code)
 
+    @patch.object(pagerduty.ApiClient, "postprocess")
+    def test_request_retry_after(self, postprocess):
+        client = self.new_client()
+        client.parent = Client()
+        client.parent.request = MagicMock()
+        throttled = Response(429, json.dumps({}))
+        throttled.headers["retry-after"] = "3"
+        unavailable = Response(503, json.dumps({}))
+        unavailable.headers["retry-after"] = "7"
+        reset = Response(429, json.dumps({}))
+        reset.headers["ratelimit-reset"] = "11"
+        client.parent.request.side_effect = [
+            throttled,
+            Response(429, json.dumps({})),
+            unavailable,
+            reset,
+            Response(200, json.dumps({})),
+        ]
+        client.retry[503] = 1
+        with patch.object(pagerduty.api_client.time, "sleep") as sleep:
+            with patch.object(client, "cooldown_factor") as cdf:
+                cdf.return_value = 2.0
+                r = client.get("/users")
+        self.assertEqual(200, r.status_code)
+        # The API-specified wait takes precedence, and doesn't escalate the
+        # exponential cooldown that is used in its absence:
+        self.assertEqual(
+            [3.0, client.sleep_timer * 2, 7.0, 11.0],
+            [c[0][0] for c in sleep.call_args_list],
+        )
+        self.assertEqual(1, cdf.call_count)
+
+        # A wait of zero (or a date in the past) falls back to the exponential
+        # cooldown, and very long waits are capped:
+        immediate = Response(429, json.dumps({}))
+        immediate.headers["retry-after"] = "0"
+        past = Response(429, json.dumps({}))
+        past.headers["retry-after"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+        distant = Response(429, json.dumps({}))
+        distant.headers["retry-after"] = "86400"
+        client.parent.request.side_effect = [
+            immediate,
+            past,
+            distant,
+            Response(200, json.dumps({})),
+        ]
+        with patch.object(pagerduty.api_client.time, "sleep") as sleep:
+            with patch.object(client, "cooldown_factor") as cdf:
+                cdf.return_value = 2.0
+                r = client.get("/users")
+        self.assertEqual(200, r.status_code)
+        self.assertEqual(
+            [
+                client.sleep_timer * 2,
+                client.sleep_timer * 4,
+                client.max_retry_after,
+            ],
+            [c[0][0] for c in sleep.call_args_list],
+        )
+
+    @patch.object(pagerduty.ApiClient, "postprocess")
+    def test_request_total_timeout(self, postprocess):
+        client = self.new_client()
+        client.parent = Client()
+        client.parent.request = MagicMock()
+        client.total_timeout = 10
+        clock = [100.0]
+        fake_time = MagicMock()
+        fake_time.monotonic.side_effect = lambda: clock[0]
+        fake_time.sleep.side_effect = lambda t: clock.__setitem__(
+            0, clock[0] + t
+        )
+        throttled = Response(429, json.dumps({}))
+        client.parent.request.return_value = throttled
+        with patch.object(pagerduty.api_client, "time", new=fake_time):
+            with patch.object(client, "cooldown_factor") as cdf:
+                cdf.return_value = 2.0
+                with self.assertRaises(pagerduty.DeadlineExceededError) as cm:
+                    client.get("/users")
+                self.assertIs(throttled, cm.exception.response)
+                # The third cooldown (12s) wouldn't leave time for another
+                # attempt, so it is shortened to make a final attempt:
+                self.assertEqual(
+                    [3.0, 6.0, 0.5],
+                    [c[0][0] for c in fake_time.sleep.call_args_list],
+                )
+                self.assertEqual(
+                    [10, 7, 1, 0.5],
+                    [
+                        c[1]["timeout"]
+                        for c in client.parent.request.call_args_list
+                    ],
+                )
+
+                # The final attempt fails with a network error:
+                client.parent.request.reset_mock()
+                error = pagerduty.api_client.TransportError("D'oh!")
+                client.parent.request.side_effect = [throttled, error]
+                with self.assertRaises(pagerduty.DeadlineExceededError) as cm:
+                    client.request("GET", "/users", total_timeout=3)
+                self.assertIsNone(cm.exception.response)
+                self.assertIs(error, cm.exception.__cause__)
+
+                # The client's limit can be lifted for a request:
+                client.parent.request.side_effect = [throttled] * 10 + [
+                    Response(200, json.dumps({}))
+                ]
+                r = client.request("GET", "/users", total_timeout=math.inf)
+                self.assertEqual(200, r.status_code)
+                self.assertEqual(
+                    client.timeout,
+                    client.parent.request.call_args[1]["timeout"],
+                )
+        with self.assertRaises(ValueError):
+            client.request("GET", "/users", total_timeout=0)
+
+    @patch.object(pagerduty.ApiClient, "postprocess")
+    def test_request_total_timeout_rate_limiter(self, postprocess):
+        client = self.new_client()
+        client.parent = Client()
+        client.parent.request = MagicMock()
+        client.rate_limiter = pagerduty.RateLimiter()
+        clock = [100.0]
+        fake_time = MagicMock()
+        fake_time.monotonic.side_effect = lambda: clock[0]
+        fake_time.sleep.side_effect = lambda t: clock.__setitem__(
+            0, clock[0] + t
+        )
+        throttled = Response(429, json.dumps({}))
+        throttled.headers["retry-after"] = "30"
+        ok = Response(200, json.dumps({}))
+        client.parent.request.side_effect = [throttled, ok]
+        with patch.object(pagerduty.api_client, "time", new=fake_time):
+            with patch.object(
+                pagerduty.rate_limiter.time, "monotonic", new=lambda: clock[0]
+            ):
+                r = client.request("GET", "/users", total_timeout=10)
+        # The rate limiter holds requests for 30s, but the cooldown was
+        # shortened to make a final attempt within the total timeout:
+        self.assertIs(ok, r)
+        self.assertEqual(
+            [5.0], [c[0][0] for c in fake_time.sleep.call_args_list]
+        )
+        self.assertEqual(2, client.parent.request.call_count)
+
+    @patch.object(pagerduty.ApiClient, "postprocess")
+    def test_request_total_timeout_timeout_object(self, postprocess):
+        client = self.new_client()
+        client.parent = Client()
+        client.parent.request = MagicMock()
+        client.parent.request.return_value = Response(200, json.dumps({}))
+        client.timeout = httpx2.Timeout(60, connect=5, pool=None)
+        fake_time = MagicMock()
+        fake_time.monotonic.return_value = 100.0
+        with patch.object(pagerduty.api_client, "time", new=fake_time):
+            # Each component is shortened to the time remaining:
+            client.request("GET", "/users", total_timeout=10)
+            self.assertEqual(
+                httpx2.Timeout(connect=5, read=10, write=10, pool=10),
+                client.parent.request.call_args[1]["timeout"],
+            )
+            client.request("GET", "/users", total_timeout=3)
+            self.assertEqual(
+                httpx2.Timeout(3),
+                client.parent.request.call_args[1]["timeout"],
+            )
+
+    @patch.object(pagerduty.ApiClient, "postprocess")
+    def test_request_total_timeout_verbs(self, postprocess):
+        client = self.new_client()
+        client.parent = Client()
+        client.parent.request = MagicMock()
+        client.parent.request.return_value = Response(200, json.dumps({}))
+        clock = [100.0]
+        fake_time = MagicMock()
+        fake_time.monotonic.side_effect = lambda: clock[0]
+        with patch.object(pagerduty.api_client, "time", new=fake_time):
+            for verb in ("delete", "get", "post", "put"):
+                getattr(client, verb)("/users", total_timeout=3)
+                self.assertEqual(
+                    3, client.parent.request.call_args[1]["timeout"]
+                )
+            # The total timeout only applies to the call it was given to:
+            client.get("/users")
+            self.assertEqual(
+                client.timeout, client.parent.request.call_args[1]["timeout"]
+            )
+        with self.assertRaises(ValueError):
+            client.get("/users", total_timeout=0)
+
     def test_stagger_cooldown(self):
         client = self.new_client()
         with self.assertRaises(ValueError):
@@ -404,3 +642,138 @@ class ApiClientTest(ClientTest):
             r"""python-pagerduty/\S+ httpx2/[0-9.]+ """
             r"""Python/[0-9]+\.[0-9]+""",
         )
+
+
+class DummyAsyncApiClient(pagerduty.AsyncApiClient):
+    """
+    Asynchronous counterpart to DummyApiClient for unit testing.
+    """
+
+    @property
+    def default_base_url(self) -> str:
+        return "https://dummy-api.pagerduty.com"
+
+    @property
+    def permitted_methods(self) -> tuple:
+        return ("DELETE", "GET", "POST", "PUT")
+
+    sleep_timer_base = 0.5
+
+
+class AsyncApiClientTest(unittest.IsolatedAsyncioTestCase):
+    def new_client(self):
+        return DummyAsyncApiClient(DummyAuthMethod("token"))
+
+    @patch.object(pagerduty.AsyncApiClient, "postprocess")
+    async def test_request(self, postprocess):
+        client = self.new_client()
+        parent = Client()
+        request = AsyncMock()
+        user = {"type": "user", "email": "user@example.com"}
+        with patch.object(client, "parent", new=parent):
+            parent.request = request
+            # Test bad request method
+            with self.assertRaises(pagerduty.Error):
+                await client.request("poke", "/something")
+            request.assert_not_called()
+
+            # Test basic GET
+            return_value = Response(200, json.dumps({"user": user}))
+            request.return_value = return_value
+            r = await client.get("/users/P123456")
+            self.assertIs(return_value, r)
+            postprocess.assert_called_with(return_value)
+            self.assertEqual("GET", request.call_args[0][0])
+            self.assertEqual(
+                f"{client.url}/users/P123456", request.call_args[0][1]
+            )
+            self.assertEqual(
+                "some format idk secret=token",
+                request.call_args[1]["headers"]["Authorization"],
+            )
+            request.reset_mock()
+
+            # Test hitting the rate limit
+            request.side_effect = [
+                Response(429, json.dumps({"error": {"message": "chill out"}})),
+                Response(429, json.dumps({"error": {"message": "chill out"}})),
+                Response(200, json.dumps({"user": user})),
+            ]
+            with patch.object(
+                pagerduty.api_client.asyncio, "sleep", new=AsyncMock()
+            ) as sleep:
+                r = await client.get("/users")
+                self.assertTrue(r.is_success)
+                self.assertEqual(3, request.call_count)
+                self.assertEqual(2, sleep.call_count)
+            request.reset_mock()
+            request.side_effect = None
+
+            # Test a 401 (should raise Exception)
+            request.return_value = Response(401, json.dumps({}))
+            with self.assertRaises(pagerduty.HttpError):
+                await client.request("get", "/services")
+            request.reset_mock()
+
+            # Test giving up after too many network errors
+            raises = [pagerduty.api_client.TransportError("D'oh!")] * (
+                client.max_network_attempts + 1
+            )
+            request.side_effect = raises
+            with patch.object(
+                pagerduty.api_client.asyncio, "sleep", new=AsyncMock()
+            ) as sleep:
+                with self.assertRaises(pagerduty.Error) as cm:
+                    await client.get("/users")
+                self.assertEqual(raises[-1], cm.exception.__cause__)
+                self.assertEqual(client.max_network_attempts, sleep.call_count)
+
+    @patch.object(pagerduty.AsyncApiClient, "postprocess")
+    async def test_request_total_timeout(self, postprocess):
+        client = self.new_client()
+        parent = Client()
+        parent.request = AsyncMock(
+            side_effect=pagerduty.api_client.TransportError("D'oh!")
+        )
+        client.total_timeout = 0.5
+        client.sleep_timer = 2
+        with patch.object(client, "parent", new=parent):
+            with patch.object(
+                pagerduty.api_client.asyncio, "sleep", new=AsyncMock()
+            ) as sleep:
+                with self.assertRaises(pagerduty.DeadlineExceededError):
+                    await client.get("/users")
+        self.assertEqual(2, parent.request.call_count)
+        sleep.assert_awaited_once()
+        self.assertLess(sleep.call_args[0][0], 0.25)
+
+    @patch.object(pagerduty.AsyncApiClient, "postprocess")
+    async def test_request_total_timeout_rate_limiter(self, postprocess):
+        client = self.new_client()
+        client.rate_limiter = pagerduty.RateLimiter()
+        parent = Client()
+        throttled = Response(429, json.dumps({}))
+        throttled.headers["retry-after"] = "30"
+        ok = Response(200, json.dumps({}))
+        parent.request = AsyncMock(side_effect=[throttled, ok])
+        with patch.object(client, "parent", new=parent):
+            with patch.object(
+                pagerduty.api_client.asyncio, "sleep", new=AsyncMock()
+            ) as sleep:
+                r = await client.request("GET", "/users", total_timeout=1)
+        self.assertIs(ok, r)
+        sleep.assert_awaited_once()
+        self.assertLess(sleep.call_args[0][0], 0.5)
+
+    @patch.object(pagerduty.AsyncApiClient, "postprocess")
+    async def test_request_total_timeout_verbs(self, postprocess):
+        client = self.new_client()
+        parent = Client()
+        parent.request = AsyncMock(return_value=Response(200, json.dumps({})))
+        with patch.object(client, "parent", new=parent):
+            await client.post("/users", json={}, total_timeout=3)
+            self.assertLessEqual(parent.request.call_args[1]["timeout"], 3)
+            await client.get("/users")
+            self.assertEqual(
+                client.timeout, parent.request.call_args[1]["timeout"]
+            )
@@ -1,4 +1,7 @@
+import json
 import unittest
+from io import StringIO
+from tempfile import NamedTemporaryFile
 from unittest.mock import patch
 
 import pagerduty
@@ -36,3 +39,60 @@ class CliTest(unittest.TestCase):
     def test_resolve(self, resolve_method):
         cli.run(["-k", "routing_key_here", "-i", "dedup_key_here", "resolve"])
         resolve_method.assert_called_once_with("dedup_key_here")
+
+    @patch.object(pagerduty.EventsApiV2Client, "send_event")
+    def test_send_batch(self, send_event_method):
+        def send_event(action, dedup_key=None, **properties):
+            if dedup_key == "bad":
+                raise pagerduty.Error("Bad event")
+            return dedup_key or "generated"
+
+        send_event_method.side_effect = send_event
+        lines = [
+            '{"event_action": "trigger", "payload": {}, "dedup_key": "a"}',
+            "",
+            "not json",
+            '{"event_action": "resolve", "dedup_key": "bad"}',
+            '{"event_action": "trigger", "payload": {}}',
+            "[]",
+        ]
+        with NamedTemporaryFile("w", suffix=".ndjson") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            with patch("sys.stdout", new=StringIO()) as stdout:
+                with self.assertRaises(SystemExit) as exit:
+                    cli.run(
+                        ["-k", "routing_key_here", "-f", f.name, "-c", "2"]
+                        + ["send-batch"]
+                    )
+        self.assertEqual(1, exit.exception.code)
+        output = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([1, 3, 4, 5, 6], [o["line"] for o in output])
+        self.assertEqual("a", output[0]["dedup_key"])
+        self.assertIn("error", output[1])
+        self.assertEqual("Bad event", output[2]["error"])
+        self.assertEqual("generated", output[3]["dedup_key"])
+        self.assertEqual("Each event must be a dict", output[4]["error"])
+        self.assertEqual(3, send_event_method.call_count)
+
+    @patch.object(pagerduty.EventsApiV2Client, "send_event")
+    def test_send_batch_stdin(self, send_event_method):
+        send_event_method.side_effect = lambda action, dedup_key=None, **kw: (
+            dedup_key
+        )
+        stdin = StringIO(
+            "".join(
+                json.dumps(
+                    {"event_action": "acknowledge", "dedup_key": str(i)}
+                )
+                + "\n"
+                for i in range(20)
+            )
+        )
+        with patch("sys.stdin", new=stdin):
+            with patch("sys.stdout", new=StringIO()) as stdout:
+                cli.run(["-k", "routing_key_here", "send-batch"])
+        output = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(
+            [{"line": i + 1, "dedup_key": str(i)} for i in range(20)], output
+        )
@@ -172,6 +172,42 @@ class CommonTest(unittest.TestCase):
                 o_name, pagerduty.singular_name(pagerduty.plural_name(o_name))
             )
 
+    def test_retry_after(self):
+        response = Response(429, json.dumps({}))
+        # No headers indicating when to retry:
+        self.assertIsNone(common.retry_after(response))
+        # Seconds:
+        response.headers["retry-after"] = "7"
+        self.assertEqual(7.0, common.retry_after(response))
+        # HTTP date:
+        when = datetime.datetime.now(timezone.utc) + datetime.timedelta(
+            seconds=30
+        )
+        response.headers["retry-after"] = when.strftime(
+            "%a, %d %b %Y %H:%M:%S GMT"
+        )
+        self.assertTrue(28 < common.retry_after(response) <= 30)
+        response.headers["retry-after"] = "not a date"
+        self.assertIsNone(common.retry_after(response))
+        # Limits:
+        response.headers["retry-after"] = "86400"
+        self.assertEqual(300.0, common.retry_after(response, maximum=300))
+        response.headers["retry-after"] = "-5"
+        self.assertEqual(0.0, common.retry_after(response, maximum=300))
+        for value in ("inf", "nan"):
+            response.headers["retry-after"] = value
+            self.assertIsNone(common.retry_after(response))
+        # Rate limit reset header, when the limit has been reached:
+        del response.headers["retry-after"]
+        response.headers["ratelimit-reset"] = "12"
+        self.assertEqual(12.0, common.retry_after(response))
+        response = Response(200, json.dumps({}))
+        response.headers["ratelimit-reset"] = "12"
+        response.headers["ratelimit-remaining"] = "3"
+        self.assertIsNone(common.retry_after(response))
+        response.headers["ratelimit-remaining"] = "0"
+        self.assertEqual(12.0, common.retry_after(response))
+
     def test_strftime(self):
         when = datetime.datetime(2025, 7, 1, 23, 19, tzinfo=timezone.utc)
         datestr = pagerduty.common.strftime(when)
@@ -0,0 +1,96 @@
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from httpx2 import ByteStream, MockTransport, Response
+
+import pagerduty
+
+
+def user_responder(request):
+    content = json.dumps({"user": {"id": "PABC123"}}).encode()
+    return Response(
+        200,
+        stream=ByteStream(content),
+        headers={
+            "content-type": "application/json",
+            "content-length": str(len(content)),
+        },
+    )
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def test_init(self):
+        pool = pagerduty.ConnectionPool(
+            max_connections=5, max_keepalive_connections=2, keepalive_expiry=1
+        )
+        self.assertEqual(5, pool.limits.max_connections)
+        self.assertEqual(2, pool.limits.max_keepalive_connections)
+        self.assertEqual(1, pool.limits.keepalive_expiry)
+        self.assertRaises(
+            ValueError, pagerduty.ConnectionPool, max_connections=0
+        )
+        self.assertRaises(
+            ValueError, pagerduty.ConnectionPool, max_keepalive_connections=-1
+        )
+        self.assertRaises(ValueError, pagerduty.ConnectionPool, limits=None)
+
+    def test_shared_transport(self):
+        pool = pagerduty.ConnectionPool()
+        transport = MockTransport(user_responder)
+        transport.close = MagicMock()
+        pool._sync_transport = transport
+        rest_client = pagerduty.RestApiV2Client("token", connection_pool=pool)
+        scim_client = pagerduty.ScimApiClient(
+            pagerduty.TokenAuthMethod("token"), connection_pool=pool
+        )
+        self.assertIs(pool, rest_client.connection_pool)
+        with rest_client:
+            self.assertEqual(
+                "PABC123", rest_client.rget("/users/PABC123")["id"]
+            )
+        # Closing a client doesn't close the pool used by other clients:
+        transport.close.assert_not_called()
+        response = scim_client.get("/Users/PABC123")
+        self.assertEqual(200, response.status_code)
+        pool.close()
+        transport.close.assert_called_once()
+        self.assertIsNone(pool._sync_transport)
+
+    def test_transport_conflict(self):
+        pool = pagerduty.ConnectionPool()
+        with self.assertRaises(ValueError):
+            pagerduty.RestApiV2Client(
+                "token",
+                connection_pool=pool,
+                transport=MockTransport(user_responder),
+            )
+
+    def test_transport(self):
+        with pagerduty.ConnectionPool(max_connections=3) as pool:
+            transport1, transport2 = pool.transport, pool.transport
+            self.assertIs(transport1._transport, transport2._transport)
+            underlying = transport1._transport
+            underlying.close = MagicMock()
+            transport1.close()
+            underlying.close.assert_not_called()
+        underlying.close.assert_called_once()
+
+
+class AsyncConnectionPoolTest(unittest.IsolatedAsyncioTestCase):
+    async def test_shared_transport(self):
+        pool = pagerduty.ConnectionPool()
+        transport = MockTransport(user_responder)
+        transport.aclose = AsyncMock()
+        pool._async_transport = transport
+        async with pagerduty.AsyncRestApiV2Client(
+            "token", connection_pool=pool
+        ) as client:
+            user = await client.rget("/users/PABC123")
+        self.assertEqual("PABC123", user["id"])
+        transport.aclose.assert_not_awaited()
+        # The synchronous transport is separate and is never created:
+        self.assertIsNone(pool._sync_transport)
+        async with pool:
+            pass
+        transport.aclose.assert_awaited_once()
@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pagerduty
+
+
+class EventSpoolTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = tmp.name
+
+    def segment_files(self):
+        return sorted(
+            f for f in os.listdir(self.directory) if f.endswith(".ndjson")
+        )
+
+    def test_append_read_commit(self):
+        spool = pagerduty.EventSpool(self.directory, segment_size=100)
+        self.addCleanup(spool.close)
+        self.assertEqual([], spool.read())
+        for i in range(5):
+            spool.append("/v2/enqueue", {"dedup_key": str(i)})
+        events = spool.read(limit=3)
+        self.assertEqual(
+            ["0", "1", "2"], [body["dedup_key"] for _, _, body in events]
+        )
+        self.assertEqual({"/v2/enqueue"}, {path for _, path, _ in events})
+        # Reading does not consume events until they are committed:
+        self.assertEqual(events, spool.read(limit=3))
+        # Segments roll over once they exceed the size limit:
+        self.assertGreater(len(self.segment_files()), 1)
+        spool.commit(events[-1][0])
+        self.assertEqual(
+            ["3", "4"], [body["dedup_key"] for _, _, body in spool.read()]
+        )
+        # Fully-sent segments are deleted:
+        spool.commit(spool.read()[-1][0])
+        self.assertEqual([], spool.read())
+        self.assertEqual(1, len(self.segment_files()))
+
+    def test_commit_durable(self):
+        spool = pagerduty.EventSpool(self.directory, segment_size=100)
+        self.addCleanup(spool.close)
+        for i in range(5):
+            spool.append("/v2/enqueue", {"dedup_key": str(i)})
+        position = spool.read()[-1][0]
+        with patch.object(pagerduty.event_spool.os, "fsync") as fsync:
+            with patch.object(pagerduty.event_spool.os, "listdir") as listdir:
+                spool.commit(position)
+            # The index file is synced before it replaces the old one:
+            fsync.assert_called()
+            listdir.assert_not_called()
+        self.assertEqual([], spool.read())
+        self.assertEqual(1, len(self.segment_files()))
+
+    def test_replay(self):
+        spool = pagerduty.EventSpool(self.directory)
+        for i in range(3):
+            spool.append("/v2/enqueue", {"dedup_key": str(i)})
+        spool.append("/v2/change/enqueue", {"payload": {}})
+        spool.commit(spool.read(limit=1)[0][0])
+        spool.close()
+        # Simulate the process exiting partway through writing an event:
+        with open(
+            os.path.join(self.directory, self.segment_files()[-1]), "ab"
+        ) as f:
+            f.write(b'{"path": "/v2/enq')
+        spool = pagerduty.EventSpool(self.directory)
+        self.addCleanup(spool.close)
+        self.assertEqual(
+            [
+                ("/v2/enqueue", {"dedup_key": "1"}),
+                ("/v2/enqueue", {"dedup_key": "2"}),
+                ("/v2/change/enqueue", {"payload": {}}),
+            ],
+            [(path, body) for _, path, body in spool.read()],
+        )
+        spool.append("/v2/enqueue", {"dedup_key": "3"})
+        self.assertEqual(
+            ["1", "2", None, "3"],
+            [body.get("dedup_key") for _, _, body in spool.read()],
+        )
+
+    def test_skip_undecodable(self):
+        spool = pagerduty.EventSpool(self.directory)
+        spool.append("/v2/enqueue", {"dedup_key": "0"})
+        spool.close()
+        with open(
+            os.path.join(self.directory, self.segment_files()[-1]), "ab"
+        ) as f:
+            f.write(b'not json\n{"path": "/v2/enq')
+        spool = pagerduty.EventSpool(self.directory)
+        self.addCleanup(spool.close)
+        spool.append("/v2/enqueue", {"dedup_key": "1"})
+        with self.assertLogs("pagerduty.event_spool", "ERROR") as logs:
+            events = spool.read()
+        # Each skipped line is logged with its location, and the events after
+        # it are still read:
+        self.assertEqual(
+            ["0", "1"], [body["dedup_key"] for _, _, body in events]
+        )
+        self.assertEqual(2, len(logs.output))
+        self.assertIn("undecodable", logs.output[0])
+        self.assertIn("000000000001.ndjson at byte offset 52", logs.output[0])
+        self.assertIn("incomplete", logs.output[1])
+        # ...but only once:
+        with patch.object(spool.log, "error") as error:
+            self.assertEqual(events, spool.read())
+            error.assert_not_called()
+
+    def test_append_closed(self):
+        spool = pagerduty.EventSpool(self.directory)
+        spool.close()
+        with self.assertRaisesRegex(ValueError, "has been closed"):
+            spool.append("/v2/enqueue", {})
+
+    def test_sync(self):
+        spool = pagerduty.EventSpool(
+            self.directory, sync_every=2, sync_interval=60
+        )
+        self.addCleanup(spool.close)
+        with patch.object(pagerduty.event_spool.os, "fsync") as fsync:
+            spool.append("/v2/enqueue", {})
+            fsync.assert_not_called()
+            spool.append("/v2/enqueue", {})
+            fsync.assert_called_once()
+            spool.append("/v2/enqueue", {})
+            spool.sync()
+            fsync.assert_called_once()
+            spool.sync_interval = 0
+            spool.sync()
+            self.assertEqual(2, fsync.call_count)
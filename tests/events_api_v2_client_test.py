@@ -1,4 +1,8 @@
-from unittest.mock import MagicMock, patch
+import json
+import tempfile
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from common_test import ClientTest
 from mocks import Response
@@ -74,6 +78,18 @@ class EventsApiV2ClientTest(ClientTest):
                 parent.request.call_args[1]["json"],
             )
 
+    def test_send_event_total_timeout(self):
+        client = pagerduty.EventsApiV2Client("routingkey")
+        parent = MagicMock()
+        parent.request.return_value = Response(202, '{"dedup_key":"abc123"}')
+        with patch.object(client, "parent", new=parent):
+            client.trigger("testing 123", "triggered.from", total_timeout=3)
+            self.assertLessEqual(parent.request.call_args[1]["timeout"], 3)
+            client.resolve("abc123")
+            self.assertEqual(
+                client.timeout, parent.request.call_args[1]["timeout"]
+            )
+
     def test_send_explicit_event(self):
         # test sending an event by calling `post` directly as opposed to any of
         # the methods written into the client for sending events
@@ -192,3 +208,324 @@ class EventsApiV2ClientTest(ClientTest):
                 },
                 parent.request.call_args[1]["json"],
             )
+
+
+def enqueue_responder():
+    """
+    Mock Events API responses for testing batch submission.
+
+    Requests are answered according to the dedup_key of the event sent, since
+    the order in which they are sent is nondeterministic. The event with key
+    "flaky" fails with status 503 the first time, and the event with key "bad"
+    is rejected with status 400.
+    """
+    attempts = {}
+
+    def respond(method, url, **kw):
+        dedup_key = kw["json"].get("dedup_key", "new")
+        attempts[dedup_key] = attempts.get(dedup_key, 0) + 1
+        if dedup_key == "bad":
+            return Response(400, json.dumps({"status": "invalid event"}))
+        if dedup_key == "flaky" and attempts[dedup_key] == 1:
+            return Response(503, "")
+        return Response(202, json.dumps({"dedup_key": dedup_key}))
+
+    return respond
+
+
+BATCH_EVENTS = [
+    {"event_action": "resolve", "dedup_key": "abc"},
+    {"event_action": "acknowledge", "dedup_key": "bad"},
+    {"event_action": "trigger", "payload": {"summary": "s", "source": "s"}},
+    {"event_action": "explode", "dedup_key": "abc"},
+    {"event_action": "resolve", "dedup_key": "flaky"},
+]
+
+
+class EventsApiV2ClientBatchTest(unittest.TestCase):
+    def test_submit_many(self):
+        client = pagerduty.EventsApiV2Client("routingkey")
+        parent = MagicMock()
+        parent.request = MagicMock(side_effect=enqueue_responder())
+        with patch.object(client, "parent", new=parent):
+            with patch.object(pagerduty.api_client.time, "sleep") as sleep:
+                results = client.submit_many(BATCH_EVENTS, concurrency=3)
+        self.assertEqual(len(BATCH_EVENTS), len(results))
+        self.assertEqual("abc", results[0])
+        self.assertIsInstance(results[1], pagerduty.HttpError)
+        self.assertEqual(400, results[1].response.status_code)
+        self.assertEqual("new", results[2])
+        self.assertIsInstance(results[3], ValueError)
+        # Retried according to the retry table:
+        self.assertEqual("flaky", results[4])
+        sleep.assert_called_once()
+        # The invalid event should never be sent; the others should have the
+        # routing key added:
+        self.assertEqual(5, parent.request.call_count)
+        for call in parent.request.call_args_list:
+            self.assertEqual("routingkey", call[1]["json"]["routing_key"])
+
+    def test_iter_submit_many(self):
+        client = pagerduty.EventsApiV2Client("routingkey")
+        parent = MagicMock()
+        parent.request = MagicMock(side_effect=enqueue_responder())
+        consumed = []
+
+        def events():
+            for event in BATCH_EVENTS:
+                consumed.append(event)
+                yield event
+
+        with patch.object(client, "parent", new=parent):
+            with patch.object(pagerduty.api_client.time, "sleep"):
+                results = client.iter_submit_many(events(), concurrency=2)
+                # Events are only read as they can be sent:
+                self.assertEqual("abc", next(results))
+                self.assertEqual(3, len(consumed))
+                results = list(results)
+        self.assertEqual(len(BATCH_EVENTS), len(consumed))
+        self.assertIsInstance(results[0], pagerduty.HttpError)
+        self.assertEqual("new", results[1])
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual("flaky", results[3])
+
+    def test_submit_many_malformed(self):
+        client = pagerduty.EventsApiV2Client("routingkey")
+        parent = MagicMock()
+        parent.request = MagicMock(side_effect=enqueue_responder())
+        events = [
+            {"event_action": "resolve", "dedup_key": "abc"},
+            # A property name that isn't a string:
+            {"event_action": "resolve", "dedup_key": "abc", 1: "one"},
+            {"event_action": "resolve", "dedup_key": "def"},
+        ]
+        with patch.object(client, "parent", new=parent):
+            results = client.submit_many(events, concurrency=2)
+        self.assertEqual("abc", results[0])
+        self.assertIsInstance(results[1], TypeError)
+        self.assertEqual("def", results[2])
+        self.assertEqual(2, parent.request.call_count)
+        # The concurrency is validated before anything is sent:
+        for concurrency in (0, -1):
+            with self.assertRaises(ValueError):
+                client.iter_submit_many(events, concurrency=concurrency)
+
+
+class EventsApiV2ClientCoalesceTest(unittest.TestCase):
+    def sent(self, parent):
+        return [
+            (c[1]["json"]["event_action"], c[1]["json"].get("dedup_key"))
+            for c in parent.request.call_args_list
+        ]
+
+    def test_coalesce(self):
+        client = pagerduty.EventsApiV2Client("routingkey", coalesce_window=60)
+        parent = MagicMock()
+        parent.request = MagicMock(side_effect=enqueue_responder())
+        with patch.object(client, "parent", new=parent):
+            for i in range(3):
+                self.assertEqual(
+                    "abc", client.trigger("Disk %d%% full" % i, "db1", "abc")
+                )
+            client.resolve("abc")
+            client.trigger("Fan failure", "db2", "def")
+            # Acknowledging doesn't supersede triggering, so the trigger
+            # is sent right away rather than being dropped:
+            client.acknowledge("def")
+            self.assertEqual([("trigger", "def")], self.sent(parent))
+            # Triggers for new alerts are never held:
+            self.assertEqual("new", client.trigger("New", "db3"))
+            client.close()
+        self.assertEqual(
+            [
+                ("trigger", "def"),
+                ("trigger", None),
+                ("resolve", "abc"),
+                ("acknowledge", "def"),
+            ],
+            self.sent(parent),
+        )
+
+    def test_coalesce_order(self):
+        client = pagerduty.EventsApiV2Client("routingkey", coalesce_window=60)
+        responder = enqueue_responder()
+        sent = []
+
+        def respond(method, url, **kw):
+            # The superseded trigger is slow to send:
+            if kw["json"]["event_action"] == "trigger":
+                time.sleep(0.1)
+            sent.append(kw["json"]["event_action"])
+            return responder(method, url, **kw)
+
+        parent = MagicMock()
+        parent.request = MagicMock(side_effect=respond)
+        with patch.object(client, "parent", new=parent):
+            client.trigger("Fan failure", "db2", "def")
+            # The acknowledge is due right away, but the background thread
+            # must not send it before the trigger it supersedes:
+            client.coalesce_window = 0.001
+            client.acknowledge("def")
+            client.close()
+        self.assertEqual(["trigger", "acknowledge"], sent)
+
+    def test_coalesce_window(self):
+        client = pagerduty.EventsApiV2Client(
+            "routingkey", coalesce_window=0.05
+        )
+        parent = MagicMock()
+        parent.request = MagicMock(side_effect=enqueue_responder())
+        with patch.object(client, "parent", new=parent):
+            client.trigger("Disk 90% full", "db1", "abc")
+            client.trigger("Disk 95% full", "db1", "abc")
+            for i in range(100):
+                if parent.request.called:
+                    break
+                time.sleep(0.01)
+            self.assertEqual([("trigger", "abc")], self.sent(parent))
+            self.assertEqual(
+                "Disk 95% full",
+                parent.request.call_args[1]["json"]["payload"]["summary"],
+            )
+            client.close()
+        parent.request.assert_called_once()
+
+
+class EventsApiV2ClientSpoolTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = tmp.name
+
+    @patch.object(pagerduty.EventsApiV2Client, "sleep_timer", new=0.01)
+    @patch.object(pagerduty.EventsApiV2Client, "request")
+    def test_send_through_spool(self, post):
+        responder = enqueue_responder()
+
+        def respond(method, url, json=None, total_timeout=None):
+            # Sending is bounded so that closing the client can't hang:
+            self.assertEqual(60.0, total_timeout)
+            # The API is unreachable at first:
+            if post.call_count == 1:
+                raise pagerduty.Error("Network down")
+            if post.call_count == 2:
+                return Response(503, "")
+            return responder(method, url, json=json)
+
+        post.side_effect = respond
+        # An event left unsent by a previous process:
+        previous = pagerduty.EventSpool(self.directory)
+        previous.append(
+            "/v2/enqueue", {"event_action": "resolve", "dedup_key": "old"}
+        )
+        previous.close()
+        client = pagerduty.EventsApiV2Client(
+            "routingkey", spool=pagerduty.EventSpool(self.directory)
+        )
+        with client:
+            self.assertEqual("abc", client.resolve("abc"))
+            self.assertEqual("bad", client.acknowledge("bad"))
+            # A deduplication key is generated for triggers that have none:
+            dedup_key = client.trigger("summary", "source")
+            self.assertIsInstance(dedup_key, str)
+            client.submit("Deployed", source="ci")
+            self.assertTrue(client.flush_spool(timeout=10))
+        self.assertEqual(
+            ["old", "old", "old", "abc", "bad", dedup_key, None],
+            [c[1]["json"].get("dedup_key") for c in post.call_args_list],
+        )
+        self.assertEqual("/v2/change/enqueue", post.call_args_list[-1][0][1])
+        # Everything was either sent or rejected, so nothing is replayed:
+        spool = pagerduty.EventSpool(self.directory)
+        self.addCleanup(spool.close)
+        self.assertEqual([], spool.read())
+
+    @patch.object(pagerduty.EventsApiV2Client, "sleep_timer", new=0.01)
+    @patch.object(pagerduty.EventsApiV2Client, "request")
+    def test_spool_commit_per_batch(self, request):
+        request.side_effect = lambda method, url, **kw: enqueue_responder()(
+            method, url, json=kw["json"]
+        )
+        spool = pagerduty.EventSpool(self.directory)
+        for i in range(3):
+            spool.append("/v2/enqueue", {"dedup_key": str(i)})
+        commit = spool.commit
+        calls = []
+
+        def failing_commit(position):
+            calls.append(position)
+            # The disk is full at first:
+            if len(calls) == 1:
+                raise OSError("No space left on device")
+            commit(position)
+
+        with patch.object(spool, "commit", side_effect=failing_commit):
+            with pagerduty.EventsApiV2Client("routingkey", spool=spool) as c:
+                self.assertTrue(c.flush_spool(timeout=10))
+                # The thread survived the error and retried the batch:
+                self.assertTrue(c._spool_thread.is_alive())
+        # Each batch is committed once rather than once per event:
+        self.assertEqual(2, len(calls))
+        self.assertEqual(6, request.call_count)
+
+
+class AsyncEventsApiV2ClientTest(unittest.IsolatedAsyncioTestCase):
+    async def test_send_event(self):
+        client = pagerduty.AsyncEventsApiV2Client("routingkey")
+        parent = MagicMock()
+        parent.request = AsyncMock()
+        parent.request.side_effect = [
+            Response(202, '{"dedup_key":"abc123"}'),
+            Response(202, '{"dedup_key":"abc123"}'),
+        ]
+        with patch.object(client, "parent", new=parent):
+            ddk = await client.trigger(
+                "testing 123",
+                "triggered.from.pagerduty",
+                custom_details={"this": "that"},
+            )
+            self.assertEqual("abc123", ddk)
+            self.assertEqual(
+                "https://events.pagerduty.com/v2/enqueue",
+                parent.request.call_args[0][1],
+            )
+            self.assertEqual(
+                {
+                    "event_action": "trigger",
+                    "routing_key": "routingkey",
+                    "payload": {
+                        "summary": "testing 123",
+                        "source": "triggered.from.pagerduty",
+                        "severity": "critical",
+                        "custom_details": {"this": "that"},
+                    },
+                },
+                parent.request.call_args[1]["json"],
+            )
+            await client.resolve("abc123")
+            self.assertEqual(
+                {
+                    "event_action": "resolve",
+                    "dedup_key": "abc123",
+                    "routing_key": "routingkey",
+                },
+                parent.request.call_args[1]["json"],
+            )
+
+    async def test_submit_many(self):
+        client = pagerduty.AsyncEventsApiV2Client("routingkey")
+        parent = MagicMock()
+        parent.request = AsyncMock(side_effect=enqueue_responder())
+        with patch.object(client, "parent", new=parent):
+            with patch.object(
+                pagerduty.api_client.asyncio, "sleep", new=AsyncMock()
+            ) as sleep:
+                results = await client.submit_many(BATCH_EVENTS, concurrency=2)
+        self.assertEqual("abc", results[0])
+        self.assertIsInstance(results[1], pagerduty.HttpError)
+        self.assertEqual("new", results[2])
+        self.assertIsInstance(results[3], ValueError)
+        self.assertEqual("flaky", results[4])
+        sleep.assert_called_once()
+        with self.assertRaises(ValueError):
+            await client.submit_many(BATCH_EVENTS, concurrency=0)
@@ -0,0 +1,159 @@
+import sys
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx2
+
+import pagerduty
+from mocks import Response
+
+
+class RecordingHooks(pagerduty.RequestHooks):
+    """
+    Records the events of each request in a list.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def page(self, client, path, results):
+        self.events.append(("page", path, len(results)))
+
+    def rate_limited(self, client, context, wait):
+        self.events.append(("rate_limited", context))
+
+    def request_end(self, client, context, response=None, error=None):
+        status = None if response is None else response.status_code
+        self.events.append(("request_end", context, status, type(error)))
+
+    def request_start(self, client, method, url):
+        self.events.append(("request_start", method, url))
+        return f"{method} {url}"
+
+    def response(self, client, context, response):
+        self.events.append(("response", context, response.status_code))
+
+    def retry(self, client, context, wait, response=None, error=None):
+        self.events.append(("retry", context, type(error)))
+
+
+USER_URL = "https://api.pagerduty.com/users/PABC"
+
+EXPECTED_EVENTS = [
+    ("request_start", "GET", USER_URL),
+    ("retry", f"GET {USER_URL}", httpx2.ConnectError),
+    ("response", f"GET {USER_URL}", 429),
+    ("rate_limited", f"GET {USER_URL}"),
+    ("retry", f"GET {USER_URL}", type(None)),
+    ("response", f"GET {USER_URL}", 200),
+    ("request_end", f"GET {USER_URL}", 200, type(None)),
+]
+
+
+def responses():
+    return [
+        httpx2.ConnectError("connection refused"),
+        Response(429, "{}", url=USER_URL),
+        Response(200, "{}", url=USER_URL),
+    ]
+
+
+class RequestHooksTest(unittest.TestCase):
+    @patch.object(pagerduty.api_client.time, "sleep")
+    @patch.object(httpx2.Client, "request")
+    def test_request(self, request, sleep):
+        hooks = RecordingHooks()
+        client = pagerduty.RestApiV2Client("token", hooks=hooks)
+        request.side_effect = responses()
+        client.get("/users/PABC")
+        self.assertEqual(EXPECTED_EVENTS, hooks.events)
+        # The end of the request is reported even if it fails:
+        hooks.events.clear()
+        client.max_network_attempts = 0
+        request.side_effect = httpx2.ConnectError("connection refused")
+        self.assertRaises(pagerduty.Error, client.get, "/users/PABC")
+        self.assertEqual(
+            [
+                ("request_start", "GET", USER_URL),
+                ("request_end", f"GET {USER_URL}", None, pagerduty.Error),
+            ],
+            hooks.events,
+        )
+
+    @patch.object(pagerduty.RestApiV2Client, "get")
+    def test_page(self, get):
+        hooks = RecordingHooks()
+        client = pagerduty.RestApiV2Client("token", hooks=hooks)
+        get.side_effect = [
+            Response(
+                200,
+                '{"users": [{"id": "P1"}, {"id": "P2"}], "more": true}',
+            ),
+            Response(200, '{"users": [{"id": "P3"}], "more": false}'),
+        ]
+        self.assertEqual(3, len(client.list_all("/users")))
+        self.assertEqual(
+            [("page", "/users", 2), ("page", "/users", 1)], hooks.events
+        )
+
+
+class AsyncRequestHooksTest(unittest.IsolatedAsyncioTestCase):
+    @patch.object(
+        pagerduty.api_client.asyncio, "sleep", new_callable=AsyncMock
+    )
+    @patch.object(httpx2.AsyncClient, "request", new_callable=AsyncMock)
+    async def test_request(self, request, sleep):
+        hooks = RecordingHooks()
+        client = pagerduty.AsyncRestApiV2Client("token", hooks=hooks)
+        request.side_effect = responses()
+        await client.get("/users/PABC")
+        self.assertEqual(EXPECTED_EVENTS, hooks.events)
+
+
+class OpenTelemetryHooksTest(unittest.TestCase):
+    def test_missing_dependency(self):
+        with patch.dict(sys.modules, {"opentelemetry": None}):
+            self.assertRaises(ImportError, pagerduty.OpenTelemetryHooks)
+
+    @patch.object(pagerduty.api_client.time, "sleep")
+    @patch.object(httpx2.Client, "request")
+    def test_spans_and_metrics(self, request, sleep):
+        opentelemetry = MagicMock()
+        modules = {
+            "opentelemetry": opentelemetry,
+            "opentelemetry.metrics": opentelemetry.metrics,
+            "opentelemetry.trace": opentelemetry.trace,
+        }
+        with patch.dict(sys.modules, modules):
+            hooks = pagerduty.OpenTelemetryHooks()
+        tracer = opentelemetry.trace.get_tracer.return_value
+        span = tracer.start_span.return_value
+        client = pagerduty.RestApiV2Client("token", hooks=hooks)
+        request.side_effect = responses()
+        client.get("/users/PABC")
+        # The span is named after the canonical path, not the URL:
+        self.assertEqual("GET /users/{id}", tracer.start_span.call_args[0][0])
+        attributes = {
+            "http.request.method": "GET",
+            "http.route": "/users/{id}",
+            "server.address": "api.pagerduty.com",
+        }
+        hooks.retries.add.assert_called_with(1, attributes)
+        self.assertEqual(2, hooks.retries.add.call_count)
+        self.assertEqual(
+            ["retry", "rate_limited", "retry"],
+            [c[0][0] for c in span.add_event.call_args_list],
+        )
+        span.set_status.assert_not_called()
+        span.end.assert_called_once()
+        duration_attributes = hooks.duration.record.call_args[0][1]
+        self.assertEqual(
+            dict(attributes, **{"http.response.status_code": 200}),
+            duration_attributes,
+        )
+        # Error responses mark the span as an error:
+        request.side_effect = [Response(404, "{}", url=USER_URL)]
+        client.get("/users/PABC")
+        span.set_status.assert_called_once_with(
+            opentelemetry.trace.StatusCode.ERROR
+        )
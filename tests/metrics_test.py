@@ -0,0 +1,134 @@
+import threading
+import unittest
+
+import pagerduty
+
+
+class ApiMetricsTest(unittest.TestCase):
+    def test_merge(self):
+        worker1, worker2 = pagerduty.ApiMetrics(), pagerduty.ApiMetrics()
+        worker1.record("GET /incidents", 200, 0.1, 100)
+        worker2.record("GET /incidents", 429, 0.2, 10)
+        worker2.record_retry("GET /incidents")
+        worker2.record("GET /log_entries", 200, 2.0, 1000)
+        merged = pagerduty.ApiMetrics.merge(
+            worker1.snapshot(), worker2.snapshot()
+        )
+        incidents = merged["GET /incidents"]
+        self.assertEqual(2, incidents["latency"].count)
+        self.assertAlmostEqual(0.3, incidents["time"])
+        self.assertEqual(
+            (2, 110, 1, {200: 1, 429: 1}),
+            (
+                incidents["calls"],
+                incidents["bytes"],
+                incidents["retries"],
+                incidents["statuses"],
+            ),
+        )
+        self.assertEqual(1, merged["GET /log_entries"]["latency"].count)
+        # Merging doesn't modify the original snapshots:
+        self.assertEqual(
+            1, worker1.snapshot()["GET /incidents"]["latency"].count
+        )
+
+    def test_record(self):
+        metrics = pagerduty.ApiMetrics(stripes=4)
+        endpoint = "GET /users/{id}"
+        n_threads, n_calls = 8, 500
+
+        def record():
+            for i in range(n_calls):
+                metrics.record(endpoint, 200 if i % 2 else 404, 0.5, 10)
+                metrics.record_retry(endpoint)
+
+        threads = [threading.Thread(target=record) for i in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        total = n_threads * n_calls
+        snapshot = metrics.snapshot()
+        self.assertEqual(total, snapshot[endpoint].pop("latency").count)
+        self.assertEqual(
+            {
+                endpoint: {
+                    "calls": total,
+                    "time": total * 0.5,
+                    "bytes": total * 10,
+                    "retries": total,
+                    "statuses": {200: total // 2, 404: total // 2},
+                }
+            },
+            snapshot,
+        )
+        self.assertRaises(ValueError, pagerduty.ApiMetrics, stripes=0)
+
+    def test_snapshot_reset(self):
+        metrics = pagerduty.ApiMetrics()
+        metrics.record("GET /users", 200, 1.0, 100)
+        metrics.record("POST /users", 201, 1.0, 100)
+        snapshot = metrics.snapshot()
+        self.assertEqual({"GET /users", "POST /users"}, set(snapshot))
+        # Modifying the snapshot doesn't affect the recorded metrics:
+        snapshot["GET /users"]["statuses"][200] = 5
+        self.assertEqual(
+            {200: 1}, metrics.snapshot()["GET /users"]["statuses"]
+        )
+        self.assertEqual(
+            {"GET /users": 1, "POST /users": 1}, metrics.totals("calls")
+        )
+        self.assertEqual(
+            {"GET /users": 100, "POST /users": 100}, metrics.totals("bytes")
+        )
+        view = metrics.totals_view("calls")
+        self.assertEqual({"GET /users": 1, "POST /users": 1}, view)
+        view["GET /users"] += 1
+        self.assertEqual(2, metrics.total("GET /users", "calls"))
+        del view["POST /users"]
+        self.assertEqual({"GET /users": 2}, view)
+        with self.assertRaises(KeyError):
+            view["POST /users"]
+        metrics.replace_totals("calls", {"PUT /users/{id}": 5})
+        self.assertEqual({"PUT /users/{id}": 5}, view)
+        self.assertEqual(100, metrics.total("GET /users", "bytes"))
+        self.assertIsNone(metrics.total("DELETE /users/{id}", "calls"))
+        metrics.reset()
+        self.assertEqual({}, metrics.snapshot())
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_percentile(self):
+        histogram = pagerduty.LatencyHistogram()
+        self.assertIsNone(histogram.percentile(50))
+        self.assertIsNone(histogram.mean)
+        # 90 fast requests and 10 slow ones:
+        for i in range(90):
+            histogram.add(0.05)
+        for i in range(10):
+            histogram.add(3.0)
+        estimates = histogram.percentiles((50, 90, 95, 99))
+        max_error = 1 / histogram.sub_buckets
+        for q, expected in ((50, 0.05), (90, 0.05), (95, 3.0), (99, 3.0)):
+            self.assertGreaterEqual(estimates[q], expected)
+            self.assertLessEqual(estimates[q], expected * (1 + max_error))
+        self.assertAlmostEqual(0.345, histogram.mean)
+        # Out-of-range values are counted in the first and last buckets:
+        histogram.add(0.0)
+        histogram.add(1e9)
+        self.assertEqual(1, histogram.counts[0])
+        self.assertEqual(1, histogram.counts[-1])
+        self.assertEqual(histogram.min_latency, histogram.percentile(0))
+        self.assertRaises(ValueError, histogram.percentile, 101)
+
+    def test_merge(self):
+        fast, slow = pagerduty.LatencyHistogram(), pagerduty.LatencyHistogram()
+        for i in range(50):
+            fast.add(0.01)
+            slow.add(1.0)
+        merged = fast.copy()
+        merged.merge(slow)
+        self.assertEqual(100, merged.count)
+        self.assertEqual(50, fast.count)
+        self.assertEqual(fast.percentile(50), merged.percentile(50))
+        self.assertEqual(slow.percentile(99), merged.percentile(99))
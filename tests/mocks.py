@@ -23,6 +23,7 @@ class Response(object):
         super(Response, self).__init__()
         self.status_code = code
         self.text = text
+        self.num_bytes_downloaded = len(text)
         self.is_success = code < 400
         self.headers = MagicMock()
         if url:
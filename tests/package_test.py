@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import pagerduty
+
+
+class PackageTest(unittest.TestCase):
+    def test_lazy_imports(self):
+        """
+        Validate that importing the package doesn't import any client modules
+        """
+        code = (
+            "import sys, pagerduty; "
+            "print(' '.join(sorted(m for m in sys.modules "
+            "if m.startswith('pagerduty') or m == 'httpx2')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            # Import the working copy of the package, as the tests do:
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        self.assertEqual(["pagerduty", "pagerduty.version"], output.split())
+
+    def test_getattr(self):
+        for name in pagerduty.__all__:
+            self.assertTrue(hasattr(pagerduty, name), name)
+        self.assertIs(
+            pagerduty.rest_api_v2_client.RestApiV2Client,
+            pagerduty.RestApiV2Client,
+        )
+        self.assertIn("RestApiV2Client", dir(pagerduty))
+        self.assertRaises(AttributeError, getattr, pagerduty, "NoSuchClient")
+        self.assertRaises(AttributeError, getattr, pagerduty, "no_such_module")
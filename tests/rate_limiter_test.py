@@ -0,0 +1,129 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pagerduty
+from mocks import Client, Response
+
+
+class RateLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = patch.object(
+            pagerduty.rate_limiter.time, "monotonic", new=lambda: self.now
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reserve(self):
+        limiter = pagerduty.RateLimiter(rate=2, burst=3)
+        # The burst allowance can be used immediately:
+        self.assertEqual([0, 0, 0], [limiter.reserve("a") for i in range(3)])
+        # ...after which requests are paced at the given rate:
+        self.assertEqual(0.5, limiter.reserve("a"))
+        self.assertEqual(1.0, limiter.reserve("a"))
+        # Each credential has its own budget:
+        self.assertEqual(0, limiter.reserve("b"))
+        # Tokens accumulate over time (1.5s = 3 tokens, after a deficit of 2):
+        self.now += 1.5
+        self.assertEqual(0, limiter.reserve("a"))
+        self.assertEqual(0.5, limiter.reserve("a"))
+        # ...but never beyond the burst allowance:
+        self.now += 100
+        self.assertEqual([0, 0, 0], [limiter.reserve("a") for i in range(3)])
+        self.assertEqual(0.5, limiter.reserve("a"))
+        self.assertRaises(ValueError, pagerduty.RateLimiter, rate=0)
+        self.assertRaises(ValueError, pagerduty.RateLimiter, burst=0.5)
+
+    def test_update(self):
+        limiter = pagerduty.RateLimiter(rate=10, burst=10)
+        # Drain the budget to match the remaining requests reported by the API:
+        response = Response(200, json.dumps({}))
+        response.headers["ratelimit-remaining"] = "1"
+        limiter.update("a", response)
+        self.assertEqual(0, limiter.reserve("a"))
+        self.assertEqual(0.1, limiter.reserve("a"))
+        # Hold all requests until the limit resets:
+        self.now += 1
+        response = Response(429, json.dumps({}))
+        response.headers["retry-after"] = "5"
+        limiter.update("a", response)
+        self.assertEqual(5.0, limiter.reserve("a"))
+        self.assertAlmostEqual(5.1, limiter.reserve("a"))
+        # Another credential's budget is unaffected:
+        self.assertEqual(0, limiter.reserve("b"))
+        # A 429 without headers still prevents sending immediately:
+        self.now += 100
+        limiter.update("b", Response(429, json.dumps({})))
+        self.assertAlmostEqual(0.1, limiter.reserve("b"))
+        # When the budget has been drained, the first request after the hold
+        # isn't delayed any further:
+        self.now += 100
+        response = Response(429, json.dumps({}))
+        response.headers["ratelimit-remaining"] = "0"
+        response.headers["retry-after"] = "5"
+        limiter.update("c", response)
+        self.now += 5
+        self.assertEqual(0, limiter.reserve("c"))
+        self.assertAlmostEqual(0.1, limiter.reserve("c"))
+        # Responses without rate limit headers have no effect:
+        limiter.update("a", Response(200, json.dumps({})))
+        self.assertEqual(0, limiter.reserve("a"))
+
+    def test_update_max_hold(self):
+        limiter = pagerduty.RateLimiter(rate=10, burst=10, max_hold=60)
+        response = Response(429, json.dumps({}))
+        response.headers["retry-after"] = "86400"
+        limiter.update("a", response)
+        self.assertEqual(60.0, limiter.reserve("a"))
+        # The caller can give its own limit:
+        limiter.update("b", response, max_hold=5)
+        self.assertEqual(5.0, limiter.reserve("b"))
+        # Values that aren't finite numbers are ignored, so the hold is the
+        # same as for a 429 without headers:
+        response.headers["retry-after"] = "inf"
+        limiter.update("c", response)
+        self.assertAlmostEqual(0.1, limiter.reserve("c"))
+        self.assertRaises(ValueError, pagerduty.RateLimiter, max_hold=-1)
+
+    def test_client_max_retry_after(self):
+        limiter = pagerduty.RateLimiter()
+        client = pagerduty.RestApiV2Client("token", rate_limiter=limiter)
+        client.max_retry_after = 30
+        throttled = Response(429, json.dumps({}))
+        throttled.headers["retry-after"] = "86400"
+        client.parent = Client()
+        client.parent.request = MagicMock(
+            side_effect=[throttled, Response(200, json.dumps({}))]
+        )
+        with patch.object(pagerduty.api_client.time, "sleep") as sleep:
+            client.get("/users")
+        # Both the cooldown and the rate limiter's hold are capped (the
+        # fake clock doesn't advance during the cooldown):
+        self.assertEqual([30, 30], [c[0][0] for c in sleep.call_args_list])
+
+    def test_shared_between_clients(self):
+        limiter = pagerduty.RateLimiter(rate=1, burst=1)
+        clients = [
+            pagerduty.RestApiV2Client("token", rate_limiter=limiter)
+            for i in range(2)
+        ]
+        other_client = pagerduty.RestApiV2Client(
+            "other-token", rate_limiter=limiter
+        )
+        for client in clients + [other_client]:
+            self.assertIs(limiter, client.rate_limiter)
+            client.parent = Client()
+            client.parent.request = MagicMock(
+                return_value=Response(200, json.dumps({}))
+            )
+        with patch.object(pagerduty.api_client.time, "sleep") as sleep:
+            clients[0].get("/users")
+            sleep.assert_not_called()
+            # Same credential, different client; uses the same budget:
+            clients[1].get("/users")
+            sleep.assert_called_once_with(1.0)
+            sleep.reset_mock()
+            # Different credential:
+            other_client.get("/users")
+            sleep.assert_not_called()
@@ -15,7 +15,7 @@ import httpx2
 import sys
 import unittest
 from datetime import timezone
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import AsyncMock, MagicMock, patch, call
 
 import pagerduty
 import pagerduty.rest_api_v2_base_client
@@ -115,6 +115,61 @@ class RestApiV2UrlHandlingTest(ClientTest):
             # specific); remove when deprecated
             self.assertEqual(pattern, pagerduty.canonical_path(base_url, url))
 
+    def test_canonical_path_trie(self):
+        trie = pagerduty.rest_api_v2_base_client.CanonicalPathTrie(
+            ["/users", "/users/{id}", "/users/me", "/{entity_type}/{id}"]
+        )
+        self.assertEqual(["/users"], trie.match("/users"))
+        self.assertEqual(
+            ["/users/{id}", "/{entity_type}/{id}"], trie.match("/users/P1")
+        )
+        self.assertEqual(
+            ["/users/{id}", "/users/me", "/{entity_type}/{id}"],
+            trie.match("/users/me"),
+        )
+        self.assertEqual([], trie.match("/users/P1/nope"))
+        base_url = "https://api.pagerduty.com"
+        canonical_path = pagerduty.rest_api_v2_base_client.canonical_path
+        # Exact match takes precedence:
+        self.assertEqual(
+            "/users/me", canonical_path(trie, base_url, "/users/me")
+        )
+        # Ambiguous match:
+        self.assertRaisesRegex(
+            Exception,
+            "Ambiguous URL",
+            canonical_path,
+            trie,
+            base_url,
+            "/users/P1",
+        )
+        # No match:
+        self.assertRaises(
+            pagerduty.UrlError, canonical_path, trie, base_url, "/teams/P1/x"
+        )
+        # A list of paths is indexed on each call, so changes to it apply:
+        paths = ["/users", "/users/{id}"]
+        self.assertEqual(
+            "/users/{id}", canonical_path(paths, base_url, "/users/P1")
+        )
+        paths[1] = "/teams/{id}"
+        self.assertEqual(
+            "/teams/{id}", canonical_path(paths, base_url, "/teams/P1")
+        )
+        # The module's own paths are indexed once:
+        index = pagerduty.rest_api_v2_client._canonical_path_trie
+        self.assertIs(index(), index())
+        # The index is constructed once per client class:
+        client0 = new_rest_api_v2_client()
+        client1 = new_rest_api_v2_client()
+        self.assertIs(client0.canonical_path_trie, client1.canonical_path_trie)
+        self.assertIsNot(
+            client0.canonical_path_trie,
+            pagerduty.JiraCloudIntegrationApiClient(
+                "token"
+            ).canonical_path_trie,
+        )
+
     def test_is_path_param(self):
         self.assertTrue(pagerduty.is_path_param("{id}"))
         self.assertFalse(pagerduty.is_path_param("services"))
@@ -152,6 +207,9 @@ class EntityWrappingTest(unittest.TestCase):
             # Disabled
             (("post", "/analytics/raw/incidents"), (None, None)),
         ]
+        table = pagerduty.rest_api_v2_base_client.EntityWrapperTable(
+            ENTITY_WRAPPER_CONFIG
+        )
         for (method, path), rval in io_expected:
             self.assertEqual(
                 rval,
@@ -159,6 +217,34 @@ class EntityWrappingTest(unittest.TestCase):
                     ENTITY_WRAPPER_CONFIG, method, path
                 ),
             )
+            # The precompiled table should give the same results, and continue
+            # to do so once they are memoized:
+            self.assertEqual(rval, table.lookup(method, path))
+            self.assertEqual(rval, table.lookup(method, path))
+        self.assertIs(
+            new_rest_api_v2_client().entity_wrapper_table,
+            new_rest_api_v2_client().entity_wrapper_table,
+        )
+
+    def test_entity_wrapper_table_validation(self):
+        EntityWrapperTable = (
+            pagerduty.rest_api_v2_base_client.EntityWrapperTable
+        )
+        # Invalid values anywhere in the config should be caught up front:
+        for invalid in (1, ("foo",), ("foo", 2)):
+            self.assertRaisesRegex(
+                Exception,
+                "Invalid entity wrapping configuration",
+                EntityWrapperTable,
+                {"GET /foo": "foo", "PUT /bar": invalid},
+            )
+        # Ambiguous patterns:
+        self.assertRaisesRegex(
+            Exception,
+            "matches more than one pattern",
+            EntityWrapperTable,
+            {"GET /foo": "foo", "* /foo": None},
+        )
 
     def test_infer_entity_wrapper(self):
         io_expected = [
@@ -190,6 +276,12 @@ class EntityWrappingTest(unittest.TestCase):
         self.assertEqual(foo_entity, pagerduty.unwrap(r, "foo"))
         # Disabled entity wrapping (wrapper=None), return body as-is
         self.assertEqual({"foo": foo_entity}, pagerduty.unwrap(r, None))
+        # Body already decoded; don't decode it again:
+        r.json.reset_mock()
+        self.assertEqual(
+            foo_entity, pagerduty.unwrap(r, "foo", body={"foo": foo_entity})
+        )
+        r.json.assert_not_called()
 
 
 class FunctionDecoratorsTest(unittest.TestCase):
@@ -586,6 +678,89 @@ class RestApiV2BaseClientTest(ClientTest):
         )
         self.assertEqual(30, len(items))
 
+        # Test that each page's body is only JSON-decoded once:
+        get.reset_mock()
+        responses = [
+            Response(200, page(0, 20, 10)),
+            Response(200, page(1, 20, 10)),
+        ]
+        get.side_effect = responses
+        self.assertEqual(20, len(list(client.iter_all("/users"))))
+        for response in responses:
+            response.json.assert_called_once()
+
+    @patch.object(pagerduty.RestApiV2Client, "get")
+    def test_iter_all_concurrency(self, get):
+        client = new_rest_api_v2_client()
+        client.log = MagicMock()
+        # Pages are selected by the offset parameter, since the order in which
+        # the requests are made is nondeterministic:
+        get.side_effect = lambda url, params=None: Response(
+            200, page(params["offset"] // 10, 50, 10)
+        )
+        hook = MagicMock()
+        items = list(
+            client.iter_all(
+                "/users", page_size=10, item_hook=hook, concurrency=3
+            )
+        )
+        self.assertEqual(list(range(50)), [i["id"] for i in items])
+        self.assertEqual(5, get.call_count)
+        self.assertEqual(
+            [0, 10, 20, 30, 40],
+            sorted(c[2]["params"]["offset"] for c in get.mock_calls),
+        )
+        # The total is required for computing offsets:
+        self.assertEqual("true", get.mock_calls[0][2]["params"]["total"])
+        hook.assert_any_call({"id": 49}, 50, 50)
+
+        # Offsets beyond the iteration limit should not be requested:
+        get.reset_mock()
+        get.side_effect = lambda url, params=None: Response(
+            200, page(params["offset"] // 10, 20000, 10)
+        )
+        with self.assertWarns(UserWarning):
+            items = list(
+                client.iter_all(
+                    "/users",
+                    page_size=10,
+                    params={"offset": 9970},
+                    concurrency=4,
+                )
+            )
+        self.assertEqual(
+            [9970, 9980, 9990],
+            sorted(c[2]["params"]["offset"] for c in get.mock_calls),
+        )
+
+        # Errors in any page should be raised:
+        get.reset_mock()
+        get.side_effect = lambda url, params=None: Response(
+            (200, 400)[params["offset"] == 20],
+            page(params["offset"] // 10, 50, 10),
+        )
+        self.assertRaises(
+            pagerduty.Error,
+            list,
+            client.iter_all("/users", page_size=10, concurrency=2),
+        )
+
+        # An empty first page with more results doesn't stop prefetching; the
+        # requested page size is used to compute the remaining offsets:
+        get.reset_mock()
+        get.side_effect = lambda url, params=None: Response(
+            200,
+            json.dumps({"users": [], "total": 30, "more": True})
+            if params["offset"] == 0
+            else page(params["offset"] // 10, 30, 10),
+        )
+        items = list(client.iter_all("/users", page_size=10, concurrency=2))
+        self.assertEqual(list(range(10, 30)), [i["id"] for i in items])
+        self.assertEqual(
+            [0, 10, 20],
+            sorted(c[2]["params"]["offset"] for c in get.mock_calls),
+        )
+
     @patch.object(pagerduty.RestApiV2Client, "get")
     def test_iter_cursor(self, get):
         client = new_rest_api_v2_client()
@@ -606,9 +781,13 @@ class RestApiV2BaseClientTest(ClientTest):
             Response(200, page_cursor("records", [4, 5, 6], 5)),
             Response(200, page_cursor("records", [7, 8, 9], None)),
         ]
+        responses = list(get.side_effect)
+        get.side_effect = responses
         self.assertEqual(
             list(client.iter_cursor("/audit/records")), list(range(1, 10))
         )
+        for response in responses:
+            response.json.assert_called_once()
         # It should send the next_cursor body parameter from the second to
         # last response as the cursor query parameter in the final request
         self.assertEqual(get.mock_calls[-1][2]["params"]["cursor"], 5)
@@ -641,6 +820,37 @@ class RestApiV2BaseClientTest(ClientTest):
         client.postprocess(response)
         self.assertEqual(1, client.api_call_counts["GET /users/{id}"])
         self.assertEqual(1.5, client.api_time["GET /users/{id}"])
+        # They can be modified and reset as when they were plain dicts:
+        client.api_call_counts["GET /users/{id}"] += 2
+        self.assertEqual(3, client.metrics.total("GET /users/{id}", "calls"))
+        client.api_call_counts = {}
+        self.assertEqual({}, client.api_call_counts)
+        self.assertEqual(
+            {
+                "POST /users/{id}/contact_methods": 1.5,
+                "GET /users/{id}": 1.5,
+            },
+            client.api_time,
+        )
+        client.api_time = {"GET /users/{id}": 0.5}
+        self.assertEqual({"GET /users/{id}": 0.5}, dict(client.api_time))
+        del client.api_time["GET /users/{id}"]
+        self.assertEqual(0, client.total_call_time)
+        client.postprocess(response)
+        # The other statistics are unaffected:
+        stats = client.metrics.snapshot()["GET /users/{id}"]
+        self.assertEqual(2, stats.pop("latency").count)
+        self.assertEqual(
+            {
+                "calls": 1,
+                "time": 1.5,
+                "bytes": 2 * len(response.text),
+                "retries": 0,
+                "statuses": {200: 2},
+            },
+            stats,
+        )
+        self.assertEqual(1, client.total_call_count)
 
         # Test logging
         response = Response(
@@ -660,6 +870,20 @@ class RestApiV2BaseClientTest(ClientTest):
         logger.error.call_args[0][0] % logger.error.call_args[0][1:]
         logger.debug.call_args[0][0] % logger.debug.call_args[0][1:]
 
+    @patch.object(pagerduty.api_client.time, "sleep")
+    @patch.object(httpx2.Client, "request")
+    def test_postprocess_retries(self, request, sleep):
+        client = new_rest_api_v2_client()
+        request.side_effect = [
+            httpx2.ConnectError("connection refused"),
+            Response(429, "{}", url="https://api.pagerduty.com/users/PABC"),
+            Response(200, "{}", url="https://api.pagerduty.com/users/PABC"),
+        ]
+        client.get("/users/PABC")
+        stats = client.metrics.snapshot()["GET /users/{id}"]
+        self.assertEqual(2, stats["retries"])
+        self.assertEqual({429: 1, 200: 1}, stats["statuses"])
+
     def test_updating_auth_params_propagates_to_auth_method(self):
         """Validate that the secret"""
         client = new_rest_api_v2_client(secret="hello-there")
@@ -677,3 +901,94 @@ class RestApiV2BaseClientTest(ClientTest):
             client.auth_method.auth_header["Authorization"],
             "Bearer hello-there",
         )
+
+
+class AsyncRestApiV2BaseClientTest(unittest.IsolatedAsyncioTestCase):
+    @patch.object(
+        pagerduty.AsyncRestApiV2Client, "get", new_callable=AsyncMock
+    )
+    async def test_iter_all(self, get):
+        client = pagerduty.AsyncRestApiV2Client("token")
+        client.log = MagicMock()
+        get.side_effect = [
+            Response(200, page(0, 30, 10)),
+            Response(200, page(1, 30, 10)),
+            Response(200, page(2, 30, 10)),
+        ]
+        hook = MagicMock()
+        items = [
+            item
+            async for item in client.iter_all(
+                "/users", item_hook=hook, total=True, page_size=10
+            )
+        ]
+        self.assertEqual(3, get.call_count)
+        self.assertEqual(list(range(30)), [i["id"] for i in items])
+        self.assertEqual(
+            {"limit": 10, "total": "true", "offset": 20},
+            get.call_args[1]["params"],
+        )
+        hook.assert_any_call({"id": 14}, 15, 30)
+
+        # Test stopping iteration on non-success status
+        get.reset_mock()
+        get.side_effect = [
+            Response(200, page(0, 50, 10)),
+            Response(400, page(1, 50, 10)),
+        ]
+        with self.assertRaises(pagerduty.Error):
+            await client.list_all("/users")
+
+        # Test: singular resource, raise error:
+        with self.assertRaises(pagerduty.UrlError):
+            await client.list_all("users/PABC123")
+
+    @patch.object(
+        pagerduty.AsyncRestApiV2Client, "get", new_callable=AsyncMock
+    )
+    async def test_iter_all_concurrency(self, get):
+        client = pagerduty.AsyncRestApiV2Client("token")
+        client.log = MagicMock()
+        get.side_effect = lambda url, params=None: Response(
+            200, page(params["offset"] // 10, 50, 10)
+        )
+        items = [
+            item
+            async for item in client.iter_all(
+                "/users", page_size=10, concurrency=3
+            )
+        ]
+        self.assertEqual(list(range(50)), [i["id"] for i in items])
+        self.assertEqual(5, get.call_count)
+
+    @patch.object(
+        pagerduty.AsyncRestApiV2Client, "get", new_callable=AsyncMock
+    )
+    async def test_iter_cursor(self, get):
+        client = pagerduty.AsyncRestApiV2Client("token")
+        client.log = MagicMock()
+        get.side_effect = [
+            Response(200, page_cursor("records", [1, 2, 3], 2)),
+            Response(200, page_cursor("records", [4, 5, 6], 5)),
+            Response(200, page_cursor("records", [7, 8, 9], None)),
+        ]
+        # iter_all should short-circuit to iter_cursor:
+        self.assertEqual(
+            list(range(1, 10)), await client.list_all("/audit/records")
+        )
+        self.assertEqual(5, get.mock_calls[-1][2]["params"]["cursor"])
+
+    @patch.object(
+        pagerduty.AsyncRestApiV2Client, "get", new_callable=AsyncMock
+    )
+    async def test_rget(self, get):
+        client = pagerduty.AsyncRestApiV2Client("token")
+        get.return_value = Response(
+            200, json.dumps({"user": {"id": "P123456"}})
+        )
+        self.assertEqual(
+            {"id": "P123456"}, await client.rget("/users/P123456")
+        )
+        get.return_value = Response(404, json.dumps({}))
+        with self.assertRaises(pagerduty.HttpError):
+            await client.rget("/users/P123456")
@@ -2,7 +2,8 @@ import datetime
 import json
 from datetime import timezone
 from typing import Optional
-from unittest.mock import patch
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from common_test import ClientTest
 from mocks import Response
@@ -201,29 +202,30 @@ class RestApiV2ClientTest(ClientTest):
 
     # iter_history tests
     #
-    # Each call to iter_history will result in a "total" request (limit=1, offset=0)
-    # followed by iter_all sub-requests (if done recursing) for each interval, or a
-    # series of recursive calls to iter_history. The test data here don't reflect
+    # Each interval is probed for its total (_iter_history_probe), followed by
+    # iter_all sub-requests (if done recursing) for each interval, or probes of its
+    # sub-intervals. The probe is stubbed here to return only the total, so each
+    # leaf interval is paginated entirely with iter_all. The test data here don't reflect
     # anything realistic, especially because the total number of records changes
     # depending on the level of recursion, but the stubbing/mocking return values are
     # just to test that the logic works.
 
     @patch.object(pagerduty.RestApiV2Client, "iter_all")
-    @patch.object(pagerduty.RestApiV2Client, "get_total")
-    def test_iter_history_recursion_1s(self, get_total, iter_all):
+    @patch.object(pagerduty.RestApiV2Client, "_iter_history_probe")
+    def test_iter_history_recursion_1s(self, probe, iter_all):
         """
         Test iter_history stop-iteration on hitting the minimum interval length
         """
         client = pagerduty.RestApiV2Client("token")
         # Checks for "total" in each sub-interval: the first for the whole 2s, the
         # second for the first 1-second sub-interval and the third for the second.
-        get_total.side_effect = [
+        probe.side_effect = [
             # Top level: total is over the limit; bisect
-            pagerduty.ITERATION_LIMIT + 2,
+            (pagerduty.ITERATION_LIMIT + 2, None),
             # Level 1, sub-interval 1: call iter_all; max total not exceeded
-            1,
+            (1, None),
             # Level 1, sub-interval 2: call iter_all; max total exceeded but interval=1s
-            pagerduty.ITERATION_LIMIT + 1,
+            (pagerduty.ITERATION_LIMIT + 1, None),
         ]
         iter_all.side_effect = [
             iter([{"type": "log_entry"}]),
@@ -237,25 +239,26 @@ class RestApiV2ClientTest(ClientTest):
         self.assertEqual([{"type": "log_entry"}] * 2, results)
 
     @patch.object(pagerduty.RestApiV2Client, "iter_all")
-    @patch.object(pagerduty.RestApiV2Client, "get_total")
-    def test_iter_history_recursion_limit(self, get_total, iter_all):
+    @patch.object(pagerduty.RestApiV2Client, "_iter_history_probe")
+    def test_iter_history_recursion_limit(self, probe, iter_all):
         """
         Test iter_history stop-iteration on hitting the recursion depth limit
         """
         # Adjust the recursion limit so we only need 1 level of stub data:
         client = pagerduty.RestApiV2Client("token")
+        client.history_leaf_size = pagerduty.ITERATION_LIMIT
         original_recursion_limit = pagerduty.rest_api_v2_client.RECURSION_LIMIT
         pagerduty.rest_api_v2_client.RECURSION_LIMIT = 1
         # Checks for "total" in each sub-interval: The expected breakdown of 3s is a 1s
         # interval followed by a 2s interval at the first level of recursion, and then
         # two 1s intervals.
-        get_total.side_effect = [
+        probe.side_effect = [
             # Top level: total is over the limit; bisect
-            pagerduty.ITERATION_LIMIT + 2,
+            (pagerduty.ITERATION_LIMIT + 2, None),
             # Level 1, sub-interval 1: call iter_all; max total not exceeded
-            1,
+            (1, None),
             # Level 1, sub-interval 2: call iter_all; max recursion depth reached
-            pagerduty.ITERATION_LIMIT + 1,
+            (pagerduty.ITERATION_LIMIT + 1, None),
         ]
         iter_all.side_effect = [
             iter([{"type": "log_entry"}]),
@@ -269,11 +272,9 @@ class RestApiV2ClientTest(ClientTest):
         pagerduty.rest_api_v2_client.RECURSION_LIMIT = original_recursion_limit
 
     @patch.object(pagerduty.RestApiV2Client, "iter_all")
-    @patch.object(pagerduty.RestApiV2Client, "get_total")
+    @patch.object(pagerduty.RestApiV2Client, "_iter_history_probe")
     @patch.object(pagerduty.RestApiV2Client, "iter_cursor")
-    def test_iter_history_cursor_callout(
-        self, iter_cursor, get_total, iter_all
-    ):
+    def test_iter_history_cursor_callout(self, iter_cursor, probe, iter_all):
         """
         Validate the method defers to iter_cursor when used with cursor-based pagination
         """
@@ -287,13 +288,197 @@ class RestApiV2ClientTest(ClientTest):
             )
         )
         iter_all.assert_not_called()
-        get_total.assert_not_called()
+        probe.assert_not_called()
         iter_cursor.assert_called_once()
         self.assertEqual("/audit/records", iter_cursor.mock_calls[0][1][0])
         self.assertEqual(
             ["delete"], iter_cursor.mock_calls[0][2]["params"]["actions"]
         )
 
+    @patch.object(pagerduty.RestApiV2Client, "iter_all")
+    @patch.object(pagerduty.RestApiV2Client, "_iter_history_probe")
+    def test_iter_history_split_by_density(self, probe, iter_all):
+        """
+        Test that intervals are divided according to their total in one step
+        """
+        client = pagerduty.RestApiV2Client("token")
+        client.history_leaf_size = pagerduty.ITERATION_LIMIT
+        probe.side_effect = [
+            (total, None)
+            for total in [
+                # Top level: enough records for 4 sub-intervals
+                3 * pagerduty.ITERATION_LIMIT + 1,
+                # Level 1: the third sub-interval still has too many records
+                10,
+                0,
+                pagerduty.ITERATION_LIMIT + 1,
+                20,
+                # Level 2: the third sub-interval, bisected
+                30,
+                40,
+            ]
+        ]
+        iter_all.side_effect = lambda url, params=None: iter([params])
+        start = datetime.datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        def seconds(params):
+            return tuple(
+                int((pagerduty.common.strptime(params[k]) - start).seconds)
+                for k in ("since", "until")
+            )
+
+        results = list(
+            client.iter_history(
+                "/log_entries", start, start + datetime.timedelta(seconds=40)
+            )
+        )
+        self.assertEqual(7, probe.call_count)
+        self.assertEqual(
+            [(0, 10), (20, 25), (25, 30), (30, 40)],
+            [seconds(params) for params in results],
+        )
+
+    @patch.object(pagerduty.RestApiV2Client, "iter_all")
+    @patch.object(pagerduty.RestApiV2Client, "_iter_history_probe")
+    def test_iter_history_split_skewed(self, probe, iter_all):
+        """
+        Test that unevenly distributed records are split in a single level
+        """
+        client = pagerduty.RestApiV2Client("token")
+        start = datetime.datetime(2025, 1, 1, tzinfo=timezone.utc)
+        limit = pagerduty.ITERATION_LIMIT
+        # Half of the records are in the first quarter of the interval, so
+        # bisecting it would leave too many in the first half:
+        totals = {
+            (0, 40): 2 * limit,
+            (0, 10): limit,
+            (10, 20): limit // 2,
+            (20, 30): limit // 2,
+        }
+
+        def seconds(params):
+            return tuple(
+                int((pagerduty.common.strptime(params[k]) - start).seconds)
+                for k in ("since", "until")
+            )
+
+        def probe_interval(url, params, interval, page_size=None):
+            since, until = interval[:2]
+            key = ((since - start).seconds, (until - start).seconds)
+            return totals.get(key, 0), None
+
+        probe.side_effect = probe_interval
+        iter_all.side_effect = lambda url, params=None, **kw: iter([params])
+        results = list(
+            client.iter_history(
+                "/log_entries", start, start + datetime.timedelta(seconds=40)
+            )
+        )
+        # The whole interval, then its four quarters, and nothing deeper:
+        self.assertEqual(5, probe.call_count)
+        self.assertEqual(
+            [(0, 10), (10, 20), (20, 30)],
+            [seconds(params) for params in results],
+        )
+
+    @patch.object(pagerduty.RestApiV2Client, "iter_all")
+    @patch.object(pagerduty.RestApiV2Client, "_iter_history_probe")
+    def test_iter_history_concurrency(self, probe, iter_all):
+        client = pagerduty.RestApiV2Client("token")
+        client.history_leaf_size = pagerduty.ITERATION_LIMIT
+        start = datetime.datetime(2025, 1, 1, tzinfo=timezone.utc)
+        second = datetime.timedelta(seconds=1)
+        # The first half of the 4-second interval must be bisected again, and
+        # the second quarter (or any other interval not listed) is empty:
+        totals = {
+            (0, 4): pagerduty.ITERATION_LIMIT + 1,
+            (0, 2): pagerduty.ITERATION_LIMIT + 1,
+            (0, 1): 3,
+            (2, 4): 5,
+        }
+
+        def seconds(params):
+            return tuple(
+                int((pagerduty.common.strptime(params[k]) - start).seconds)
+                for k in ("since", "until")
+            )
+
+        def probe_interval(url, params, interval, page_size=None):
+            self.assertEqual({"statuses[]": ["resolved"]}, params)
+            self.assertEqual(50, page_size)
+            since, until = interval[:2]
+            key = ((since - start).seconds, (until - start).seconds)
+            return totals.get(key, 0), None
+
+        probe.side_effect = probe_interval
+        iter_all.side_effect = lambda url, params=None, **kw: iter(
+            [{"interval": seconds(params), "filter": params["statuses[]"]}]
+        )
+        results = list(
+            client.iter_history(
+                "/log_entries",
+                start,
+                start + 4 * second,
+                concurrency=3,
+                params={"statuses[]": ["resolved"]},
+                page_size=50,
+            )
+        )
+        self.assertEqual([(0, 1), (2, 4)], [r["interval"] for r in results])
+        self.assertEqual([["resolved"]] * 2, [r["filter"] for r in results])
+        self.assertEqual(5, probe.call_count)
+        for call in iter_all.call_args_list:
+            self.assertEqual(50, call[1]["page_size"])
+
+    @patch.object(pagerduty.RestApiV2Client, "get")
+    def test_iter_history_probe_page(self, get):
+        """
+        Test that the first page received when probing is not requested again
+        """
+        client = pagerduty.RestApiV2Client("token")
+
+        def page(offset, limit):
+            return Response(
+                200,
+                json.dumps(
+                    {
+                        "log_entries": [
+                            {"id": i}
+                            for i in range(offset, min(offset + limit, 150))
+                        ],
+                        "more": offset + limit < 150,
+                        "total": 150,
+                        "offset": offset,
+                        "limit": limit,
+                    }
+                ),
+            )
+
+        get.side_effect = lambda url, params=None: page(
+            params["offset"], params["limit"]
+        )
+        hook_calls = []
+        now = datetime.datetime.now(timezone.utc)
+        results = list(
+            client.iter_history(
+                "/log_entries",
+                now,
+                now + datetime.timedelta(seconds=60),
+                item_hook=lambda r, n, total: hook_calls.append((n, total)),
+                total=True,
+            )
+        )
+        self.assertEqual(list(range(150)), [r["id"] for r in results])
+        self.assertEqual(
+            [(0, 100), (100, 100)],
+            [
+                (c[1]["params"]["offset"], c[1]["params"]["limit"])
+                for c in get.call_args_list
+            ],
+        )
+        self.assertEqual("true", get.call_args_list[0][1]["params"]["total"])
+        self.assertEqual([(n, 150) for n in range(1, 151)], hook_calls)
+
     def test_iter_history_invalid_url(self):
         client = pagerduty.RestApiV2Client("token")
         now = datetime.datetime.now(timezone.utc)
@@ -436,6 +621,16 @@ class RestApiV2ClientTest(ClientTest):
         get.return_value = response404
         self.assertRaises(pagerduty.Error, s.rget, "/users/P123ABC")
 
+    def test_rget_total_timeout(self):
+        client = pagerduty.RestApiV2Client("token")
+        parent = MagicMock()
+        parent.request.return_value = Response(200, '{"user":{"id":"P123"}}')
+        with patch.object(client, "parent", new=parent):
+            self.assertEqual(
+                {"id": "P123"}, client.rget("/users/P123", total_timeout=3)
+            )
+        self.assertLessEqual(parent.request.call_args[1]["timeout"], 3)
+
     @patch.object(pagerduty.RestApiV2Client, "rget")
     def test_subdomain(self, rget):
         rget.return_value = [{"html_url": "https://something.pagerduty.com"}]
@@ -458,3 +653,81 @@ class RestApiV2ClientTest(ClientTest):
         # and we should get a new subdomain when next accessed
         rget.return_value = [{"html_url": "https://another-one.pagerduty.com"}]
         self.assertEqual("another-one", client.subdomain)
+
+
+async def aiter_list(items):
+    for item in items:
+        yield item
+
+
+class AsyncRestApiV2ClientTest(unittest.IsolatedAsyncioTestCase):
+    @patch.object(pagerduty.AsyncRestApiV2Client, "iter_all")
+    async def test_find(self, iter_all):
+        client = pagerduty.AsyncRestApiV2Client("token")
+        iter_all.return_value = aiter_list(
+            [{"name": "Sammy Service"}, {"name": "Silly Service"}]
+        )
+        self.assertEqual(
+            {"name": "Silly Service"},
+            await client.find("services", "silly service"),
+        )
+        self.assertEqual(
+            {"query": "silly service"}, iter_all.call_args[1]["params"]
+        )
+
+    @patch.object(pagerduty.AsyncRestApiV2Client, "iter_all")
+    @patch.object(
+        pagerduty.AsyncRestApiV2Client,
+        "_iter_history_probe",
+        new_callable=AsyncMock,
+    )
+    async def test_iter_history_concurrency(self, probe, iter_all):
+        client = pagerduty.AsyncRestApiV2Client("token")
+        probe.side_effect = [
+            (pagerduty.ITERATION_LIMIT + 1, None),
+            # The first sub-interval fits in the page received when probing:
+            (1, (["2025-01-01T00:00:00+0000"], False)),
+            (2, None),
+        ]
+        iter_all.side_effect = lambda url, params=None, **kw: aiter_list(
+            [params["since"]]
+        )
+        start = datetime.datetime(2025, 1, 1, tzinfo=timezone.utc)
+        results = [
+            r
+            async for r in client.iter_history(
+                "/log_entries",
+                start,
+                start + datetime.timedelta(seconds=2),
+                concurrency=2,
+            )
+        ]
+        self.assertEqual(
+            ["2025-01-01T00:00:00+0000", "2025-01-01T00:00:01+0000"], results
+        )
+        iter_all.assert_called_once()
+
+    @patch.object(pagerduty.AsyncRestApiV2Client, "iter_all")
+    @patch.object(
+        pagerduty.AsyncRestApiV2Client,
+        "_iter_history_probe",
+        new_callable=AsyncMock,
+    )
+    async def test_iter_history_recursion_1s(self, probe, iter_all):
+        client = pagerduty.AsyncRestApiV2Client("token")
+        probe.side_effect = [
+            (pagerduty.ITERATION_LIMIT + 2, None),
+            (1, None),
+            (pagerduty.ITERATION_LIMIT + 1, None),
+        ]
+        iter_all.side_effect = [
+            aiter_list([{"type": "log_entry"}]),
+            aiter_list([{"type": "log_entry"}]),
+        ]
+        now = datetime.datetime.now(timezone.utc)
+        future2 = now + datetime.timedelta(seconds=2)
+        results = [
+            r async for r in client.iter_history("/log_entries", now, future2)
+        ]
+        self.assertEqual(2, len(iter_all.mock_calls))
+        self.assertEqual([{"type": "log_entry"}] * 2, results)
@@ -1,4 +1,5 @@
 import json
+import time
 import unittest
 import unittest.mock
 from unittest.mock import patch
@@ -93,6 +94,102 @@ class ScimApiClientTest(unittest.TestCase):
         get.assert_has_calls(expected_calls)
         self.assertEqual(get.call_count, 3)
 
+    @patch.object(ApiClient, "get")
+    def test_iter_users(self, get):
+        client = ScimApiClient(TokenAuthMethod("test-token"))
+        get.side_effect = [
+            Response(
+                200,
+                json.dumps(
+                    {
+                        "totalResults": 3,
+                        "itemsPerPage": 2,
+                        "startIndex": start,
+                        "Resources": [{"id": f"user{i}"} for i in ids],
+                    }
+                ),
+            )
+            for start, ids in ((1, [1, 2]), (3, [3]))
+        ]
+        hook = unittest.mock.MagicMock()
+        users = client.iter_users(page_size=2, item_hook=hook)
+        # Users are yielded as soon as their page is received:
+        self.assertEqual({"id": "user1"}, next(users))
+        self.assertEqual(1, get.call_count)
+        self.assertEqual(["user2", "user3"], [u["id"] for u in users])
+        self.assertEqual(2, get.call_count)
+        self.assertEqual(
+            [
+                unittest.mock.call({"id": f"user{n}"}, n, 3)
+                for n in range(1, 4)
+            ],
+            hook.call_args_list,
+        )
+
+    @patch.object(ApiClient, "get")
+    def test_list_users_max_workers(self, get):
+        client = ScimApiClient(TokenAuthMethod("test-token"))
+
+        def page(path, params=None):
+            # Respond out of order to check that pages are reassembled:
+            start = params["startIndex"]
+            time.sleep(0.01 * (8 - start) / 2)
+            ids = range(start, min(start + 2, 8))
+            return Response(
+                200,
+                json.dumps(
+                    {
+                        "totalResults": 7,
+                        "itemsPerPage": 2,
+                        "startIndex": start,
+                        "Resources": [{"id": f"user{i}"} for i in ids],
+                    }
+                ),
+            )
+
+        get.side_effect = page
+        result = client.list_users(page_size=2, max_workers=3)
+        self.assertEqual(
+            [f"user{i}" for i in range(1, 8)], [u["id"] for u in result]
+        )
+        self.assertEqual(
+            [1, 3, 5, 7],
+            sorted(c.kwargs["params"]["startIndex"] for c in get.mock_calls),
+        )
+
+    @patch.object(ApiClient, "get")
+    def test_list_users_zero_items_per_page(self, get):
+        client = ScimApiClient(TokenAuthMethod("test-token"))
+
+        def page(path, params=None):
+            start = params["startIndex"]
+            ids = range(start, min(start + 2, 6))
+            return Response(
+                200,
+                json.dumps(
+                    {
+                        "totalResults": 5,
+                        "itemsPerPage": 0,
+                        "startIndex": start,
+                        "Resources": [{"id": f"user{i}"} for i in ids],
+                    }
+                ),
+            )
+
+        get.side_effect = page
+        for max_workers in (None, 3):
+            get.reset_mock()
+            result = client.list_users(page_size=2, max_workers=max_workers)
+            self.assertEqual(
+                [f"user{i}" for i in range(1, 6)], [u["id"] for u in result]
+            )
+            self.assertEqual(
+                [1, 3, 5],
+                sorted(
+                    c.kwargs["params"]["startIndex"] for c in get.mock_calls
+                ),
+            )
+
     @patch.object(ApiClient, "get")
     def test_list_users_with_filter(self, get):
         # Test with SCIM filter parameter
@@ -29,3 +29,13 @@ class VersionTest(unittest.TestCase):
             self.assertEqual(
                 *[v.split(".")[0] for v in (ver_unknown, ver_from_fn)]
             )
+
+    def test_version_matches_pyproject(self):
+        """
+        Validate that the version constant was updated along with pyproject.toml
+        """
+        if sys.version_info.major == 3 and sys.version_info.minor > 10:
+            self.assertEqual(
+                pagerduty.version.get_version_via_tomllib(),
+                pagerduty.__version__,
+            )